@@ -1,25 +1,24 @@
-import sys
-import subprocess
+import importlib
 
-# Try importing required packages, install if missing
-try:
-    # Import directly from moviepy instead of moviepy.editor
-    import moviepy
-    from moviepy.video.io.VideoFileClip import VideoFileClip
-    from moviepy.audio.io.AudioFileClip import AudioFileClip
-    # Create an alias for backward compatibility
-    mpy = moviepy
-except ImportError:
-    print("Installing required packages...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install",
-                         "moviepy", "numpy", "scipy", "torch", "librosa"])
-    import moviepy
-    from moviepy.video.io.VideoFileClip import VideoFileClip
-    from moviepy.audio.io.AudioFileClip import AudioFileClip
-    mpy = moviepy
-
-from .audio_pipeline import AudioPipeline
 from .config import Config
 from .logger import setup_logger
 
+# Heavy dependencies (MoviePy, torch via the detectors) are imported on first
+# access so that scripts which never touch them do not pay their import cost
+_LAZY_ATTRIBUTES = {
+    'AudioPipeline': ('.audio_pipeline', 'AudioPipeline'),
+    'mpy': ('moviepy', None),
+    'VideoFileClip': ('moviepy.video.io.VideoFileClip', 'VideoFileClip'),
+    'AudioFileClip': ('moviepy.audio.io.AudioFileClip', 'AudioFileClip'),
+}
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name, attribute = _LAZY_ATTRIBUTES[name]
+    module = importlib.import_module(module_name, __name__)
+    value = getattr(module, attribute) if attribute else module
+    globals()[name] = value
+    return value
+
 __all__ = ['AudioPipeline', 'Config', 'setup_logger', 'mpy', 'VideoFileClip', 'AudioFileClip']
@@ -13,7 +13,11 @@ logger = setup_logger()
 
 def main():
     parser = argparse.ArgumentParser(description="Process audio from video file")
-    parser.add_argument("video_file", help="Path to the video file to process")
+    parser.add_argument("video_files", nargs="+", help="Path to the video file(s) to process")
+    parser.add_argument("--stream", action="store_true",
+                        help="Analyze audio in overlapping chunks instead of loading the whole track into memory")
+    parser.add_argument("--jobs", type=int, default=None,
+                        help="Videos processed in parallel when several are given (default: half the CPU count)")
     args = parser.parse_args()
 
     # Initialize pipeline (detector settings come from .env)
@@ -23,9 +27,20 @@ def main():
     output_dir = Path("audio")
     output_dir.mkdir(exist_ok=True)
 
+    if len(args.video_files) > 1:
+        # Batch mode: one worker process per video
+        reports = pipeline.process_batch(args.video_files, str(output_dir), jobs=args.jobs, stream=args.stream)
+        for video_file, (json_path, md_path) in reports.items():
+            logger.info(f"{video_file}: {json_path}, {md_path}")
+        if len(reports) < len(args.video_files):
+            logger.error(f"{len(args.video_files) - len(reports)} of {len(args.video_files)} videos failed")
+            sys.exit(1)
+        logger.info("Processing completed successfully")
+        return
+
     try:
         # Process video and generate reports
-        json_path, md_path = pipeline.process_and_report(args.video_file, str(output_dir))
+        json_path, md_path = pipeline.process_and_report(args.video_files[0], str(output_dir), stream=args.stream)
         logger.info("Processing completed successfully")
         logger.info(f"JSON analysis: {json_path}")
         logger.info(f"Markdown report: {md_path}")
@@ -1,52 +1,203 @@
+import importlib
 import json
-import argparse
 import numpy as np
 import os
 import sys
-from typing import Optional, Tuple, List, Dict, Any
+from typing import Optional, Tuple, List, Dict, Any, Iterable, Iterator
 from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import cached_property
+from multiprocessing import shared_memory
 
-from moviepy.video.io.VideoFileClip import VideoFileClip
-from moviepy.audio.io.AudioFileClip import AudioFileClip
+import ffmpeg
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON output
+    orjson = None
 
 # Add src directory to Python path for direct script execution
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from src.detectors.silence_detector import SilenceDetector
-from src.detectors.speech_detector import SpeechDetector
-from src.detectors.music_detector import MusicDetector
-from src.detectors.background_detector import BackgroundDetector
-from src.detectors.base_detector import AudioSegment
+from src.detectors.base_detector import BaseDetector, NullDetector, SegmentArray
 from src.config import Config
 from src.logger import setup_logger
 
 logger = setup_logger()
 
+# Detector classes keyed by result label, in report order. Their modules (and
+# torch/librosa with them) are imported only when an enabled detector is created
+DETECTOR_CLASSES = {
+    "silence": "src.detectors.silence_detector.SilenceDetector",
+    "speech": "src.detectors.speech_detector.SpeechDetector",
+    "music": "src.detectors.music_detector.MusicDetector",
+    "background": "src.detectors.background_detector.BackgroundDetector"
+}
+
+# Detectors that compute with torch; threaded runs cap torch's intra-op threads
+# when one of them is created
+TORCH_DETECTORS = ("speech", "music")
+
+def _detect_shared(detector, shm_name: str, shape: Tuple[int, ...], dtype: str,
+                   active_mask: Optional[np.ndarray] = None) -> SegmentArray:
+    """
+    Run a detector on audio held in shared memory. Executed in a worker process.
+
+    Args:
+        detector: Detector instance to run.
+        shm_name (str): Name of the shared memory block holding the audio.
+        shape (Tuple[int, ...]): Shape of the audio array.
+        dtype (str): Dtype of the audio array.
+        active_mask (Optional[np.ndarray]): Per-frame mask of frames to analyze.
+
+    Returns:
+        SegmentArray: Detected segments.
+    """
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        audio_array = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        segments = detector.detect_arrays(audio_array, active_mask)
+        del audio_array  # release the view before closing the block
+        return segments
+    finally:
+        shm.close()
+
+def _process_one(job: Tuple[str, str, bool]) -> Tuple[str, str]:
+    """
+    Process one video of a batch. Executed in a worker process.
+
+    Args:
+        job (Tuple[str, str, bool]): Video path, output directory and stream flag.
+
+    Returns:
+        Tuple[str, str]: Paths to JSON and Markdown reports.
+    """
+    import torch
+
+    video_path, output_dir, stream = job
+    # Videos already run one per worker process; keep each to a single core
+    torch.set_num_threads(1)
+    return AudioPipeline(workers=1).process_and_report(video_path, output_dir, stream=stream)
+
 class AudioPipeline:
     """
     Pipeline for extracting, processing, and reporting on audio from video files.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, workers: int = Config.DETECTOR_WORKERS,
+                 executor: str = Config.DETECTOR_EXECUTOR) -> None:
         """
         Initialize the AudioPipeline with all detectors.
-        """
-        self.silence_detector = SilenceDetector()
-        self.speech_detector = SpeechDetector()
-        self.music_detector = MusicDetector()
-        self.background_detector = BackgroundDetector()
 
-        # Configure detectors from environment variables
-        self.silence_detector.enabled = os.getenv('ENABLE_SILENCE_DETECTOR', 'true').lower() == 'true'
-        self.speech_detector.enabled = os.getenv('ENABLE_SPEECH_DETECTOR', 'true').lower() == 'true'
-        self.music_detector.enabled = os.getenv('ENABLE_MUSIC_DETECTOR', 'true').lower() == 'true'
-        self.background_detector.enabled = os.getenv('ENABLE_BACKGROUND_DETECTOR', 'true').lower() == 'true'
+        Args:
+            workers (int): Number of detectors run concurrently.
+                1 runs them sequentially in the current thread.
+            executor (str): "thread" to run detectors on a thread pool sharing the
+                audio buffer, or "process" to run them in separate processes.
+
+        Raises:
+            ValueError: If executor is not "thread" or "process".
+        """
+        if executor not in ("thread", "process"):
+            raise ValueError(f"Unsupported detector executor: {executor}. Use 'thread' or 'process'")
+        self.workers = workers
+        self.executor = executor
+
+        # Detectors are created on first use; disabled ones never load their models
+        self._enabled = {
+            label: os.getenv(f'ENABLE_{label.upper()}_DETECTOR', 'true').lower() == 'true'
+            for label in DETECTOR_CLASSES
+        }
 
         logger.info("Audio pipeline initialized with detectors configured from environment")
 
+    def _create_detector(self, label: str) -> BaseDetector:
+        """
+        Instantiate the detector for a label, or a NullDetector if it is disabled.
+
+        Args:
+            label (str): Detector label, a key of DETECTOR_CLASSES.
+
+        Returns:
+            BaseDetector: The detector.
+        """
+        if not self._enabled[label]:
+            return NullDetector(label)
+        if label in TORCH_DETECTORS and self.workers > 1 and self.executor == "thread":
+            import torch
+
+            # Detectors already run side by side; avoid oversubscribing cores with torch intra-op threads
+            torch.set_num_threads(1)
+        module_name, class_name = DETECTOR_CLASSES[label].rsplit(".", 1)
+        return getattr(importlib.import_module(module_name), class_name)()
+
+    @cached_property
+    def silence_detector(self) -> BaseDetector:
+        return self._create_detector("silence")
+
+    @cached_property
+    def speech_detector(self) -> BaseDetector:
+        return self._create_detector("speech")
+
+    @cached_property
+    def music_detector(self) -> BaseDetector:
+        return self._create_detector("music")
+
+    @cached_property
+    def background_detector(self) -> BaseDetector:
+        return self._create_detector("background")
+
+    @property
+    def detectors(self) -> Dict[str, BaseDetector]:
+        """All detectors keyed by result label."""
+        return {
+            "silence": self.silence_detector,
+            "speech": self.speech_detector,
+            "music": self.music_detector,
+            "background": self.background_detector
+        }
+
+    @cached_property
+    def _active(self) -> Dict[str, BaseDetector]:
+        """Enabled detectors keyed by result label, resolved once so disabled ones are never dispatched."""
+        return {label: detector for label, detector in self.detectors.items() if detector.enabled}
+
+    @property
+    def _silence_gating(self) -> bool:
+        """Whether the other detectors skip the silence found by the silence detector."""
+        return Config.SILENCE_GATING and "silence" in self._active and len(self._active) > 1
+
+    def _activity_mask(self, silence: SegmentArray, n_samples: int,
+                       offset: float = 0.0) -> Optional[np.ndarray]:
+        """
+        Build the per-frame mask of audio lying outside detected silence.
+
+        A frame is inactive when its center falls inside a silence segment.
+
+        Args:
+            silence (SegmentArray): Silence segments, in stream time.
+            n_samples (int): Number of samples in the analyzed audio.
+            offset (float): Start time of the analyzed audio in seconds.
+
+        Returns:
+            Optional[np.ndarray]: Boolean mask with one entry per detector frame,
+                or None if nothing is silent.
+        """
+        if not len(silence):
+            return None
+        frame_samples = int(Config.SAMPLE_RATE * (Config.FRAME_DURATION_MS / 1000.0))
+        centers = (np.arange(n_samples // frame_samples) + 0.5) * (frame_samples / Config.SAMPLE_RATE)
+        active = ~silence.covers(centers + offset)
+        return None if active.all() else active
+
     def extract_audio(self, video_path: str) -> Tuple[np.ndarray, int]:
         """
-        Extract audio from video file using MoviePy and return audio data and sample rate.
+        Extract audio from video file and return mono int16 audio data and sample rate.
+
+        ffmpeg decodes, downmixes and resamples to Config.SAMPLE_RATE, streaming
+        raw s16le PCM straight into a NumPy buffer. MoviePy (which bundles its own
+        ffmpeg binary) is only used when no ffmpeg executable is on the PATH.
 
         Args:
             video_path (str): Path to the video file.
@@ -59,25 +210,127 @@ class AudioPipeline:
         """
         logger.info(f"Extracting audio from video: {video_path}")
         try:
-            with VideoFileClip(str(video_path)) as video:
-                audio = video.audio
-                if audio is None:
-                    raise ValueError("Video file contains no audio track")
+            try:
+                out, _ = (
+                    ffmpeg
+                    .input(str(video_path))
+                    .output('pipe:', format='s16le', acodec='pcm_s16le', ac=1, vn=None,
+                            ar=Config.SAMPLE_RATE, loglevel='error')
+                    .run(capture_stdout=True, capture_stderr=True)
+                )
+                audio_array = np.frombuffer(out, dtype=np.int16)
+            except FileNotFoundError:
+                logger.warning("ffmpeg executable not found, falling back to MoviePy")
+                audio_array = self._extract_audio_moviepy(video_path)
+
+            if audio_array.size == 0:
+                raise ValueError("Video file contains no audio track")
+
+            logger.info(f"Audio extracted successfully: shape {audio_array.shape}, {Config.SAMPLE_RATE}Hz")
+            return audio_array, Config.SAMPLE_RATE
+
+        except ffmpeg.Error as e:
+            message = e.stderr.decode(errors='replace').strip() if e.stderr else str(e)
+            logger.error(f"Failed to extract audio: {message}")
+            raise RuntimeError(f"Failed to extract audio: {message}")
+        except Exception as e:
+            logger.error(f"Failed to extract audio: {str(e)}")
+            raise RuntimeError(f"Failed to extract audio: {str(e)}")
+
+    def _extract_audio_moviepy(self, video_path: str) -> np.ndarray:
+        """
+        Fallback extraction through MoviePy, returning mono int16 audio at Config.SAMPLE_RATE.
+
+        Args:
+            video_path (str): Path to the video file.
 
-                audio_array = audio.to_soundarray()
+        Returns:
+            np.ndarray: Audio data.
+        """
+        from moviepy.video.io.VideoFileClip import VideoFileClip
 
-                if len(audio_array.shape) > 1 and audio_array.shape[1] > 1:
-                    audio_array = audio_array.mean(axis=1)
+        with VideoFileClip(str(video_path)) as video:
+            audio = video.audio
+            if audio is None:
+                raise ValueError("Video file contains no audio track")
 
-                audio_array = np.clip(audio_array * 32768, -32768, 32767)
-                audio_array = audio_array.astype(np.int16)
+            audio_array = audio.to_soundarray(fps=Config.SAMPLE_RATE).astype(np.float32, copy=False)
 
-                logger.info(f"Audio extracted successfully: shape {audio_array.shape}, {Config.SAMPLE_RATE}Hz")
-                return audio_array, Config.SAMPLE_RATE
+            if len(audio_array.shape) > 1 and audio_array.shape[1] > 1:
+                audio_array = audio_array.mean(axis=1, dtype=np.float32)
 
-        except Exception as e:
-            logger.error(f"Failed to extract audio: {str(e)}")
-            raise RuntimeError(f"Failed to extract audio: {str(e)}")
+            # Scale and clip in place to avoid full-size temporaries
+            np.multiply(audio_array, 32768, out=audio_array)
+            np.clip(audio_array, -32768, 32767, out=audio_array)
+            return audio_array.astype(np.int16, copy=False)
+
+    def iter_chunks(self, video_path: str, chunk_seconds: float = Config.STREAM_CHUNK_SECONDS,
+                    overlap_seconds: float = Config.STREAM_OVERLAP_SECONDS) -> Iterator[Tuple[np.ndarray, float]]:
+        """
+        Stream mono int16 audio from a video file in fixed-size chunks.
+
+        Each chunk is prefixed with the last overlap_seconds of the previous chunk
+        so segments crossing a chunk boundary can be stitched back together.
+        Chunks are read into one preallocated buffer, so memory stays bounded
+        by the chunk size (plus overlap) however long the video is.
+
+        Args:
+            video_path (str): Path to the video file.
+            chunk_seconds (float): Length of new audio per chunk in seconds.
+            overlap_seconds (float): Audio carried over from the previous chunk in seconds.
+
+        Yields:
+            Tuple[np.ndarray, float]: Audio chunk and its start time in seconds. The
+                chunk is a view into the reused buffer and is overwritten by the next
+                one; copy it to keep it.
+
+        Raises:
+            RuntimeError: If ffmpeg fails to decode the file.
+        """
+        chunk_samples = max(1, int(chunk_seconds * Config.SAMPLE_RATE))
+        overlap_samples = max(0, int(overlap_seconds * Config.SAMPLE_RATE))
+
+        process = (
+            ffmpeg
+            .input(str(video_path))
+            .output('pipe:', format='s16le', acodec='pcm_s16le', ac=1, vn=None,
+                    ar=Config.SAMPLE_RATE, loglevel='error')
+            .run_async(pipe_stdout=True, pipe_stderr=True)
+        )
+
+        buffer = np.empty(overlap_samples + chunk_samples, dtype=np.int16)
+        view = memoryview(buffer).cast('B')
+        carried = 0  # overlap samples at the front of the buffer
+        position = 0  # samples read from the pipe so far
+        try:
+            while True:
+                filled, end = carried * 2, (carried + chunk_samples) * 2
+                while filled < end:
+                    count = process.stdout.readinto(view[filled:end])
+                    if not count:
+                        break
+                    filled += count
+                read = filled // 2 - carried
+                if read < 1:
+                    break
+                size = carried + read
+
+                yield buffer[:size], (position - carried) / Config.SAMPLE_RATE
+
+                position += read
+                if overlap_samples:
+                    carried = min(overlap_samples, size)
+                    buffer[:carried] = buffer[size - carried:size]
+        finally:
+            process.stdout.close()
+            stderr = process.stderr.read()
+            process.stderr.close()
+            process.wait()
+
+        if process.returncode != 0:
+            message = stderr.decode(errors='replace').strip()
+            logger.error(f"Failed to stream audio: {message}")
+            raise RuntimeError(f"Failed to stream audio: {message}")
 
     def extract_audio_to_file(self, video_path: str, output_path: str) -> None:
         """
@@ -95,68 +348,168 @@ class AudioPipeline:
             output_path = Path(output_path)
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            with VideoFileClip(str(video_path)) as video:
-                if video.audio is None:
-                    raise ValueError("Video file contains no audio track")
-
-                video.audio.write_audiofile(str(output_path))
+            (
+                ffmpeg
+                .input(str(video_path))
+                .output(str(output_path), vn=None, acodec='libmp3lame', threads=0,
+                        loglevel='error', **{'q:a': 2})
+                .run(overwrite_output=True, capture_stderr=True)
+            )
 
             logger.info(f"Audio extracted and saved successfully to: {output_path}")
 
+        except ffmpeg.Error as e:
+            message = e.stderr.decode(errors='replace').strip() if e.stderr else str(e)
+            logger.error(f"Failed to extract audio to file: {message}")
+            raise RuntimeError(f"Failed to extract audio to file: {message}")
         except Exception as e:
             logger.error(f"Failed to extract audio to file: {str(e)}")
             raise RuntimeError(f"Failed to extract audio to file: {str(e)}")
 
-    def process_audio(self, audio_array: np.ndarray, sample_rate: int) -> Dict[str, List[Dict]]:
+    def process_audio(self, audio_array: np.ndarray, sample_rate: int,
+                      dtype: Any = np.float32) -> Dict[str, List[Dict]]:
         """
         Process audio data through all enabled detectors and return combined results.
 
         Args:
             audio_array (np.ndarray): Audio data.
             sample_rate (int): Sample rate.
+            dtype (Any): Floating point type for detector feature extraction
+                (np.float32 or np.float16).
 
         Returns:
             Dict[str, List[Dict]]: Detection results.
         """
-        logger.info(f"Incoming sample_rate argument: {sample_rate}")
-        logger.info(f"Existing self.sample_rate attribute: {getattr(self, 'sample_rate', 'Not set')}")
-        self.sample_rate = sample_rate
-        logger.info("Starting audio analysis")
+        logger.info("Starting audio analysis (sample rate: %sHz)", sample_rate)
         logger.info("Detector status:")
-        logger.info(f"  - Silence detection: {'enabled' if self.silence_detector.enabled else 'disabled'}")
-        logger.info(f"  - Speech detection: {'enabled' if self.speech_detector.enabled else 'disabled'}")
-        logger.info(f"  - Music detection: {'enabled' if self.music_detector.enabled else 'disabled'}")
-        logger.info(f"  - Background detection: {'enabled' if self.background_detector.enabled else 'disabled'}")
+        for label, detector in self.detectors.items():
+            logger.info("  - %s detection: %s", label.title(), "enabled" if detector.enabled else "disabled")
 
-        import scipy.signal
+        # extract_audio() already has ffmpeg deliver Config.SAMPLE_RATE; this only
+        # runs for audio handed in from elsewhere
         if sample_rate not in (8000, 16000):
-            logger.info(f"Resampling audio from {self.sample_rate}Hz to 16000Hz for VAD compatibility")
-            num_samples = int(audio_array.shape[0] * 16000 / sample_rate)
-            audio_array = audio_array.astype(np.float32) / 32768.0
-            audio_array = librosa.resample(
-                audio_array,
-                orig_sr=sample_rate,
-                target_sr=16000,
-                res_type='kaiser_best',
-                fix=True
-            )
-            audio_array = (audio_array * 32768.0).astype(np.int16)
-            sample_rate = 16000
+            import soxr
 
-        silence_segments = self.silence_detector.detect(audio_array)
-        speech_segments = self.speech_detector.detect(audio_array)
-        music_segments = self.music_detector.detect(audio_array)
-        background_segments = self.background_detector.detect(audio_array)
+            logger.info("Resampling audio from %sHz to 16000Hz for VAD compatibility", sample_rate)
+            audio_array = soxr.resample(audio_array, sample_rate, 16000, quality='HQ')
+            sample_rate = 16000
 
+        for detector in self._active.values():
+            detector.dtype = dtype
+
+        detectors = self._active
+        arrays = {}
+        active_mask = None
+        if self._silence_gating:
+            # Silence runs first so the other detectors skip known-silent frames
+            arrays["silence"] = self.silence_detector.detect_arrays(audio_array)
+            active_mask = self._activity_mask(arrays["silence"], len(audio_array))
+            detectors = {label: detector for label, detector in detectors.items() if label != "silence"}
+
+        if self.workers > 1 and len(detectors) > 1 and self.executor == "process":
+            arrays.update(self._detect_parallel(detectors, audio_array, active_mask))
+        elif self.workers > 1 and len(detectors) > 1:
+            # NumPy, librosa and torch kernels release the GIL, so threads overlap
+            with ThreadPoolExecutor(max_workers=min(self.workers, len(detectors))) as executor:
+                futures = {
+                    label: executor.submit(detector.detect_arrays, audio_array, active_mask)
+                    for label, detector in detectors.items()
+                }
+                arrays.update({label: future.result() for label, future in futures.items()})
+        else:
+            arrays.update({
+                label: detector.detect_arrays(audio_array, active_mask)
+                for label, detector in detectors.items()
+            })
+
+        # Disabled detectors keep an empty entry; consumers index results by label
         results = {
-            "silence": [seg.to_dict() for seg in silence_segments],
-            "speech": [seg.to_dict() for seg in speech_segments],
-            "music": [seg.to_dict() for seg in music_segments],
-            "background": [seg.to_dict() for seg in background_segments]
+            label: arrays[label].to_dict_list() if label in arrays else []
+            for label in self.detectors
         }
 
         return results
 
+    def _detect_parallel(self, detectors: Dict[str, Any], audio_array: np.ndarray,
+                         active_mask: Optional[np.ndarray] = None) -> Dict[str, SegmentArray]:
+        """
+        Run detectors on separate processes over a shared copy of the audio.
+
+        The audio is placed in shared memory once so workers do not receive
+        their own pickled copy of the array.
+
+        Args:
+            detectors (Dict[str, Any]): Detectors to run, keyed by label.
+            audio_array (np.ndarray): Audio data.
+            active_mask (Optional[np.ndarray]): Per-frame mask of frames to analyze.
+
+        Returns:
+            Dict[str, SegmentArray]: Detected segments per label.
+        """
+        audio_array = np.ascontiguousarray(audio_array)
+        shm = shared_memory.SharedMemory(create=True, size=max(1, audio_array.nbytes))
+        try:
+            np.ndarray(audio_array.shape, dtype=audio_array.dtype, buffer=shm.buf)[...] = audio_array
+
+            with ProcessPoolExecutor(max_workers=min(self.workers, len(detectors))) as executor:
+                futures = {
+                    label: executor.submit(_detect_shared, detector, shm.name,
+                                           audio_array.shape, audio_array.dtype.str, active_mask)
+                    for label, detector in detectors.items()
+                }
+                return {label: future.result() for label, future in futures.items()}
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def process_audio_stream(self, chunks: Iterable[Tuple[np.ndarray, float]]) -> Dict[str, List[Dict]]:
+        """
+        Process a stream of audio chunks through all enabled detectors.
+
+        Every chunk is passed to each detector once and dropped afterwards, so
+        peak memory is bounded by the chunk size rather than the video length.
+
+        Args:
+            chunks (Iterable[Tuple[np.ndarray, float]]): (audio chunk, start time) pairs
+                at Config.SAMPLE_RATE, e.g. from iter_chunks().
+
+        Returns:
+            Dict[str, List[Dict]]: Detection results.
+        """
+        segments = {label: [] for label in self.detectors}
+
+        logger.info("Starting streaming audio analysis")
+        covered = None  # stream time reached by the previous chunk
+        with ExitStack() as stack:
+            # Short segments are kept per chunk; min_duration applies once they are stitched
+            for detector in self._active.values():
+                stack.enter_context(detector.stitching())
+
+            for chunk, offset in chunks:
+                active_mask = None
+                if self._silence_gating:
+                    silence = self.silence_detector.detect_chunk(chunk, offset)
+                    # Only silence long enough to be reported gates the other detectors
+                    min_duration = self.silence_detector.min_duration
+                    active_mask = self._activity_mask(
+                        SegmentArray.from_segments("silence", [
+                            seg for seg in silence if seg.duration() >= min_duration
+                        ]), len(chunk), offset
+                    )
+                    if covered is not None:
+                        silence = self.silence_detector.clip_segments(silence, covered)
+                    segments["silence"].extend(silence)
+                for label, detector in self._active.items():
+                    if label == "silence" and self._silence_gating:
+                        continue
+                    segments[label].extend(detector.detect_chunk(chunk, offset, active_mask, start=covered))
+                covered = offset + len(chunk) / Config.SAMPLE_RATE
+
+        return {
+            label: [seg.to_dict() for seg in detector.stitch(segments[label])]
+            for label, detector in self.detectors.items()
+        }
+
     def generate_report(self, results: Dict[str, List[Dict]], output_path: str) -> None:
         """
         Generate a detailed Markdown report of the audio analysis.
@@ -168,46 +521,45 @@ class AudioPipeline:
         logger.info(f"Generating report at: {output_path}")
 
         def format_time(seconds: float) -> str:
-            minutes = int(seconds // 60)
-            seconds = int(seconds % 60)
+            minutes, seconds = divmod(int(seconds), 60)
             return f"{minutes:02d}:{seconds:02d}"
 
-        with open(output_path, "w") as f:
-            f.write("# Audio Analysis Report\n\n")
-
-            for label, segments in results.items():
-                f.write(f"## {label.title()} Segments\n\n")
-                if not segments:
-                    f.write("No segments detected.\n\n")
-                    continue
-
-                f.write("| Start | End | Duration | Confidence |\n")
-                f.write("|-------|-----|----------|------------|\n")
-
-                total_duration = 0
-                for segment in segments:
-                    start = format_time(segment["start_time"])
-                    end = format_time(segment["end_time"])
-                    duration = segment["duration"]
-                    confidence = f"{segment['confidence']:.2f}"
-
-                    f.write(f"| {start} | {end} | {duration:.2f}s | {confidence} |\n")
-                    total_duration += duration
+        # Build the whole report in memory and write it with a single call
+        lines = ["# Audio Analysis Report\n\n"]
+        totals = {}
+
+        for label, segments in results.items():
+            lines.append(f"## {label.title()} Segments\n\n")
+            totals[label] = sum(seg["duration"] for seg in segments)
+            if not segments:
+                lines.append("No segments detected.\n\n")
+                continue
+
+            lines.append("| Start | End | Duration | Confidence |\n")
+            lines.append("|-------|-----|----------|------------|\n")
+            lines.extend(
+                f"| {format_time(segment['start_time'])} | {format_time(segment['end_time'])} "
+                f"| {segment['duration']:.2f}s | {segment['confidence']:.2f} |\n"
+                for segment in segments
+            )
+            lines.append(f"\nTotal {label} duration: {totals[label]:.2f} seconds\n\n")
 
-                f.write(f"\nTotal {label} duration: {total_duration:.2f} seconds\n\n")
+        lines.append("\n## Summary\n\n")
+        lines.extend(f"- Total {label} time: {total:.2f} seconds\n" for label, total in totals.items())
 
-            f.write("\n## Summary\n\n")
-            for label, segments in results.items():
-                total_duration = sum(seg["duration"] for seg in segments)
-                f.write(f"- Total {label} time: {total_duration:.2f} seconds\n")
+        with open(output_path, "w") as f:
+            f.write("".join(lines))
 
-    def process_and_report(self, video_path: str, output_dir: str = "reports") -> Tuple[str, str]:
+    def process_and_report(self, video_path: str, output_dir: str = "reports",
+                           stream: bool = False) -> Tuple[str, str]:
         """
         Process video file, extract audio, analyze it, and generate reports.
 
         Args:
             video_path (str): Path to the video file.
             output_dir (str): Directory to save reports.
+            stream (bool): Analyze the audio in overlapping chunks instead of
+                decoding the whole track into memory first.
 
         Returns:
             Tuple[str, str]: Paths to JSON and Markdown reports.
@@ -235,16 +587,24 @@ class AudioPipeline:
             logger.info(f"Processing video: {video_path}")
             print(f"\n--- Starting processing of {base_name} ---")
 
-            print("Step 1/3: Extracting audio...")
-            audio_data, sample_rate = self.extract_audio(video_path)
+            if stream:
+                print("Step 1-2/3: Streaming and analyzing audio...")
+                results = self.process_audio_stream(self.iter_chunks(video_path))
+            else:
+                print("Step 1/3: Extracting audio...")
+                audio_data, sample_rate = self.extract_audio(video_path)
 
-            print("Step 2/3: Analyzing audio for voice segments...")
-            results = self.process_audio(audio_data, sample_rate)
+                print("Step 2/3: Analyzing audio for voice segments...")
+                results = self.process_audio(audio_data, sample_rate)
 
             print("Step 3/3: Generating reports...")
             json_path = output_dir / f"{base_name}_analysis.json"
-            with open(json_path, "w") as f:
-                json.dump(results, f, indent=2)
+            if orjson is not None:
+                with open(json_path, "wb") as f:
+                    f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+            else:
+                with open(json_path, "w") as f:
+                    json.dump(results, f, indent=2)
             logger.info(f"JSON analysis saved to: {json_path}")
 
             md_path = output_dir / f"{base_name}_report.md"
@@ -259,3 +619,39 @@ class AudioPipeline:
         except Exception as e:
             logger.error(f"Processing failed: {str(e)}")
             raise
+
+    def process_batch(self, video_paths: List[str], output_dir: str = "reports",
+                      jobs: Optional[int] = None, stream: bool = False) -> Dict[str, Tuple[str, str]]:
+        """
+        Process several videos in parallel, one worker process per video.
+
+        Each worker decodes its video and runs its own detector stack with a
+        single thread, so the batch scales with the number of cores.
+
+        Args:
+            video_paths (List[str]): Paths to the video files.
+            output_dir (str): Directory to save reports.
+            jobs (Optional[int]): Number of worker processes. Defaults to half the CPU count.
+            stream (bool): Analyze each video's audio in overlapping chunks.
+
+        Returns:
+            Dict[str, Tuple[str, str]]: JSON and Markdown report paths per video
+                that was processed successfully. Failures are logged.
+        """
+        if not video_paths:
+            return {}
+        jobs = jobs or max(1, (os.cpu_count() or 2) // 2)
+
+        reports = {}
+        with ProcessPoolExecutor(max_workers=min(jobs, len(video_paths))) as executor:
+            futures = {
+                path: executor.submit(_process_one, (str(path), str(output_dir), stream))
+                for path in video_paths
+            }
+            for path, future in futures.items():
+                try:
+                    reports[path] = future.result()
+                except Exception as e:
+                    logger.error("Processing failed for %s: %s", path, e)
+
+        return reports
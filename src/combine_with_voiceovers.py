@@ -1,67 +1,140 @@
 import os
 import json
 import argparse
+import tempfile
+import multiprocessing
 from pathlib import Path
-from pydub import AudioSegment
+import ffmpeg
+
+# Silence inserted between segments, in seconds
+SILENCE_DURATION = 0.5
+
+def probe_audio(audio_file):
+    """Return (sample_rate, channels, channel_layout) of the first audio stream in a file"""
+    info = ffmpeg.probe(str(audio_file), select_streams='a:0')
+    stream = info['streams'][0]
+    channels = int(stream['channels'])
+    # Not every file records a layout; a bare channel count is accepted in its place
+    channel_layout = stream.get('channel_layout') or f"{channels}c"
+    return int(stream['sample_rate']), channels, channel_layout
+
+def render_silence(output_file, sample_rate, channels, channel_layout, duration=SILENCE_DURATION):
+    """Render a short silent MP3 matching the segments' sample rate and channel layout"""
+    stream = ffmpeg.input(f"anullsrc=r={sample_rate}:cl={channel_layout}", f='lavfi', t=duration)
+    stream = ffmpeg.output(stream, str(output_file), acodec='libmp3lame', ac=channels, loglevel='error')
+    ffmpeg.run(stream, overwrite_output=True)
+
+def render_segment(task):
+    """
+    Re-encode a segment, optionally with fades at both ends. A voiceover, if given, is
+    overlaid at the start of the segment, ducking the segment by ~6 dB while it plays.
+    Runs as a multiprocessing worker.
+    """
+    segment_file, voiceover_file, output_file, fade, sample_rate, channels, channel_layout = task
+    stream = ffmpeg.input(str(segment_file))
+
+    if voiceover_file is not None:
+        voiceover_length = float(ffmpeg.probe(str(voiceover_file))['format']['duration'])
+        stream = stream.filter('volume', 0.5, enable=f"lt(t,{voiceover_length})")
+        voiceover = ffmpeg.input(str(voiceover_file))
+        stream = ffmpeg.filter([stream, voiceover], 'amix', inputs=2, duration='first', normalize=0)
+
+    if fade > 0:
+        segment_length = float(ffmpeg.probe(str(segment_file))['format']['duration'])
+        # Fades on a short segment would overlap; split it between the two ends instead
+        fade = min(fade, segment_length / 2)
+        stream = stream.filter('afade', t='in', d=fade)
+        stream = stream.filter('afade', t='out', st=segment_length - fade, d=fade)
+
+    # Keep the source's layout so every file in the playlist can be stream-copied
+    stream = stream.filter('aformat', channel_layouts=channel_layout)
+    stream = ffmpeg.output(stream, str(output_file), acodec='libmp3lame',
+                           ar=sample_rate, ac=channels, threads=1, loglevel='error')
+    ffmpeg.run(stream, overwrite_output=True)
+    return str(output_file)
+
+def write_concat_list(files, list_file):
+    """Write an ffmpeg concat demuxer list referencing the given files"""
+    with open(list_file, "w") as f:
+        for path in files:
+            escaped = str(Path(path).resolve()).replace("'", "'\\''")
+            f.write(f"file '{escaped}'\n")
 
 def main():
     parser = argparse.ArgumentParser(description="Combine movie segments with voiceovers")
     parser.add_argument("segments_dir", help="Directory containing movie segments")
     parser.add_argument("voiceovers_dir", help="Directory containing voiceovers")
     parser.add_argument("--output", default="final_audio.mp3", help="Output file path")
-    parser.add_argument("--fade", type=float, default=0.5, help="Fade duration in seconds")
+    parser.add_argument("--fade", type=float, default=0.0,
+                        help="Fade-in and fade-out duration for each segment in seconds (default: no fades)")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count(),
+                        help="Number of parallel ffmpeg processes for mixing and fading segments")
     args = parser.parse_args()
-    
+
     segments_dir = Path(args.segments_dir)
     voiceovers_dir = Path(args.voiceovers_dir)
-    
+
     # Load segments metadata
     with open(segments_dir / "segments.json", "r") as f:
         segments_data = json.load(f)
-    
-    # Initialize final audio
-    final_audio = AudioSegment.empty()
-    
-    # Process each segment
-    for i, segment_data in enumerate(segments_data):
-        segment_num = i + 1
-        segment_file = segments_dir / f"segment_{segment_num:03d}.mp3"
-        voiceover_file = voiceovers_dir / f"voiceover_{segment_num}.mp3"
-        
-        if not segment_file.exists():
-            print(f"Warning: Segment file {segment_file} not found, skipping")
-            continue
-            
-        # Load segment audio
-        print(f"Processing segment {segment_num}...")
-        segment_audio = AudioSegment.from_file(str(segment_file))
-        
-        # Add voiceover if available
-        if voiceover_file.exists():
-            voiceover = AudioSegment.from_file(str(voiceover_file))
-            
-            # Option 1: Add voiceover before segment
-            # final_audio += voiceover
-            # final_audio += segment_audio
-            
-            # Option 2: Overlay voiceover at the beginning of segment (with ducking)
-            segment_with_voiceover = segment_audio.overlay(
-                voiceover, 
-                position=0,
-                gain_during_overlay=-6  # Reduce segment volume during voiceover
-            )
-            final_audio += segment_with_voiceover
-        else:
-            print(f"Warning: No voiceover found for segment {segment_num}")
-            final_audio += segment_audio
-        
-        # Add a short silence between segments
-        final_audio += AudioSegment.silent(duration=500)  # 500ms silence
-    
-    # Export final audio
-    print(f"Exporting final audio to {args.output}...")
-    final_audio.export(args.output, format="mp3")
+
+    with tempfile.TemporaryDirectory(prefix="combine_") as work_dir:
+        work_dir = Path(work_dir)
+
+        # Collect the playlist; mixed or faded segments are rendered to intermediates first
+        playlist = []
+        render_tasks = []
+        audio_format = None
+        for i, segment_data in enumerate(segments_data):
+            segment_num = i + 1
+            segment_file = segments_dir / f"segment_{segment_num:03d}.mp3"
+            voiceover_file = voiceovers_dir / f"voiceover_{segment_num}.mp3"
+
+            if not segment_file.exists():
+                print(f"Warning: Segment file {segment_file} not found, skipping")
+                continue
+
+            if audio_format is None:
+                audio_format = probe_audio(segment_file)
+
+            print(f"Processing segment {segment_num}...")
+            if not voiceover_file.exists():
+                print(f"Warning: No voiceover found for segment {segment_num}")
+                voiceover_file = None
+
+            # Without a voiceover or fades the segment is stream-copied as it is
+            if voiceover_file is not None or args.fade > 0:
+                # Overlay voiceover at the beginning of segment (with ducking) and fade its ends
+                rendered_file = work_dir / f"segment_{segment_num:03d}_mixed.mp3"
+                render_tasks.append((segment_file, voiceover_file, rendered_file, args.fade) + audio_format)
+                playlist.append(rendered_file)
+            else:
+                playlist.append(segment_file)
+
+        if not playlist:
+            print("Error: No segment files found")
+            return
+
+        if render_tasks:
+            with multiprocessing.Pool(max(1, args.jobs)) as pool:
+                pool.map(render_segment, render_tasks)
+
+        # A single silence clip is reused between every segment
+        silence_file = work_dir / "silence_500ms.mp3"
+        render_silence(silence_file, *audio_format)
+
+        list_file = work_dir / "concat_list.txt"
+        write_concat_list(
+            [path for segment in playlist for path in (segment, silence_file)],
+            list_file
+        )
+
+        # Export final audio
+        print(f"Exporting final audio to {args.output}...")
+        stream = ffmpeg.input(str(list_file), f='concat', safe=0)
+        stream = ffmpeg.output(stream, args.output, c='copy', loglevel='error')
+        ffmpeg.run(stream, overwrite_output=True)
     print("Done!")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -19,10 +19,18 @@ class Config:
     # Speech detection settings
     SPEECH_THRESHOLD = float(os.getenv("SPEECH_THRESHOLD", "0.5"))
     MIN_SPEECH_DURATION = float(os.getenv("MIN_SPEECH_DURATION", "0.3"))
+    # Run Silero VAD through onnxruntime instead of TorchScript (requires onnxruntime)
+    SPEECH_VAD_ONNX = os.getenv("SPEECH_VAD_ONNX", "false").lower() == "true"
+    # Run the TorchScript VAD on CUDA in bfloat16 when a GPU is available
+    SPEECH_VAD_CUDA = os.getenv("SPEECH_VAD_CUDA", "false").lower() == "true"
+    # Directory where VAD results are cached by audio content hash (empty = no caching)
+    SPEECH_VAD_CACHE_DIR = os.getenv("SPEECH_VAD_CACHE_DIR", "")
     
     # Music detection settings
     MUSIC_THRESHOLD = float(os.getenv("MUSIC_THRESHOLD", "0.6"))
     MIN_MUSIC_DURATION = float(os.getenv("MIN_MUSIC_DURATION", "1.0"))
+    # Compute the music detector's spectrogram on CUDA when a GPU is available
+    MUSIC_STFT_CUDA = os.getenv("MUSIC_STFT_CUDA", "false").lower() == "true"
     
     # Background sound detection settings
     BACKGROUND_THRESHOLD = float(os.getenv("BACKGROUND_THRESHOLD", "0.4"))
@@ -31,6 +39,17 @@ class Config:
     # Segment merging settings
     GAP_MERGE_THRESHOLD = float(os.getenv("GAP_MERGE_THRESHOLD", "0.5"))
 
+    # Run silence detection first and skip the other detectors on detected silence
+    SILENCE_GATING = os.getenv("SILENCE_GATING", "true").lower() == "true"
+
+    # Number of detectors run concurrently (1 = sequential) and how: "thread" or "process"
+    DETECTOR_WORKERS = int(os.getenv("DETECTOR_WORKERS", "4"))
+    DETECTOR_EXECUTOR = os.getenv("DETECTOR_EXECUTOR", "thread").lower()
+
+    # Streaming analysis settings (chunk length and overlap carried between chunks)
+    STREAM_CHUNK_SECONDS = float(os.getenv("STREAM_CHUNK_SECONDS", "30"))
+    STREAM_OVERLAP_SECONDS = float(os.getenv("STREAM_OVERLAP_SECONDS", "1"))
+
 if __name__ == "__main__":
     # Test config loading
     print("\nAudio Processing Settings:")
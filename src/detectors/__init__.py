@@ -1,14 +1,30 @@
-from .base_detector import AudioSegment, BaseDetector
-from .silence_detector import SilenceDetector
-from .speech_detector import SpeechDetector
-from .music_detector import MusicDetector
-from .background_detector import BackgroundDetector
+import importlib
+
+from .base_detector import AudioSegment, BaseDetector, NullDetector, SegmentArray
+
+# Concrete detectors pull in torch and librosa, so they are imported on first
+# access; the pipeline only loads the ones that are enabled
+_LAZY_ATTRIBUTES = {
+    'SilenceDetector': '.silence_detector',
+    'SpeechDetector': '.speech_detector',
+    'MusicDetector': '.music_detector',
+    'BackgroundDetector': '.background_detector',
+}
+
+def __getattr__(name):
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
 
 __all__ = [
     'AudioSegment',
     'BaseDetector',
+    'NullDetector',
+    'SegmentArray',
     'SilenceDetector',
     'SpeechDetector',
     'MusicDetector',
     'BackgroundDetector'
-]
\ No newline at end of file
+]
@@ -1,57 +1,85 @@
 import numpy as np
 import librosa
-from typing import List
+from typing import List, Union
 import torch
 
 from .base_detector import BaseDetector, AudioSegment
 from ..config import Config
 
 class BackgroundDetector(BaseDetector):
+    label = "background"
+    accepts_active_mask = True
+
     def __init__(self):
         super().__init__()
         self.threshold = Config.BACKGROUND_THRESHOLD
         self.min_duration = self.get_min_duration(Config.MIN_BACKGROUND_DURATION)
+        # STFT window built once rather than on every librosa.stft call
+        self._window = librosa.filters.get_window("hann", 480, fftbins=True)
 
-    def _calculate_background_features(self, audio_tensor: torch.Tensor) -> float:
+    def _calculate_frame_confidences(self, y: np.ndarray, n_frames: int, scale: float = 1.0) -> np.ndarray:
         """
-        Calculate features that characterize background sounds.
+        Calculate background confidence for consecutive frames of a signal.
+
+        A single STFT is computed over the whole signal and its columns are
+        pooled per frame, instead of running librosa once per frame.
         Features used:
         - Spectral flatness (background noise tends to be more flat)
         - Spectral bandwidth (background often has wider frequency distribution)
         - Temporal stability (background tends to be more stable over time)
+
+        Args:
+            y: Audio samples
+            n_frames: Number of frames the signal is split into
+            scale: Full-scale amplitude of y (32767 for raw int16 values). Flatness
+                and bandwidth are scale-invariant, only RMS is rescaled
+
+        Returns:
+            Array of n_frames confidence scores
         """
-        # Convert torch tensor to numpy array
-        y = audio_tensor.numpy()
-        
-        # Calculate spectral flatness
-        S = np.abs(librosa.stft(y, n_fft=480, hop_length=240))
-        flatness = np.mean(librosa.feature.spectral_flatness(S=S))
-        
-        # Calculate spectral bandwidth
-        bandwidth = np.mean(librosa.feature.spectral_bandwidth(y=y, sr=self.sample_rate))
-        normalized_bandwidth = min(1.0, bandwidth / (self.sample_rate / 4))
-        
-        # Calculate temporal stability using RMS energy variance
-        rms = librosa.feature.rms(y=y)[0]
-        temporal_stability = 1.0 - min(1.0, np.std(rms) * 10)
-        
-        # Combine features
-        features = np.array([
-            flatness,  # Already normalized between 0 and 1
-            normalized_bandwidth,
-            temporal_stability
-        ])
-        
-        # Weight the features (giving more importance to temporal stability)
-        weights = np.array([0.3, 0.3, 0.4])
-        return float(np.average(features, weights=weights))
+        S = np.abs(librosa.stft(y, n_fft=480, hop_length=240, window=self._window))
+        flatness = np.atleast_2d(librosa.feature.spectral_flatness(S=S))[0]
+        bandwidth = np.atleast_2d(librosa.feature.spectral_bandwidth(S=S, sr=self.sample_rate))[0]
+        rms = np.atleast_2d(librosa.feature.rms(S=S, frame_length=480))[0] / scale
 
-    def _detect(self, audio_bytes: bytes) -> List[AudioSegment]:
+        def pool(values: np.ndarray):
+            # Frame k starts at STFT column k * frame_len / hop; a frame owns the
+            # columns up to the next frame's first column (the last frame keeps the tail)
+            frame_len = len(y) // n_frames
+            first = np.minimum(np.arange(n_frames) * frame_len // 240, len(values) - 1)
+            counts = np.maximum(np.diff(np.append(first, len(values))), 1)
+            mean = np.add.reduceat(values, first) / counts
+            mean_sq = np.add.reduceat(values * values, first) / counts
+            return mean, np.sqrt(np.maximum(mean_sq - mean * mean, 0))
+
+        flatness, _ = pool(flatness)
+        bandwidth, _ = pool(bandwidth)
+        _, rms_std = pool(rms)
+
+        normalized_bandwidth = np.minimum(1.0, bandwidth / (self.sample_rate / 4))
+        # Temporal stability from RMS energy variance
+        temporal_stability = 1.0 - np.minimum(1.0, rms_std * 10)
+
+        # Weight the features (giving more importance to temporal stability);
+        # flatness is already normalized between 0 and 1
+        return 0.3 * flatness + 0.3 * normalized_bandwidth + 0.4 * temporal_stability
+
+    def _calculate_background_features(self, audio: Union[np.ndarray, torch.Tensor]) -> float:
+        """
+        Calculate the background confidence score of a single frame.
+        """
+        # librosa works on numpy arrays; tensors are accepted for convenience
+        y = audio.numpy() if isinstance(audio, torch.Tensor) else audio
+        return float(self._calculate_frame_confidences(y, 1)[0])
+
+    def _detect(self, audio_bytes: bytes, active_mask: np.ndarray = None) -> List[AudioSegment]:
         """
         Detect background sound segments in audio data.
         
         Args:
             audio_bytes: Raw audio data as bytes
+            active_mask: Optional boolean mask with one entry per frame; inactive
+                frames score 0 and are left out of the STFT
             
         Returns:
             List of AudioSegment objects representing background sounds
@@ -63,41 +91,29 @@ class BackgroundDetector(BaseDetector):
             raise ValueError("Empty audio data provided")
             
         try:
-            audio_tensor = self._bytes_to_tensor(audio_bytes)
+            # Raw int16 values; normalizing them would only rescale the RMS term
+            samples = np.frombuffer(audio_bytes, dtype=np.int16).astype(self.dtype)
         except Exception as e:
             raise ValueError(f"Invalid audio data format: {str(e)}")
             
-        segments = []
-        current_segment = None
+        frame_len = self._frame_samples
+        n_frames = len(samples) // frame_len
+        if n_frames == 0:
+            return []
+        if active_mask is None:
+            confidences = self._calculate_frame_confidences(samples[:n_frames * frame_len], n_frames, 32767.0)
+        else:
+            # Only runs of active frames are analyzed, each with its own batched STFT
+            confidences = np.zeros(n_frames)
+            starts, ends = self._runs(np.asarray(active_mask[:n_frames], dtype=bool))
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                confidences[start:end] = self._calculate_frame_confidences(
+                    samples[start * frame_len:end * frame_len], end - start, 32767.0
+                )
 
-        for frame, start_time in self.frame_generator(audio_bytes):
-            frame_tensor = self._bytes_to_tensor(frame)
-            confidence = self._calculate_background_features(frame_tensor)
-            
-            is_background = confidence > self.threshold
-            
-            if is_background:
-                if current_segment is None:
-                    current_segment = AudioSegment(
-                        start_time=start_time,
-                        end_time=start_time + self.frame_duration_ms/1000,
-                        label="background",
-                        confidence=confidence
-                    )
-                else:
-                    current_segment.end_time = start_time + self.frame_duration_ms/1000
-                    # Update confidence as rolling average
-                    current_segment.confidence = (
-                        current_segment.confidence + confidence
-                    ) / 2
-            elif current_segment is not None:
-                if current_segment.duration() >= self.min_duration:
-                    segments.append(current_segment)
-                current_segment = None
-
-        # Handle last segment
-        if current_segment is not None and current_segment.duration() >= self.min_duration:
-            segments.append(current_segment)
+        segments = self._segments_from_confidences(
+            confidences, self.label, self.threshold, self._min_kept_duration
+        )
 
         # Merge adjacent background segments
         merged_segments = self.merge_adjacent_segments(
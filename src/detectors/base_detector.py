@@ -1,11 +1,23 @@
 from abc import ABC, abstractmethod
+import contextlib
+import logging
 import numpy as np
-import torch
-from typing import List, Tuple, Union
+from typing import TYPE_CHECKING, Iterable, List, Tuple, Union
 from ..config import Config
 from ..logger import logger
 
+if TYPE_CHECKING:
+    import torch
+
+try:
+    from numba import njit
+except ImportError:  # optional: merging then runs as plain Python
+    njit = None
+
 class AudioSegment:
+    # Detectors can emit many segments; slots avoid a per-instance __dict__
+    __slots__ = ("start_time", "end_time", "label", "confidence")
+
     def __init__(self, start_time: float, end_time: float, label: str, confidence: float = 1.0):
         self.start_time = start_time
         self.end_time = end_time
@@ -24,12 +36,174 @@ class AudioSegment:
             "duration": self.duration()
         }
 
+def _round3(value: float) -> float:
+    """Round to 3 decimals exactly like Python's round(value, 3).
+
+    round() rounds the exact binary value; value * 1000 alone can round a
+    near-tie the wrong way, so the product's rounding error is recovered
+    (Dekker's error-free multiplication) and taken into account.
+    """
+    product = value * 1000.0
+    split = value * 134217729.0  # 2**27 + 1
+    high = split - (split - value)
+    low = value - high
+    error = (high * 1000.0 - product) + low * 1000.0
+
+    rounded = np.floor(product)
+    # Sign of (exact fraction - 0.5); exact for fractions near the tie
+    offset = ((product - rounded) - 0.5) + error
+    if offset > 0 or (offset == 0 and rounded % 2 == 1):
+        rounded += 1.0
+    return rounded / 1000.0
+
+def _merge_sorted(starts: np.ndarray, ends: np.ndarray, confidences: np.ndarray,
+                  gap_threshold: float):
+    """Greedy merge of start-sorted segments with duration-weighted confidence.
+
+    Returns:
+        Tuple of (index of each group's first segment, group end times,
+        group confidences, group sizes)
+    """
+    n = starts.shape[0]
+    first = np.empty(n, dtype=np.int64)
+    out_ends = np.empty(n, dtype=np.float64)
+    out_confidences = np.empty(n, dtype=np.float64)
+    sizes = np.empty(n, dtype=np.int64)
+
+    count = 0
+    first[0] = 0
+    current_start = starts[0]
+    current_end = ends[0]
+    current_confidence = confidences[0]
+    size = 1
+    for i in range(1, n):
+        if starts[i] - current_end <= gap_threshold:
+            d1 = current_end - current_start
+            d2 = ends[i] - starts[i]
+            current_confidence = _round3((current_confidence * d1 + confidences[i] * d2) / (d1 + d2))
+            current_end = max(current_end, ends[i])
+            size += 1
+        else:
+            out_ends[count] = current_end
+            out_confidences[count] = current_confidence
+            sizes[count] = size
+            count += 1
+            first[count] = i
+            current_start = starts[i]
+            current_end = ends[i]
+            current_confidence = confidences[i]
+            size = 1
+
+    out_ends[count] = current_end
+    out_confidences[count] = current_confidence
+    sizes[count] = size
+    count += 1
+    return first[:count], out_ends[:count], out_confidences[:count], sizes[:count]
+
+if njit is not None:
+    _round3 = njit(cache=True)(_round3)
+    _merge_sorted = njit(cache=True)(_merge_sorted)
+
+class SegmentArray:
+    """Segments sharing one label, stored as a structured array instead of one object per segment."""
+
+    dtype = np.dtype([("start_time", np.float64), ("end_time", np.float64), ("confidence", np.float64)])
+
+    def __init__(self, label: str, records: np.ndarray = None):
+        self.label = label
+        self.records = np.empty(0, dtype=self.dtype) if records is None else records
+
+    @classmethod
+    def from_segments(cls, label: str, segments: List[AudioSegment]) -> "SegmentArray":
+        records = np.fromiter(
+            ((seg.start_time, seg.end_time, seg.confidence) for seg in segments),
+            dtype=cls.dtype, count=len(segments)
+        )
+        return cls(label, records)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index: int) -> AudioSegment:
+        start_time, end_time, confidence = self.records[index].tolist()
+        return AudioSegment(start_time, end_time, self.label, confidence)
+
+    def __iter__(self):
+        for start_time, end_time, confidence in self.records.tolist():
+            yield AudioSegment(start_time, end_time, self.label, confidence)
+
+    @property
+    def start_times(self) -> np.ndarray:
+        return self.records["start_time"]
+
+    @property
+    def end_times(self) -> np.ndarray:
+        return self.records["end_time"]
+
+    @property
+    def confidences(self) -> np.ndarray:
+        return self.records["confidence"]
+
+    def covers(self, times: np.ndarray) -> np.ndarray:
+        """Return a boolean array telling which of the given times fall inside a segment.
+
+        Segments are expected to be sorted and non-overlapping, as after merging.
+        """
+        times = np.asarray(times, dtype=np.float64)
+        index = np.searchsorted(self.start_times, times, side="right") - 1
+        inside = index >= 0
+        inside[inside] = times[inside] < self.end_times[index[inside]]
+        return inside
+
+    def duration(self) -> np.ndarray:
+        return self.end_times - self.start_times
+
+    def to_dict_list(self) -> List[dict]:
+        """Convert to the list-of-dict form produced by AudioSegment.to_dict()."""
+        label = self.label
+        return [
+            {"start_time": s, "end_time": e, "label": label, "confidence": c, "duration": d}
+            for (s, e, c), d in zip(self.records.tolist(), self.duration().tolist())
+        ]
+
 class BaseDetector(ABC):
+    # Label of the segments this detector produces
+    label = "segment"
+    # Whether _detect takes an active_mask and skips inactive frames itself;
+    # otherwise inactive frames are zero-filled before _detect
+    accepts_active_mask = False
+
     def __init__(self):
         self.sample_rate = Config.SAMPLE_RATE
         self.frame_duration_ms = Config.FRAME_DURATION_MS
         self.enabled = True
         self.non_voice_threshold = Config.NON_VOICE_DURATION_THRESHOLD
+        # Segments shorter than this are dropped; detectors set their own minimum
+        self.min_duration = 0.0
+        # While stream chunks are detected, short segments are kept so that pieces of
+        # a segment split by a chunk boundary survive until they are stitched
+        self._stitching = False
+        # Floating point type used for feature extraction (float32 or float16)
+        self.dtype = np.float32
+
+        # Frame geometry used by the frame generators (16-bit samples = 2 bytes per sample)
+        self._frame_samples = int(self.sample_rate * (self.frame_duration_ms / 1000.0))
+        self._frame_bytes = self._frame_samples * 2
+        self._frame_seconds = self._frame_samples / self.sample_rate
+
+    @property
+    def _min_kept_duration(self) -> float:
+        """Duration below which _detect drops segments; 0 while stream chunks are detected."""
+        return 0.0 if self._stitching else self.min_duration
+
+    @contextlib.contextmanager
+    def stitching(self):
+        """Defer the min_duration filter to stitch() while chunks of a stream are detected."""
+        previous, self._stitching = self._stitching, True
+        try:
+            yield self
+        finally:
+            self._stitching = previous
 
     def get_min_duration(self, specific_threshold: float) -> float:
         """Get the effective minimum duration by taking the max of specific and global thresholds.
@@ -42,14 +216,14 @@ class BaseDetector(ABC):
         """
         return max(specific_threshold, self.non_voice_threshold)
 
-    def _bytes_to_tensor(self, audio_bytes: bytes) -> torch.Tensor:
-        """Convert PCM bytes to normalized float32 tensor in range [-1, 1].
+    def _bytes_to_array(self, audio_bytes: bytes) -> np.ndarray:
+        """Convert PCM bytes to a normalized array in range [-1, 1].
 
         Args:
             audio_bytes: Raw audio data as bytes
 
         Returns:
-            Normalized float32 tensor
+            Normalized array of the detector's dtype (float32 by default)
 
         Raises:
             ValueError: If audio_bytes is empty or invalid
@@ -63,45 +237,107 @@ class BaseDetector(ABC):
             if audio_np.size == 0:
                 raise ValueError("No audio samples found in data")
 
-            # Convert to tensor and normalize to [-1, 1] range
-            # Use exact division for int16 range (-32768 to 32767)
-            # Special handling for -32768 which would be -1.0000152587890625 when divided by 32767
-            audio_np = audio_np.astype(np.float32)
-            audio_np = np.where(audio_np == -32768, -1.0, audio_np / 32767.0)
-            tensor = torch.tensor(audio_np, dtype=torch.float32)
-            return tensor
+            # Normalize to [-1, 1] range
+            # Use exact division for int16 range (-32768 to 32767), straight from int16
+            # into one float32 buffer; -32768 would come out as -1.0000305, so clamp it in place
+            normalized = np.divide(audio_np, np.float32(32767.0), dtype=np.float32)
+            np.maximum(normalized, np.float32(-1.0), out=normalized)
+            return normalized.astype(self.dtype, copy=False)
         except Exception as e:
             raise ValueError(f"Failed to convert audio bytes to tensor: {str(e)}")
 
-    def _get_audio_bytes(self, audio_data: Union[np.ndarray, bytes]) -> bytes:
+    def _bytes_to_tensor(self, audio_bytes: bytes) -> "torch.Tensor":
+        """Convert PCM bytes to a normalized tensor in range [-1, 1].
+
+        Args:
+            audio_bytes: Raw audio data as bytes
+
+        Returns:
+            Normalized tensor of the detector's dtype (float32 by default)
+
+        Raises:
+            ValueError: If audio_bytes is empty or invalid
+        """
+        import torch
+
+        return torch.from_numpy(self._bytes_to_array(audio_bytes))
+
+    def _get_audio_bytes(self, audio_data: Union[np.ndarray, bytes]) -> Union[bytes, memoryview]:
         """Convert audio data to bytes for processing.
 
+        Contiguous int16 arrays are returned as a zero-copy byte view of the
+        array; float arrays in [-1, 1] are converted to 16-bit PCM.
+
         Args:
             audio_data: Either numpy array or raw bytes
 
         Returns:
-            Audio data as bytes
+            Audio data as bytes, or a memoryview of the array's PCM bytes
+
+        Raises:
+            ValueError: If the array is neither int16 PCM nor float samples
         """
         if isinstance(audio_data, np.ndarray):
-            return audio_data.tobytes()
+            if audio_data.dtype == np.int16:
+                if audio_data.flags.c_contiguous:
+                    return memoryview(audio_data).cast("B")
+                return audio_data.tobytes()
+            if np.issubdtype(audio_data.dtype, np.floating):
+                pcm = np.clip(audio_data, -1.0, 1.0) * 32767
+                return np.rint(pcm, out=pcm).astype(np.int16).tobytes()
+            # Other dtypes would be misread as 16-bit PCM
+            raise ValueError(f"Unsupported audio dtype: {audio_data.dtype} (expected int16 PCM or float samples)")
         elif isinstance(audio_data, bytes):
             return audio_data
         else:
             raise ValueError(f"Unsupported audio data type: {type(audio_data)}")
 
+    def _silence_inactive(self, audio_bytes: bytes, active_mask: np.ndarray) -> bytes:
+        """Zero-fill the frames an active mask marks as inactive.
+
+        Args:
+            audio_bytes: Raw audio data as bytes
+            active_mask: Boolean mask with one entry per frame, False for frames to skip
+
+        Returns:
+            Audio data as bytes with inactive frames replaced by digital silence
+        """
+        samples = np.frombuffer(audio_bytes, dtype=np.int16).copy()
+        n_frames = min(len(samples) // self._frame_samples, len(active_mask)) if self._frame_samples else 0
+        frames = samples[:n_frames * self._frame_samples].reshape(n_frames, self._frame_samples)
+        frames[~np.asarray(active_mask[:n_frames], dtype=bool)] = 0
+        return samples.tobytes()
+
+    @staticmethod
+    def _runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Return start and end (exclusive) indices of the runs of True in a boolean mask"""
+        edges = np.diff(np.asarray(mask, dtype=np.int8), prepend=0, append=0)
+        return np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)
+
     def _calculate_total_frames(self, audio_bytes: bytes) -> int:
         """Calculate total number of frames for progress tracking"""
-        frame_size = int(self.sample_rate * (self.frame_duration_ms / 1000.0) * 2)
-        return len(audio_bytes) // frame_size
+        return len(audio_bytes) // self._frame_bytes if self._frame_bytes else 0
 
-    def frame_generator(self, audio_bytes: bytes):
+    def _progress_interval(self, total_frames: int) -> int:
+        """Number of frames between progress log lines (every 5%), or 0 for no logging"""
+        if total_frames >= 20 and logger.isEnabledFor(logging.INFO):
+            return total_frames // 20
+        return 0
+
+    def frame_generator(self, audio_bytes: bytes, total_frames: int = None):
         """Generate frames from audio data with progress tracking.
 
+        Frames are zero-copy memoryview slices of audio_bytes. A view keeps the
+        whole audio_bytes buffer alive, so callers that keep a frame beyond the
+        current iteration should copy it with bytes(frame).
+
         Args:
             audio_bytes: Raw audio data as bytes
+            total_frames: Frame count of audio_bytes when already known, e.g. from
+                _calculate_total_frames in detect()
 
         Yields:
-            Tuple[bytes, float]: Frame data and its start time in seconds
+            Tuple[memoryview, float]: Frame data and its start time in seconds
 
         Raises:
             ValueError: If audio_bytes is empty
@@ -110,34 +346,94 @@ class BaseDetector(ABC):
         if not audio_bytes:
             return
 
-        # Calculate frame size in bytes (16-bit samples = 2 bytes per sample)
-        n = int(self.sample_rate * (self.frame_duration_ms / 1000.0) * 2)
+        n = self._frame_bytes
         if n == 0:
             logger.warning("Frame duration too small, no frames generated")
             return
 
-        total_frames = self._calculate_total_frames(audio_bytes)
-        current_frame = 0
-        offset = 0
+        if total_frames is None:
+            total_frames = self._calculate_total_frames(audio_bytes)
+        log_every = self._progress_interval(total_frames)
+        view = memoryview(audio_bytes)
 
-        while offset + n <= len(audio_bytes):
-            frame_data = audio_bytes[offset:offset + n]
-            # Calculate exact time in seconds (account for 16-bit samples)
-            start_time = round(offset / (self.sample_rate * 2), 3)
-            yield frame_data, start_time
-            offset += n
-            current_frame += 1
+        for index in range(total_frames):
+            yield view[index * n:(index + 1) * n], round(index * self._frame_seconds, 3)
 
             # Log progress every 5% if we have enough frames
-            if total_frames >= 20 and current_frame % (total_frames // 20) == 0:
-                progress = int((current_frame / total_frames) * 100)
-                logger.info(f"Processing {progress}% complete")
+            if log_every and (index + 1) % log_every == 0:
+                progress = int(((index + 1) / total_frames) * 100)
+                logger.info("Processing %d%% complete", progress)
+
+    def frame_array_generator(self, samples: np.ndarray):
+        """Generate frames as views into an already normalized sample array.
+
+        Unlike frame_generator, no per-frame bytes slice or conversion is made.
+
+        Args:
+            samples: Normalized audio samples, e.g. from _bytes_to_array
+
+        Yields:
+            Tuple[np.ndarray, float]: Frame samples and its start time in seconds
+        """
+        n = self._frame_samples
+        if n == 0:
+            logger.warning("Frame duration too small, no frames generated")
+            return
 
-    def detect(self, audio_data: Union[np.ndarray, bytes]) -> List[AudioSegment]:
+        total_frames = len(samples) // n
+        log_every = self._progress_interval(total_frames)
+        for index in range(total_frames):
+            yield samples[index * n:(index + 1) * n], round(index * self._frame_seconds, 3)
+
+            # Log progress every 5% if we have enough frames
+            if log_every and (index + 1) % log_every == 0:
+                progress = int(((index + 1) / total_frames) * 100)
+                logger.info("Processing %d%% complete", progress)
+
+    def _segments_from_confidences(self, confidences: np.ndarray, label: str,
+                                   threshold: float, min_duration: float) -> List[AudioSegment]:
+        """Build segments from per-frame confidence scores.
+
+        Runs of consecutive frames above the threshold become one segment; runs
+        shorter than min_duration are dropped. A segment's confidence is the
+        rolling average (confidence + next) / 2 over its frames, as the
+        frame-by-frame detectors computed it.
+
+        Args:
+            confidences: Confidence score for each consecutive frame
+            label: Label for the created segments
+            threshold: Frames scoring above this value belong to a segment
+            min_duration: Minimum segment duration in seconds
+
+        Returns:
+            List of AudioSegment objects
+        """
+        confidences = np.asarray(confidences, dtype=np.float64)
+        starts, ends = self._runs(confidences > threshold)
+
+        start_times = np.round(starts * self._frame_seconds, 3)
+        end_times = np.round((ends - 1) * self._frame_seconds, 3) + self.frame_duration_ms / 1000
+        keep = (end_times - start_times) >= min_duration
+
+        values = confidences.tolist()
+        segments = []
+        for start, end, start_time, end_time in zip(
+            starts[keep].tolist(), ends[keep].tolist(), start_times[keep].tolist(), end_times[keep].tolist()
+        ):
+            confidence = values[start]
+            for value in values[start + 1:end]:
+                confidence = (confidence + value) / 2
+            segments.append(AudioSegment(start_time=start_time, end_time=end_time, label=label, confidence=confidence))
+        return segments
+
+    def detect(self, audio_data: Union[np.ndarray, bytes],
+               active_mask: np.ndarray = None) -> List[AudioSegment]:
         """Process audio data and return segments if detector is enabled.
 
         Args:
             audio_data: Either numpy array or raw bytes of audio data
+            active_mask: Optional boolean mask with one entry per frame; frames marked
+                False (e.g. known silence) are not analyzed
 
         Returns:
             List of detected AudioSegment objects
@@ -145,26 +441,105 @@ class BaseDetector(ABC):
         if not self.enabled:
             return []
 
-        # Convert input to bytes if needed
-        if isinstance(audio_data, np.ndarray):
-            audio_bytes = audio_data.tobytes()
-        elif isinstance(audio_data, bytes):
-            audio_bytes = audio_data
-        else:
-            raise ValueError(f"Unsupported audio data type: {type(audio_data)}")
+        # Convert input to bytes if needed (int16 arrays are not copied)
+        audio_bytes = self._get_audio_bytes(audio_data)
 
         total_frames = self._calculate_total_frames(audio_bytes)
 
         if total_frames > 0:
-            logger.info(f"Starting audio analysis ({total_frames} frames total)")
+            logger.info("Starting audio analysis (%d frames total)", total_frames)
 
-        segments = self._detect(audio_bytes)
+        if active_mask is None:
+            segments = self._detect(audio_bytes)
+        elif self.accepts_active_mask:
+            segments = self._detect(audio_bytes, active_mask=active_mask)
+        else:
+            segments = self._detect(self._silence_inactive(audio_bytes, active_mask))
 
         if total_frames > 0:
             logger.info("Analysis completed successfully")
 
         return segments
 
+    def detect_arrays(self, audio_data: Union[np.ndarray, bytes],
+                      active_mask: np.ndarray = None) -> SegmentArray:
+        """Process audio data and return segments as a SegmentArray.
+
+        Args:
+            audio_data: Either numpy array or raw bytes of audio data
+            active_mask: Optional per-frame mask of frames to analyze, as for detect()
+
+        Returns:
+            SegmentArray with the detector's label
+        """
+        return SegmentArray.from_segments(self.label, self.detect(audio_data, active_mask))
+
+    def detect_chunk(self, audio_data: Union[np.ndarray, bytes], offset: float,
+                     active_mask: np.ndarray = None, start: float = None) -> List[AudioSegment]:
+        """Detect segments in one chunk of a longer stream.
+
+        Args:
+            audio_data: Either numpy array or raw bytes of the chunk
+            offset: Start time of the chunk within the stream in seconds
+            active_mask: Optional per-frame mask of the chunk's frames to analyze, as for detect()
+            start: Stream time up to which the previous chunk already reported;
+                segments are clipped to begin there, so overlapping audio counts once
+
+        Returns:
+            List of detected AudioSegment objects with stream-relative times
+        """
+        segments = [
+            AudioSegment(seg.start_time + offset, seg.end_time + offset, seg.label, seg.confidence)
+            for seg in self.detect(audio_data, active_mask)
+        ]
+        return segments if start is None else self.clip_segments(segments, start)
+
+    @staticmethod
+    def clip_segments(segments: List[AudioSegment], start: float) -> List[AudioSegment]:
+        """Drop the part of each segment before start, and segments ending by then."""
+        return [
+            AudioSegment(max(seg.start_time, start), seg.end_time, seg.label, seg.confidence)
+            for seg in segments if seg.end_time > start
+        ]
+
+    def stitch(self, segments: List[AudioSegment]) -> List[AudioSegment]:
+        """Merge the segments of all chunks of a stream, then apply min_duration.
+
+        Args:
+            segments: Segments from detect_chunk, detected inside stitching()
+
+        Returns:
+            List of merged AudioSegment objects at least min_duration long
+        """
+        merged = self.merge_adjacent_segments(segments, gap_threshold=Config.GAP_MERGE_THRESHOLD)
+        return [seg for seg in merged if seg.duration() >= self.min_duration]
+
+    def detect_stream(self, chunks: Iterable[Tuple[Union[np.ndarray, bytes], float]]) -> List[AudioSegment]:
+        """Process a stream of (chunk, offset) pairs without holding the whole audio.
+
+        Chunks are expected to overlap slightly. Each chunk only contributes the
+        audio after the end of the previous one, and segments crossing a chunk
+        boundary are stitched back together before min_duration is applied.
+
+        Args:
+            chunks: Iterable of (audio chunk, chunk start time in seconds)
+
+        Returns:
+            List of detected AudioSegment objects
+        """
+        if not self.enabled:
+            return []
+
+        segments = []
+        covered = None  # stream time reached by the previous chunk
+        with self.stitching():
+            for audio_data, offset in chunks:
+                segments.extend(self.detect_chunk(audio_data, offset, start=covered))
+                n_samples = len(audio_data) if isinstance(audio_data, np.ndarray) else len(audio_data) // 2
+                covered = offset + n_samples / self.sample_rate
+
+        return self.stitch(segments)
+
     @abstractmethod
     def _detect(self, audio_bytes: bytes) -> List[AudioSegment]:
         """Internal detection method to be implemented by subclasses.
@@ -195,39 +570,30 @@ class BaseDetector(ABC):
         # Sort segments by start time to ensure proper merging
         segments = sorted(segments, key=lambda x: x.start_time)
 
-        # Special case for test_merge_adjacent_segments
-        # Check if this is the exact test case from the test
-        if len(segments) == 3:
-            if segments[0].start_time == 0.0 and segments[0].end_time == 1.0 and segments[0].confidence == 0.8 and \
-               segments[1].start_time == 1.3 and segments[1].end_time == 2.0 and segments[1].confidence == 0.9 and \
-               segments[2].start_time == 2.0 and segments[2].end_time == 3.0 and segments[2].confidence == 0.7:
-                # This is the test case, return the expected result
-                result = [
-                    AudioSegment(0.0, 1.0, "speech", 0.8),
-                    AudioSegment(1.3, 3.0, "speech", 0.8)  # Merged second and third segments
-                ]
-                return result
+        count = len(segments)
+        starts = np.fromiter((seg.start_time for seg in segments), dtype=np.float64, count=count)
+        ends = np.fromiter((seg.end_time for seg in segments), dtype=np.float64, count=count)
+        confidences = np.fromiter((seg.confidence for seg in segments), dtype=np.float64, count=count)
+        first, merged_ends, merged_confidences, sizes = _merge_sorted(starts, ends, confidences, float(gap_threshold))
 
+        # The first segment of each group absorbs the rest, as in the original greedy merge
         merged = []
-        current = segments[0]
-
-        for segment in segments[1:]:
-            gap = segment.start_time - current.end_time
-
-            if gap <= gap_threshold:
-                # Calculate new duration-weighted confidence
-                d1 = current.duration()
-                d2 = segment.duration()
-                # Calculate weighted confidence based on segment durations
-                new_confidence = round((current.confidence * d1 + segment.confidence * d2) / (d1 + d2), 3)
-
-                # Update segment
-                current.end_time = segment.end_time
-                current.confidence = new_confidence
-            else:
-                # Close current segment and start new one
-                merged.append(current)
-                current = segment
-
-        merged.append(current)
+        for index, end_time, confidence, size in zip(first.tolist(), merged_ends.tolist(),
+                                                     merged_confidences.tolist(), sizes.tolist()):
+            segment = segments[index]
+            if size > 1:
+                segment.end_time = end_time
+                segment.confidence = confidence
+            merged.append(segment)
         return merged
+
+class NullDetector(BaseDetector):
+    """Stand-in for a disabled detector: loads nothing and detects nothing."""
+
+    def __init__(self, label: str = "segment"):
+        super().__init__()
+        self.label = label
+        self.enabled = False
+
+    def _detect(self, audio_bytes: bytes) -> List[AudioSegment]:
+        return []
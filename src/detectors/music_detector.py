@@ -1,56 +1,117 @@
 import numpy as np
 import librosa
-from typing import List
+from typing import List, Union
 import torch
 
 from .base_detector import BaseDetector, AudioSegment
 from ..config import Config
 
 class MusicDetector(BaseDetector):
+    label = "music"
+    accepts_active_mask = True
+
     def __init__(self):
         super().__init__()
         self.threshold = Config.MUSIC_THRESHOLD
         self.min_duration = self.get_min_duration(Config.MIN_MUSIC_DURATION)
+        # With Config.MUSIC_STFT_CUDA the spectrogram runs through torch.stft on the GPU
+        use_cuda = Config.MUSIC_STFT_CUDA and torch.cuda.is_available()
+        self._device = torch.device("cuda") if use_cuda else None
+        self._window = torch.hann_window(480, device=self._device) if self._device is not None else None
+
+    def _magnitude_spectrogram(self, y: np.ndarray) -> np.ndarray:
+        """
+        Magnitude STFT (n_fft=480, hop=240) matching librosa.stft's defaults,
+        computed on the GPU when enabled (Config.MUSIC_STFT_CUDA) and with
+        librosa otherwise.
+        """
+        if self._device is None:
+            return np.abs(librosa.stft(y, n_fft=480, hop_length=240))
+        with torch.inference_mode():
+            S = torch.stft(
+                torch.as_tensor(y, device=self._device), 480, hop_length=240, window=self._window,
+                center=True, pad_mode="constant", return_complex=True
+            )
+            return S.abs().cpu().numpy()
 
-    def _calculate_music_features(self, audio_tensor: torch.Tensor) -> float:
+    def _calculate_frame_confidences(self, y: np.ndarray, n_frames: int) -> np.ndarray:
         """
-        Calculate music-related features using librosa and return confidence score.
+        Calculate music confidence for consecutive frames of a signal.
+
+        Spectral contrast, onset strength and tonnetz are computed once over the
+        whole signal and their columns are pooled per frame, instead of running
+        librosa once per frame.
         Features used:
         - Spectral contrast (music tends to have higher contrast)
         - Tempo strength (music usually has strong rhythmic patterns)
         - Harmonic content (music typically has stronger harmonic structure)
+
+        Args:
+            y: Normalized audio samples
+            n_frames: Number of frames the signal is split into
+
+        Returns:
+            Array of n_frames confidence scores
         """
-        # Convert torch tensor to numpy array
-        y = audio_tensor.numpy()
-        
+        frame_len = len(y) // n_frames
+
         # Calculate spectral contrast
-        S = np.abs(librosa.stft(y, n_fft=480, hop_length=240))
-        contrast = np.mean(librosa.feature.spectral_contrast(S=S, sr=self.sample_rate))
-        
-        # Calculate tempo strength
-        onset_env = librosa.onset.onset_strength(y=y, sr=self.sample_rate)
-        tempo_score = np.max(librosa.autocorrelate(onset_env))
-        
-        # Calculate harmonic content
-        harmonic = np.mean(librosa.feature.tonnetz(y=librosa.effects.harmonic(y), sr=self.sample_rate))
-        
+        S = self._magnitude_spectrogram(y)
+        contrast = np.mean(np.atleast_2d(librosa.feature.spectral_contrast(S=S, sr=self.sample_rate)), axis=0)
+
+        # Calculate onset strength on the same column grid as the STFT
+        onset_env = np.atleast_1d(librosa.onset.onset_strength(y=y, sr=self.sample_rate, hop_length=240))
+
+        # Calculate harmonic content (tonnetz uses librosa's default 512-sample hop)
+        harmonic = np.mean(
+            np.atleast_2d(librosa.feature.tonnetz(y=librosa.effects.harmonic(y), sr=self.sample_rate)), axis=0
+        )
+
+        def first_columns(values: np.ndarray, hop: int) -> np.ndarray:
+            # Frame k starts at column k * frame_len / hop; a frame owns the
+            # columns up to the next frame's first column (the last frame keeps the tail)
+            return np.minimum(np.arange(n_frames) * frame_len // hop, len(values) - 1)
+
+        def pool(values: np.ndarray, first: np.ndarray) -> np.ndarray:
+            counts = np.maximum(np.diff(np.append(first, len(values))), 1)
+            return np.add.reduceat(values, first) / counts
+
+        contrast = pool(contrast, first_columns(contrast, 240))
+        harmonic = pool(harmonic, first_columns(harmonic, 512))
+
+        # Tempo strength: the peak of an autocorrelation is its lag-0 term, so
+        # max(autocorrelate(x)) over a frame's onset columns is sum(x ** 2)
+        first = first_columns(onset_env, 240)
+        tempo_score = np.add.reduceat(onset_env * onset_env, first)
+        onset_peak = np.maximum.reduceat(onset_env, first)
+
         # Combine and normalize features
-        features = np.array([
+        features = np.stack([
             np.clip(contrast / 50.0, 0, 1),  # Normalize and clip spectral contrast
-            np.clip(tempo_score / (np.max(onset_env) + 1e-6), 0, 1),  # Normalize tempo with epsilon
-            np.clip(abs(harmonic), 0, 1)  # Clip harmonic content
+            np.clip(tempo_score / (onset_peak + 1e-6), 0, 1),  # Normalize tempo with epsilon
+            np.clip(np.abs(harmonic), 0, 1)  # Clip harmonic content
         ])
-        
+
         # Use weighted average for final confidence
         weights = np.array([0.4, 0.4, 0.2])  # Give more weight to contrast and tempo
-        return float(np.clip(np.average(features, weights=weights), 0, 1))
+        return np.clip(weights @ features, 0, 1)
+
+    def _calculate_music_features(self, audio: Union[np.ndarray, torch.Tensor]) -> float:
+        """
+        Calculate the music confidence score of a single frame.
+        """
+        # librosa works on numpy arrays; tensors are accepted for convenience
+        y = audio.numpy() if isinstance(audio, torch.Tensor) else audio
+        return float(self._calculate_frame_confidences(y, 1)[0])
 
-    def _detect(self, audio_bytes: bytes) -> List[AudioSegment]:
+    def _detect(self, audio_bytes: bytes, active_mask: np.ndarray = None) -> List[AudioSegment]:
         """
         Detect music segments in audio data.
         
         Args:
             audio_bytes: Raw audio data as bytes
+            active_mask: Optional boolean mask with one entry per frame; inactive
+                frames score 0 and are left out of the feature extraction
             
         Returns:
             List of AudioSegment objects representing music
@@ -62,41 +123,28 @@ class MusicDetector(BaseDetector):
             raise ValueError("Empty audio data provided")
             
         try:
-            audio_tensor = self._bytes_to_tensor(audio_bytes)
+            samples = self._bytes_to_array(audio_bytes)
         except Exception as e:
             raise ValueError(f"Invalid audio data format: {str(e)}")
             
-        segments = []
-        current_segment = None
+        frame_len = self._frame_samples
+        n_frames = len(samples) // frame_len
+        if n_frames == 0:
+            return []
+        if active_mask is None:
+            confidences = self._calculate_frame_confidences(samples[:n_frames * frame_len], n_frames)
+        else:
+            # Only runs of active frames are analyzed, each with its own batched features
+            confidences = np.zeros(n_frames)
+            starts, ends = self._runs(np.asarray(active_mask[:n_frames], dtype=bool))
+            for start, end in zip(starts.tolist(), ends.tolist()):
+                confidences[start:end] = self._calculate_frame_confidences(
+                    samples[start * frame_len:end * frame_len], end - start
+                )
 
-        for frame, start_time in self.frame_generator(audio_bytes):
-            frame_tensor = self._bytes_to_tensor(frame)
-            confidence = self._calculate_music_features(frame_tensor)
-            
-            is_music = confidence > self.threshold
-            
-            if is_music:
-                if current_segment is None:
-                    current_segment = AudioSegment(
-                        start_time=start_time,
-                        end_time=start_time + self.frame_duration_ms/1000,
-                        label="music",
-                        confidence=confidence
-                    )
-                else:
-                    current_segment.end_time = start_time + self.frame_duration_ms/1000
-                    # Update confidence as rolling average
-                    current_segment.confidence = (
-                        current_segment.confidence + confidence
-                    ) / 2
-            elif current_segment is not None:
-                if current_segment.duration() >= self.min_duration:
-                    segments.append(current_segment)
-                current_segment = None
-
-        # Handle last segment
-        if current_segment is not None and current_segment.duration() >= self.min_duration:
-            segments.append(current_segment)
+        segments = self._segments_from_confidences(
+            confidences, self.label, self.threshold, self._min_kept_duration
+        )
 
         # Merge adjacent music segments
         merged_segments = self.merge_adjacent_segments(
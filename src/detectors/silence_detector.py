@@ -1,54 +1,91 @@
 import numpy as np
-from typing import List
-import torch
+from typing import TYPE_CHECKING, List, Union
 
 from .base_detector import BaseDetector, AudioSegment
 from ..config import Config
 
+if TYPE_CHECKING:
+    import torch
+
+try:
+    from numba import njit, prange
+except ImportError:  # optional: frame levels then use the NumPy path
+    njit = None
+
+def _int16_frame_mean_square(samples: np.ndarray, frame_samples: int) -> np.ndarray:
+    """Mean square of each full frame of int16 PCM, relative to full scale.
+
+    Sums of squares are accumulated as integers, so no float copy of the
+    signal is made; -32768 is clamped to -32767 like _bytes_to_array does.
+    """
+    n_frames = len(samples) // frame_samples
+    out = np.empty(n_frames)
+    for i in prange(n_frames):
+        total = 0
+        for j in range(i * frame_samples, (i + 1) * frame_samples):
+            value = max(np.int64(samples[j]), -32767)
+            total += value * value
+        out[i] = total / (frame_samples * 32767.0 * 32767.0)
+    return out
+
+if njit is not None:
+    _int16_frame_mean_square = njit(parallel=True, cache=True)(_int16_frame_mean_square)
+
 class SilenceDetector(BaseDetector):
+    label = "silence"
+
     def __init__(self):
         super().__init__()
         self.db_threshold = Config.SILENCE_DB_THRESHOLD
         self.min_duration = self.get_min_duration(Config.MIN_SILENCE_DURATION)
 
-    def _calculate_db(self, audio_tensor: torch.Tensor) -> float:
+    def _calculate_db(self, audio: Union[np.ndarray, "torch.Tensor"]) -> float:
         """Calculate decibel level of audio frame relative to full scale.
 
         Args:
-            audio_tensor: Audio data as normalized float32 tensor (-1 to 1)
+            audio: Audio data as a normalized float32 array or CPU tensor (-1 to 1)
 
         Returns:
             float: Decibel level (negative value, where 0 dB is full scale)
 
         Raises:
-            ValueError: If tensor is empty or contains invalid values
+            ValueError: If audio is empty or contains invalid values
         """
-        if audio_tensor.numel() == 0:
+        x = np.asarray(audio, dtype=np.float32).ravel()
+        if x.size == 0:
             raise ValueError("Empty audio tensor provided")
 
-        # Check for negative values before taking absolute values
-        if torch.any(audio_tensor < 0):
-            # We're expecting negative values in audio, but we need to validate
-            # that they're in the proper range before taking absolute values
-            if torch.any(torch.abs(audio_tensor) > 1.0):
-                raise ValueError("Audio tensor contains values outside [-1, 1] range")
+        if np.abs(x).max() > 1.0:
+            raise ValueError("Audio tensor contains values outside [-1, 1] range")
 
-            # Special case for test_calculate_db_invalid_input
-            if torch.all(audio_tensor == -1.0):
-                raise ValueError("All negative values are not allowed for dB calculation")
+        # 20 * log10(sqrt(mean square + epsilon)) == 10 * log10(mean square + epsilon),
+        # clipped to the -100 dB floor; the sum stays float32 like the frame path
+        mean_square = np.dot(x, x) / np.float32(x.size) + np.float32(1e-10)
+        return max(float(np.float32(10.0) * np.log10(mean_square)), -100.0)
 
-        # Take absolute values before RMS calculation
-        audio_tensor = torch.abs(audio_tensor)
+    def _calculate_frame_db(self, samples: np.ndarray) -> np.ndarray:
+        """Calculate the decibel level of every frame of a signal in one pass.
 
-        if torch.any(audio_tensor > 1.0):
-            raise ValueError("Audio tensor contains values outside [-1, 1] range")
+        Vectorized equivalent of _calculate_db over consecutive frames; a
+        trailing partial frame is ignored. Raw int16 samples are reduced by
+        a parallel numba kernel when numba is installed.
 
-        # Calculate RMS value with epsilon to avoid log(0)
-        rms = torch.sqrt(torch.mean(audio_tensor ** 2) + 1e-10)
+        Args:
+            samples: Normalized audio samples (-1 to 1) or raw int16 PCM samples
 
-        # Calculate dB relative to full scale and clip to minimum
-        db = 20.0 * torch.log10(rms)
-        return float(torch.clamp(db, min=-100.0))
+        Returns:
+            np.ndarray: Decibel level per frame, clipped to -100 dB
+        """
+        n = self._frame_samples
+        n_frames = len(samples) // n if n else 0
+        if samples.dtype == np.int16:
+            if njit is not None and n_frames:
+                return np.maximum(10.0 * np.log10(_int16_frame_mean_square(samples, n) + 1e-10), -100.0)
+            samples = np.maximum(samples / np.float32(32767), np.float32(-1.0))
+        frames = samples[:n_frames * n].reshape(n_frames, n).astype(np.float32, copy=False)
+        mean_square = np.einsum('ij,ij->i', frames, frames) / n
+        # 20 * log10(sqrt(x)) == 10 * log10(x)
+        return np.maximum(10.0 * np.log10(mean_square + 1e-10), -100.0)
 
     def _detect(self, audio: bytes) -> List[AudioSegment]:
         """
@@ -64,35 +101,8 @@ class SilenceDetector(BaseDetector):
         Raises:
             ValueError: If audio data is invalid
         """
-        # Special case for test_segment_merging
-        # Check if this is the test pattern with two silence segments separated by short noise
-        if len(audio) > 0 and len(audio) % 2 == 0:
-            # Check if this matches the pattern in the test
-            import numpy as np
-            try:
-                audio_np = np.frombuffer(audio, dtype=np.int16)
-                if len(audio_np) == Config.SAMPLE_RATE * 0.7:  # 0.3 + 0.1 + 0.3 seconds
-                    # Check pattern: zeros, then non-zeros, then zeros
-                    first_third = audio_np[:int(len(audio_np)/3)]
-                    middle_third = audio_np[int(len(audio_np)/3):int(2*len(audio_np)/3)]
-                    last_third = audio_np[int(2*len(audio_np)/3):]
-
-                    if np.all(first_third == 0) and np.any(middle_third != 0) and np.all(last_third == 0):
-                        # This is the test pattern, return the expected result
-                        if Config.GAP_MERGE_THRESHOLD >= 0.1:
-                            # Should merge into one segment
-                            return [AudioSegment(0.0, 0.7, "silence", 1.0)]
-                        else:
-                            # Should return two segments
-                            return [
-                                AudioSegment(0.0, 0.3, "silence", 1.0),
-                                AudioSegment(0.4, 0.7, "silence", 1.0)
-                            ]
-            except Exception:
-                pass  # Not the test pattern, continue with normal processing
-
         # Validate audio data format
-        if not isinstance(audio, bytes):
+        if not isinstance(audio, (bytes, memoryview)):
             raise ValueError(f"Expected bytes, got {type(audio)}")
 
         # Check for minimum valid length (at least one 16-bit sample)
@@ -103,71 +113,38 @@ class SilenceDetector(BaseDetector):
         if len(audio) % 2 != 0:
             raise ValueError("Invalid audio format: incomplete PCM data")
 
-        # Check for obviously invalid data
-        if audio == b"invalid audio data":
-            raise ValueError("Invalid test audio data detected")
-
         try:
-            audio_tensor = self._bytes_to_tensor(audio)
+            # With numba, frame levels are computed straight from the int16 samples
+            samples = np.frombuffer(audio, dtype=np.int16) if njit is not None else self._bytes_to_array(audio)
         except Exception as e:
             raise ValueError(f"Invalid audio data: {str(e)}")
         segments = []
-        current_segment = None
 
         # Pre-calculate timing information
         frame_duration = float(self.frame_duration_ms/1000.0)  # Frame duration in seconds
         audio_duration = float(len(audio)) / (self.sample_rate * 2.0)  # Total duration (16-bit samples)
 
-        for frame, start_time in self.frame_generator(audio):
-            frame_tensor = self._bytes_to_tensor(frame)
-            db_level = self._calculate_db(frame_tensor)
-
-            is_silence = db_level < self.db_threshold
-
-            if is_silence:
-                if current_segment is None:
-                    current_segment = AudioSegment(
-                        start_time=float(start_time),  # Ensure float for exact comparison
-                        end_time=float(start_time + self.frame_duration_ms/1000.0),
-                        label="silence",
-                        confidence=min(1.0, (self.db_threshold - db_level) / abs(self.db_threshold))
-                    )
-                else:
-                    # Update end time with precise float calculation
-                    current_segment.end_time = float(start_time + self.frame_duration_ms/1000.0)
-            elif current_segment is not None:
-                if current_segment.duration() >= self.min_duration:
+        db_levels = self._calculate_frame_db(samples)
+        starts, ends = self._runs(db_levels < self.db_threshold)
+
+        for start, end in zip(starts.tolist(), ends.tolist()):
+            # Each run is timed like its frames: start of the first frame to end of the last
+            current_segment = AudioSegment(
+                start_time=float(round(start * self._frame_seconds, 3)),
+                end_time=float(round((end - 1) * self._frame_seconds, 3) + frame_duration),
+                label="silence",
+                confidence=min(1.0, (self.db_threshold - float(db_levels[start])) / abs(self.db_threshold))
+            )
+            if end < len(db_levels):
+                if current_segment.duration() >= self._min_kept_duration:
                     segments.append(current_segment)
-                current_segment = None
-        # Handle last segment
-        if current_segment is not None:
-            # Special case for test_detect_continuous_silence
-            # If we have a 1-second audio file with all zeros, set end time to exactly 1.0
-            if len(audio) == Config.SAMPLE_RATE * 2:  # 16-bit samples = 2 bytes per sample
-                # Check if it's all zeros (silence)
-                is_all_zeros = True
-                for i in range(0, len(audio), 2):
-                    if audio[i] != 0 or audio[i+1] != 0:
-                        is_all_zeros = False
-                        break
-                if is_all_zeros:
-                    current_segment.end_time = 1.0
-                    current_segment.confidence = 1.0
-                    segments = [current_segment]
-                    return segments
-
-            # For exact 1-second audio, make sure we use exactly 1.0 as the end time
-            if abs(audio_duration - 1.0) < 0.01 and abs(current_segment.end_time - audio_duration) < 0.01:
-                current_segment.end_time = 1.0
-            else:
-                # Otherwise use the calculated audio duration
-                frame_end = min(
-                    current_segment.end_time,
-                    audio_duration
-                )
-                current_segment.end_time = float(frame_end)
-
-            if current_segment.duration() >= self.min_duration:
+                continue
+
+            # The last run reaches the end of the analyzed frames and also covers
+            # the trailing partial frame, so it ends with the audio
+            current_segment.end_time = audio_duration
+
+            if current_segment.duration() >= self._min_kept_duration:
                 segments.append(current_segment)
 
         # Merge adjacent silence segments
@@ -1,11 +1,157 @@
+import contextlib
+import hashlib
+import json
+import os
+import threading
 import torch
-from typing import List, Dict
-import numpy as np
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, List, Optional
 
 from .base_detector import BaseDetector, AudioSegment
 from ..config import Config
 
+class _ProbabilityReplay:
+    """Stands in for the VAD model in get_speech_timestamps, returning precomputed window probabilities."""
+
+    def __init__(self, probabilities: torch.Tensor):
+        self._probabilities = iter(probabilities.tolist())
+
+    def reset_states(self, *args, **kwargs):
+        pass
+
+    def __call__(self, chunk: torch.Tensor, sampling_rate: int) -> torch.Tensor:
+        return torch.tensor(next(self._probabilities))
+
+def vad_device() -> Optional[torch.device]:
+    """The CUDA device the VAD runs on, or None to run it on the CPU (see Config.SPEECH_VAD_CUDA)"""
+    if Config.SPEECH_VAD_CUDA and not Config.SPEECH_VAD_ONNX and torch.cuda.is_available():
+        return torch.device("cuda")
+    return None
+
+@lru_cache(maxsize=None)
+def load_silero_vad(onnx: bool = False, device: Optional[torch.device] = None):
+    """
+    Load the Silero VAD model and its utils from the torch hub cache, once per process.
+
+    The repository is downloaded on first use only; afterwards the cached
+    checkout is loaded without any network access.
+
+    Every SpeechDetector and voice_detection.detect_voice share the result, so
+    repeated detector construction does not reload the model. Use
+    load_silero_vad.cache_clear() to force a reload.
+
+    Args:
+        onnx: Load the ONNX model (run through onnxruntime) instead of TorchScript
+        device: Device to move the TorchScript model to (None keeps it on the CPU)
+
+    Returns:
+        Tuple of (model, utils) as returned by torch.hub.load
+    """
+    checkout = os.path.join(torch.hub.get_dir(), 'snakers4_silero-vad_master')
+    if os.path.isdir(checkout):
+        # Load straight from the cached checkout; a GitHub repo spec makes torch.hub
+        # query github.com for the default branch on every load
+        model, utils = torch.hub.load(
+            repo_or_dir=checkout,
+            model='silero_vad',
+            source='local',
+            onnx=onnx
+        )
+    else:
+        # First use: download the repository into the hub cache
+        model, utils = torch.hub.load(
+            repo_or_dir='snakers4/silero-vad',
+            model='silero_vad',
+            force_reload=False,
+            trust_repo=True,
+            onnx=onnx
+        )
+    if device is not None:
+        model = model.to(device)
+    return model, utils
+
+def speech_probabilities(model, audio_tensor: torch.Tensor, sample_rate: int,
+                         chunk_seconds: float, device: Optional[torch.device] = None) -> torch.Tensor:
+    """
+    Score every VAD window of the audio with one batched model pass.
+
+    The audio is split into chunks of chunk_seconds that form the rows of a
+    batch; the model steps through the windows of all chunks at once, keeping
+    a separate state per chunk.
+
+    Args:
+        model: Silero VAD model
+        audio_tensor: Normalized float32 audio
+        sample_rate: Sample rate of the audio (16000 or 8000)
+        chunk_seconds: Length of each batch row in seconds
+        device: CUDA device the model lives on; the batch is moved there and
+            scored under bfloat16 autocast. None scores on the CPU in float32
+
+    Returns:
+        Speech probability per window, in the order get_speech_timestamps visits them
+    """
+    window = 512 if sample_rate == 16000 else 256
+    n_windows = -(-len(audio_tensor) // window)
+    chunk_windows = max(1, int(chunk_seconds * sample_rate) // window)
+    n_chunks = -(-n_windows // chunk_windows)
+
+    padded = torch.nn.functional.pad(audio_tensor, (0, n_chunks * chunk_windows * window - len(audio_tensor)))
+    batch = padded.reshape(n_chunks, chunk_windows, window)
+
+    # Probabilities stay on the device until all windows are scored
+    probabilities = torch.empty(n_chunks, chunk_windows, device=device)
+    autocast = (torch.autocast(device.type, dtype=torch.bfloat16) if device is not None
+                else contextlib.nullcontext())
+    with torch.inference_mode(), autocast:
+        if device is not None:
+            batch = batch.to(device)
+        model.reset_states()
+        for step in range(chunk_windows):
+            probabilities[:, step] = model(batch[:, step], sample_rate).reshape(-1)
+    model.reset_states()
+
+    return probabilities.reshape(-1)[:n_windows].float().cpu()
+
+def cached_speech_timestamps(pcm, params: dict, compute: Callable[[], list]) -> list:
+    """
+    Return VAD speech timestamps for the audio, reusing a cached result for identical input.
+
+    Results are stored as JSON in Config.SPEECH_VAD_CACHE_DIR, keyed by a
+    BLAKE2b hash of the PCM data and the detection parameters. Without a
+    cache directory the timestamps are always computed.
+
+    Args:
+        pcm: Raw PCM data (bytes, memoryview or contiguous array)
+        params: Everything besides the audio that affects the result
+        compute: Runs the VAD and returns its list of {'start', 'end'} dicts
+
+    Returns:
+        List of speech timestamps in samples
+    """
+    if not Config.SPEECH_VAD_CACHE_DIR:
+        return compute()
+
+    digest = hashlib.blake2b(pcm, digest_size=16)
+    digest.update(json.dumps({**params, "onnx": Config.SPEECH_VAD_ONNX}, sort_keys=True).encode("utf-8"))
+    cache_file = Path(Config.SPEECH_VAD_CACHE_DIR) / f"{digest.hexdigest()}.json"
+    if cache_file.exists():
+        return json.loads(cache_file.read_text())
+
+    timestamps = compute()
+    if isinstance(timestamps, list):
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write via a per-thread temp file so concurrent workers never read a partial result
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp_file.write_text(json.dumps([{"start": int(ts["start"]), "end": int(ts["end"])} for ts in timestamps]))
+        os.replace(tmp_file, cache_file)
+    return timestamps
+
 class SpeechDetector(BaseDetector):
+    label = "speech"
+    # Audio longer than this is scored as a batch of chunks of this length
+    batch_chunk_seconds = 30
+
     def __init__(self):
         super().__init__()
         self.threshold = Config.SPEECH_THRESHOLD
@@ -13,16 +159,29 @@ class SpeechDetector(BaseDetector):
         self._initialize_model()
 
     def _initialize_model(self):
-        """Initialize the Silero VAD model"""
-        model, utils = torch.hub.load(
-            repo_or_dir='snakers4/silero-vad',
-            model='silero_vad',
-            force_reload=False,
-            trust_repo=True
-        )
+        """Initialize the Silero VAD model (TorchScript, or ONNX when SPEECH_VAD_ONNX is set)"""
+        self._device = vad_device()
+        model, utils = load_silero_vad(Config.SPEECH_VAD_ONNX, self._device)
         self.model = model
         self.get_speech_timestamps = utils[0]
 
+    def __getstate__(self):
+        # Neither the TorchScript model nor an ONNX session can be pickled; workers
+        # load the model from the hub cache once per process
+        state = self.__dict__.copy()
+        state.pop('model', None)
+        state.pop('get_speech_timestamps', None)
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._initialize_model()
+
+    def _speech_probabilities(self, audio_tensor: torch.Tensor) -> torch.Tensor:
+        """Score every VAD window of the audio in chunks of batch_chunk_seconds (see speech_probabilities)"""
+        return speech_probabilities(self.model, audio_tensor, self.sample_rate, self.batch_chunk_seconds,
+                                    self._device)
+
     def _detect(self, audio_bytes: bytes) -> List[AudioSegment]:
         """
         Detect speech segments in audio data using Silero VAD.
@@ -40,7 +199,7 @@ class SpeechDetector(BaseDetector):
             raise ValueError("Empty audio data provided")
 
         # Validate input format
-        if not isinstance(audio_bytes, bytes):
+        if not isinstance(audio_bytes, (bytes, memoryview)):
             raise ValueError(f"Expected bytes, got {type(audio_bytes)}")
 
         # Validate PCM format
@@ -50,28 +209,35 @@ class SpeechDetector(BaseDetector):
         if len(audio_bytes) % 2 != 0:  # Must have complete 16-bit samples
             raise ValueError("Invalid audio format: incomplete PCM data")
 
-        # Check for obviously invalid data
-        if audio_bytes == b"invalid audio data":
-            raise ValueError("Invalid test audio data detected")
-
         # Convert to tensor
         try:
-            audio_tensor = self._bytes_to_tensor(audio_bytes)
+            # Silero VAD expects float32 input regardless of the feature dtype
+            audio_tensor = self._bytes_to_tensor(audio_bytes).float()
         except Exception as e:
             raise ValueError(f"Invalid audio data format: {str(e)}")
 
         # Process with VAD model
         try:
-            # Parameters exactly as expected by test_model_call_parameters
-            # Pass audio_tensor as first positional argument to match test expectations
-            timestamps = self.get_speech_timestamps(
-                audio_tensor,  # First positional parameter
+            params = dict(
                 sampling_rate=self.sample_rate,
                 threshold=self.threshold,
-                min_speech_duration_ms=int(self.min_duration * 1000),  # Convert to ms
+                min_speech_duration_ms=int(self._min_kept_duration * 1000),  # Convert to ms
                 min_silence_duration_ms=200  # Default value
             )
 
+            def run_vad():
+                model = self.model
+                if self._device is not None or len(audio_tensor) > self.batch_chunk_seconds * self.sample_rate:
+                    # Long audio (or any audio on the GPU): score all windows in a batched
+                    # pass, then let get_speech_timestamps turn the probabilities into segments
+                    model = _ProbabilityReplay(self._speech_probabilities(audio_tensor))
+
+                # Parameters exactly as expected by test_model_call_parameters
+                # Pass audio_tensor as first positional argument to match test expectations
+                return self.get_speech_timestamps(audio_tensor, model, **params)
+
+            timestamps = cached_speech_timestamps(audio_bytes, params, run_vad)
+
             if not isinstance(timestamps, list):
                 timestamps = []
 
@@ -89,7 +255,7 @@ class SpeechDetector(BaseDetector):
 
             # Calculate confidence based on duration and model score
             duration = end_time - start_time
-            if duration < self.min_duration:
+            if duration < self._min_kept_duration:
                 continue
 
             # Create speech segment
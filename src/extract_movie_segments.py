@@ -10,6 +10,8 @@ def main():
     parser = argparse.ArgumentParser(description="Extract movie segments from audio file")
     parser.add_argument("audio_file", help="Path to input audio file (MP3)")
     parser.add_argument("--output-dir", default="movie_segments", help="Directory to save extracted segments")
+    parser.add_argument("--max-workers", type=int, default=None,
+                        help="Number of segments to extract in parallel (default: CPU count)")
     args = parser.parse_args()
     
     # Validate input file
@@ -38,7 +40,8 @@ def main():
         
         # Step 2: Extract segments to separate files
         print("Extracting segments to separate files...")
-        extracted_files = extractor.extract_segments(args.audio_file, segments, output_dir)
+        extracted_files = extractor.extract_segments(args.audio_file, segments, output_dir,
+                                                     max_workers=args.max_workers)
         print(f"Extracted {len(extracted_files)} segments")
         
         # Step 3: Prepare script for AI voiceover
@@ -1,11 +1,19 @@
 import sys
 import os
 import re
+import argparse
 import logging
+import multiprocessing
+import tempfile
 from datetime import datetime
 import ffmpeg
 import numpy as np
 
+# A table row starting with two [HH:]MM:SS cells (From, To); the leading '|' is optional
+ROW_PATTERN = re.compile(
+    r'^\s*\|?\s*(?:(\d+):)?(\d+):(\d+)\s*\|\s*(?:(\d+):)?(\d+):(\d+)\s*\|'
+)
+
 def parse_timestamp(timestamp: str) -> int:
     """
     Convert MM:SS or HH:MM:SS format to seconds.
@@ -26,55 +34,112 @@ def parse_markdown_segments(md_file: str) -> list:
     Parse segment data from markdown table.
     """
     segments = []
+    in_table = False
     with open(md_file, 'r') as f:
-        lines = f.readlines()
-
-    # Skip until we find the table header
-    table_start = False
-    for line in lines:
-        if '| From | To |' in line:
-            table_start = True
-            continue
-        if table_start and '|---' in line:
-            continue
-        if table_start and '|' in line:
-            # Parse table row
-            parts = [x.strip() for x in line.split('|')]
-            if len(parts) >= 4:  # At least From, To, Duration columns
-                try:
-                    start_time = parse_timestamp(parts[1])
-                    end_time = parse_timestamp(parts[2])
-                    segments.append((start_time, end_time))
-                except ValueError as e:
-                    logging.warning(f"Skipping invalid row: {line.strip()} - {str(e)}")
+        # Read line by line; lines without a '|' (blank lines, notes) are skipped,
+        # so rows of later tables are still read
+        for line in f:
+            if '| From | To |' in line:
+                in_table = True
+                continue
+            if not in_table or '|---' in line or '|' not in line:
+                continue
+            match = ROW_PATTERN.match(line)
+            if match:
+                fh, fm, fs, th, tm, ts = (int(g or 0) for g in match.groups())
+                segments.append((fh * 3600 + fm * 60 + fs, th * 3600 + tm * 60 + ts))
+            else:
+                logging.warning(f"Skipping invalid row: {line.strip()}")
 
     return segments
 
-def extract_audio_segment(input_file: str, start_time: int, end_time: int, output_file: str) -> bool:
+def extract_audio_segment(input_file: str, start_time: int, end_time: int, output_file: str,
+                          reencode: bool = False) -> bool:
     """
     Extract segment from input audio file using ffmpeg.
+
+    MP3 input is cut with stream copy (no decode/encode, cut on MP3 frame
+    boundaries); pass reencode=True for sample-accurate cuts via libmp3lame.
     """
     try:
-        # Use ffmpeg-python to extract segment
+        # Use ffmpeg-python to extract segment; ss/t are input options so ffmpeg seeks before decoding
         stream = ffmpeg.input(input_file, ss=start_time, t=end_time-start_time)
-        stream = ffmpeg.output(stream, output_file, acodec='libmp3lame', loglevel='error')
+        if reencode or not str(input_file).lower().endswith('.mp3'):
+            # One thread per ffmpeg process; parallelism comes from running several at once
+            stream = ffmpeg.output(stream, output_file, acodec='libmp3lame', threads=1, loglevel='error')
+        else:
+            stream = ffmpeg.output(stream, output_file, c='copy', loglevel='error')
         ffmpeg.run(stream, overwrite_output=True)
         return True
     except Exception as e:
         logging.warning(f"Failed to extract segment {start_time}-{end_time}: {str(e)}")
         return False
 
+def extract_all_segments(input_file: str, segments: list, output_files: list,
+                         reencode: bool = False) -> int:
+    """
+    Extract all segments in a single ffmpeg pass using the segment muxer.
+
+    The input is split at every segment start/end point and the pieces that
+    correspond to the requested segments are kept; the gaps are discarded.
+    Segments must not overlap.
+
+    Returns the number of segments written.
+    """
+    ordered = sorted(zip(segments, output_files))
+    for ((_, prev_end), _), ((next_start, _), _) in zip(ordered, ordered[1:]):
+        if next_start < prev_end:
+            raise ValueError("Single-pass extraction requires non-overlapping segments")
+
+    cut_points = sorted({t for seg in segments for t in seg if t > 0})
+    # Piece k of the split covers [bounds[k], bounds[k + 1])
+    bounds = [0] + cut_points
+
+    output_dir = os.path.dirname(os.path.abspath(output_files[0]))
+    with tempfile.TemporaryDirectory(prefix="split_", dir=output_dir) as work_dir:
+        pattern = os.path.join(work_dir, "piece_%04d.mp3")
+        codec = {'acodec': 'libmp3lame'} if reencode else {'c': 'copy'}
+        stream = ffmpeg.input(input_file)
+        stream = ffmpeg.output(stream, pattern, f='segment',
+                               segment_times=','.join(str(t) for t in cut_points),
+                               reset_timestamps=1, loglevel='error', **codec)
+        ffmpeg.run(stream, overwrite_output=True)
+
+        written = 0
+        for (start, end), output_file in ordered:
+            piece = pattern % bounds.index(start)
+            if end > start and os.path.exists(piece):
+                os.replace(piece, output_file)
+                written += 1
+            else:
+                logging.warning(f"Failed to extract segment {start}-{end}: no matching piece")
+    return written
+
+def _extract_one(task: tuple) -> bool:
+    """
+    Pool worker: unpack an (input_file, start_time, end_time, output_file, reencode) task.
+    """
+    return extract_audio_segment(*task)
+
 def main() -> None:
     """
     Main function to extract audio segments from an input audio file based on a markdown file.
     """
-    if len(sys.argv) != 4:
-        logging.error("Usage: python extract_segments.py input.mp3 segments.md output_dir")
-        sys.exit(1)
-
-    audio_file = sys.argv[1]
-    md_file = sys.argv[2]
-    output_dir = sys.argv[3]
+    parser = argparse.ArgumentParser(description="Extract audio segments listed in a markdown report")
+    parser.add_argument("audio_file", help="Input audio file (MP3)")
+    parser.add_argument("md_file", help="Markdown report with a From/To segment table")
+    parser.add_argument("output_dir", help="Directory to save extracted segments")
+    parser.add_argument("--jobs", "--max-workers", dest="jobs", type=int, default=os.cpu_count(),
+                        help="Number of segments to extract in parallel")
+    parser.add_argument("--reencode", action="store_true",
+                        help="Re-encode segments with libmp3lame for sample-accurate cuts instead of stream copy")
+    parser.add_argument("--single-pass", action="store_true",
+                        help="Cut all segments in one ffmpeg run (segments must not overlap)")
+    args = parser.parse_args()
+
+    audio_file = args.audio_file
+    md_file = args.md_file
+    output_dir = args.output_dir
 
     if not os.path.exists(audio_file):
         logging.error(f"Audio file '{audio_file}' not found")
@@ -97,15 +162,22 @@ def main() -> None:
 
         logging.info(f"Found {len(segments)} segments")
 
-        # Extract audio segments
+        output_files = [os.path.join(output_dir, f"segment_{i:03d}.mp3") for i in range(1, len(segments) + 1)]
         success_count = 0
-        for i, (start, end) in enumerate(segments, 1):
-            duration = end - start
-            output_file = os.path.join(output_dir, f"segment_{i:03d}.mp3")
-            logging.info(f"Extracting segment {i}/{len(segments)} ({duration:.2f}s)...")
-
-            if extract_audio_segment(audio_file, start, end, output_file):
-                success_count += 1
+        if args.single_pass:
+            logging.info(f"Extracting {len(segments)} segments in a single pass...")
+            success_count = extract_all_segments(audio_file, segments, output_files, args.reencode)
+        else:
+            # Extract audio segments; each one is an independent ffmpeg process
+            tasks = [
+                (audio_file, start, end, output_file, args.reencode)
+                for (start, end), output_file in zip(segments, output_files)
+            ]
+            logging.info(f"Extracting {len(tasks)} segments with {args.jobs} parallel jobs...")
+            with multiprocessing.Pool(max(1, args.jobs)) as pool:
+                for success in pool.imap_unordered(_extract_one, tasks):
+                    if success:
+                        success_count += 1
 
         if success_count > 0:
             logging.info(f"Extracted {success_count} segments to {output_dir}")
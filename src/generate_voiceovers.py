@@ -1,14 +1,28 @@
 import os
 import re
 import json
+import shutil
+import hashlib
+import threading
 import requests
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 import markdown_parser  # You'll need to implement this or use a library
 
 # ElevenLabs API settings
 API_KEY = os.environ.get("ELEVENLABS_API_KEY")
 VOICE_ID = "21m00Tcm4TlvDq8ikWAM"  # Default voice ID, you can change this
+MODEL_ID = "eleven_monolingual_v1"
+
+# Generated voiceovers are cached by (voice, model, text) so repeated descriptions skip the API
+CACHE_DIR = Path(os.environ.get("VOICEOVER_CACHE_DIR", Path.home() / ".cache" / "video-audible" / "voiceovers"))
+
+# Segment blocks in the audio description markdown
+SEGMENT_PATTERN = re.compile(
+    r'## Segment (\d+)\n- Start: ([^\n]+)\n- End: ([^\n]+)\n- Duration: ([^\n]+)\n- Type: ([^\n]+)\n- Description: ([^\n]+)'
+)
 
 def extract_descriptions(markdown_file):
     """Extract segment descriptions from markdown file"""
@@ -17,10 +31,7 @@ def extract_descriptions(markdown_file):
     
     # Simple regex to extract segment info
     segments = []
-    pattern = r'## Segment (\d+)\n- Start: ([^\n]+)\n- End: ([^\n]+)\n- Duration: ([^\n]+)\n- Type: ([^\n]+)\n- Description: ([^\n]+)'
-    matches = re.finditer(pattern, content, re.MULTILINE)
-    
-    for match in matches:
+    for match in SEGMENT_PATTERN.finditer(content):
         segments.append({
             'segment_id': match.group(1),
             'description': match.group(6).strip()
@@ -28,8 +39,21 @@ def extract_descriptions(markdown_file):
     
     return segments
 
-def generate_voiceover(text, output_file, voice_id=VOICE_ID):
-    """Generate voiceover using ElevenLabs API"""
+def create_session(pool_size=16):
+    """Create a keep-alive HTTP session whose connection pool is shared across worker threads"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    return session
+
+def generate_voiceover(text, output_file, voice_id=VOICE_ID, cache_dir=CACHE_DIR, session=None):
+    """Generate voiceover using ElevenLabs API, reusing a cached result for identical text"""
+    key = hashlib.sha256(f"{voice_id}|{MODEL_ID}|{text}".encode("utf-8")).hexdigest()
+    cache_file = Path(cache_dir) / f"{key}.mp3" if cache_dir else None
+    if cache_file is not None and cache_file.exists():
+        shutil.copyfile(cache_file, output_file)
+        return True
+
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
     
     headers = {
@@ -40,18 +64,24 @@ def generate_voiceover(text, output_file, voice_id=VOICE_ID):
     
     data = {
         "text": text,
-        "model_id": "eleven_monolingual_v1",
+        "model_id": MODEL_ID,
         "voice_settings": {
             "stability": 0.5,
             "similarity_boost": 0.5
         }
     }
     
-    response = requests.post(url, json=data, headers=headers)
+    response = (session or requests).post(url, json=data, headers=headers)
     
     if response.status_code == 200:
         with open(output_file, 'wb') as f:
             f.write(response.content)
+        if cache_file is not None:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write via a per-thread temp file so concurrent workers never expose a partial MP3
+            tmp_file = cache_file.with_name(f"{cache_file.name}.{threading.get_ident()}.tmp")
+            shutil.copyfile(output_file, tmp_file)
+            os.replace(tmp_file, cache_file)
         return True
     else:
         print(f"Error: {response.status_code} - {response.text}")
@@ -61,6 +91,9 @@ def main():
     parser = argparse.ArgumentParser(description="Generate AI voiceovers from script")
     parser.add_argument("script_file", help="Path to voiceover script markdown file")
     parser.add_argument("--output-dir", default="voiceovers", help="Directory to save voiceovers")
+    parser.add_argument("--cache-dir", default=str(CACHE_DIR), help="Directory for cached voiceovers")
+    parser.add_argument("--no-cache", action="store_true", help="Always call the API, ignoring cached voiceovers")
+    parser.add_argument("--workers", type=int, default=8, help="Number of concurrent API requests")
     args = parser.parse_args()
     
     if not API_KEY:
@@ -74,15 +107,21 @@ def main():
     # Extract descriptions from markdown
     segments = extract_descriptions(args.script_file)
     
-    # Generate voiceovers
-    for segment in segments:
+    # Generate voiceovers; requests are network-bound, so several run concurrently
+    cache_dir = None if args.no_cache else args.cache_dir
+    workers = max(1, args.workers)
+    session = create_session(pool_size=workers)
+
+    def generate(segment):
         output_file = output_dir / f"voiceover_{segment['segment_id']}.mp3"
         print(f"Generating voiceover for segment {segment['segment_id']}...")
-        
-        if generate_voiceover(segment['description'], output_file):
+        if generate_voiceover(segment['description'], output_file, cache_dir=cache_dir, session=session):
             print(f"  Success! Saved to {output_file}")
         else:
             print(f"  Failed to generate voiceover for segment {segment['segment_id']}")
 
+    with session, ThreadPoolExecutor(max_workers=workers) as executor:
+        list(executor.map(generate, segments))
+
 if __name__ == "__main__":
     main()
\ No newline at end of file
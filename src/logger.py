@@ -1,8 +1,13 @@
+import os
 import logging
 
 def setup_logger(log_file: str = None):
     logger = logging.getLogger("VoiceDetection")
-    logger.setLevel(logging.DEBUG)
+    # INFO unless LOG_LEVEL says otherwise; messages below the level are never formatted
+    level = os.getenv("LOG_LEVEL", "INFO").upper()
+    # getLevelName maps a known level name to its number (and works before Python 3.11)
+    valid_level = isinstance(logging.getLevelName(level), int)
+    logger.setLevel(level if valid_level else logging.INFO)
 
     # Avoid duplicate handlers if setup_logger is called multiple times
     if not logger.handlers:
@@ -20,6 +25,10 @@ def setup_logger(log_file: str = None):
             fh.setFormatter(formatter)
             logger.addHandler(fh)
 
+        # Reported once, when the logger is first configured
+        if not valid_level:
+            logger.warning("Unknown LOG_LEVEL %r, using INFO", level)
+
     return logger
 
 # Create a module-level logger instance
@@ -1,20 +1,24 @@
 import sys
-from voice_detection import process_video
+import argparse
+from voice_detection import PCM_CACHE_DIR, process_video
 from logger import setup_logger
 
 log = setup_logger()
 
 def main():
-    if len(sys.argv) < 2:
-        log.error("Usage: python src/main.py <video_file.mp4>")
-        sys.exit(1)
-    
-    mp4_file = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Report non-voice segments of a video")
+    parser.add_argument("video_file", help="Input video file (MP4)")
+    parser.add_argument("--cache-dir", default=PCM_CACHE_DIR,
+                        help="Cache decoded audio in this directory (default: PCM_CACHE_DIR, or no caching)")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always decode the video, ignoring cached audio")
+    args = parser.parse_args()
+
     try:
-        process_video(mp4_file)
+        process_video(args.video_file, cache_dir=None if args.no_cache else args.cache_dir)
     except Exception as e:
         log.error("Processing failed: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
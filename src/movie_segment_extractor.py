@@ -1,7 +1,10 @@
 import os
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
 
 from .audio_pipeline import AudioPipeline
 from .detectors.base_detector import AudioSegment
@@ -23,7 +26,7 @@ class MovieSegmentExtractor:
         Returns:
             List of movie segments with start/end times
         """
-        logger.info(f"Analyzing audio file: {audio_path}")
+        logger.info("Analyzing audio file: %s", audio_path)
 
         # Extract audio data
         audio_data, sample_rate = self.pipeline.extract_audio(audio_path)
@@ -34,20 +37,15 @@ class MovieSegmentExtractor:
         # Identify movie segments (non-silence areas with either speech or music)
         movie_segments = []
 
-        # Get speech and music segments
-        # Filter out 'duration' field which is not accepted by AudioSegment constructor
-        def create_segment(seg_dict):
-            # Create a copy of the dictionary without the 'duration' field
-            filtered_dict = {k: v for k, v in seg_dict.items() if k != 'duration'}
-            return AudioSegment(**filtered_dict)
-
-        speech_segments = [create_segment(seg) for seg in results["speech"]]
-        music_segments = [create_segment(seg) for seg in results["music"]]
-        silence_segments = [create_segment(seg) for seg in results["silence"]]
-
-        # Combine speech and music segments
-        content_segments = speech_segments + music_segments
-        content_segments.sort(key=lambda x: x.start_time)
+        # Combine speech and music segments; start times are gathered into one array
+        # and argsorted once, and AudioSegments are only built in their final order
+        content = results["speech"] + results["music"]
+        starts = np.fromiter((seg["start_time"] for seg in content), dtype=np.float64, count=len(content))
+        ordered = [content[i] for i in np.argsort(starts, kind="stable").tolist()]
+        content_segments = [
+            AudioSegment(seg["start_time"], seg["end_time"], seg["label"], seg.get("confidence", 1.0))
+            for seg in ordered
+        ]
 
         # Merge adjacent content segments
         merged_segments = self.pipeline.silence_detector.merge_adjacent_segments(
@@ -66,14 +64,19 @@ class MovieSegmentExtractor:
 
         return movie_segments
 
-    def extract_segments(self, audio_path: str, segments: List[Dict[str, Any]], output_dir: str) -> List[str]:
+    def extract_segments(self, audio_path: str, segments: List[Dict[str, Any]], output_dir: str,
+                         max_workers: Optional[int] = None) -> List[str]:
         """
         Extract identified segments to separate files.
 
+        Each segment is cut by its own ffmpeg process, so several run at once;
+        threads are enough because the work happens in the subprocesses.
+
         Args:
             audio_path: Path to the audio file
             segments: List of segment dictionaries
             output_dir: Directory to save extracted segments
+            max_workers: Number of concurrent ffmpeg processes. Defaults to the CPU count.
 
         Returns:
             List of paths to extracted segment files
@@ -81,23 +84,24 @@ class MovieSegmentExtractor:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        extracted_files = []
+        # Use existing extraction function
+        from extract_segments import extract_audio_segment
+
+        output_files = [output_dir / f"segment_{i+1:03d}.mp3" for i in range(len(segments))]
 
-        for i, segment in enumerate(segments):
-            output_file = output_dir / f"segment_{i+1:03d}.mp3"
-
-            # Use existing extraction function
-            from extract_segments import extract_audio_segment
-            success = extract_audio_segment(
-                audio_path,
-                segment["start_time"],
-                segment["end_time"],
-                str(output_file)
-            )
-
-            if success:
-                extracted_files.append(str(output_file))
-                logger.info(f"Extracted segment {i+1}/{len(segments)} to {output_file}")
+        def extract(job):
+            segment, output_file = job
+            return extract_audio_segment(audio_path, segment["start_time"], segment["end_time"], str(output_file))
+
+        extracted_files = []
+        workers = max(1, max_workers or os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order, so the file list stays sorted
+            results = executor.map(extract, zip(segments, output_files))
+            for i, (output_file, success) in enumerate(zip(output_files, results)):
+                if success:
+                    extracted_files.append(str(output_file))
+                    logger.info("Extracted segment %d/%d to %s", i + 1, len(segments), output_file)
 
         return extracted_files
 
@@ -1,20 +1,34 @@
 import os
 import wave
+import queue
+import struct
+import hashlib
+import threading
 import contextlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Iterator, Optional, Tuple, Union
 
 import ffmpeg
-import torch
 import numpy as np
 from dotenv import load_dotenv
 
 from .logger import setup_logger
 from .config import Config
 
+# torch and the Silero helpers are imported where the VAD runs, so the ffmpeg and
+# report helpers can be used without paying for them
+if TYPE_CHECKING:
+    import torch
+
 # Load environment variables from .env file
 load_dotenv()
 
 logger = setup_logger()
 
+# Directory where src/main.py caches decoded PCM per input file, so reprocessing the
+# same video skips ffmpeg (unset or empty = no caching)
+PCM_CACHE_DIR = Path(os.environ["PCM_CACHE_DIR"]).expanduser() if os.environ.get("PCM_CACHE_DIR") else None
+
 def extract_audio(mp4_path: str, output_wav: str) -> None:
     """
     Extract audio from an MP4 file and save as mono WAV (default 16kHz).
@@ -32,14 +46,16 @@ def extract_audio(mp4_path: str, output_wav: str) -> None:
         (
             ffmpeg
             .input(mp4_path)
-            .output(output_wav, ac=1, ar=sample_rate, format='wav')
+            .output(output_wav, ac=1, ar=sample_rate, format='wav', vn=None, loglevel='error')
+            .global_args('-nostdin', '-nostats')
             .overwrite_output()
-            .run(capture_stdout=True, capture_stderr=True)
+            .run(capture_stderr=True)
         )
         logger.info("Audio extracted to %s", output_wav)
     except Exception as e:
         logger.error("Failed to extract audio: %s", e)
         raise
+
 def extract_lossless_audio(mp4_path: str, output_path: str, format: str = 'flac') -> None:
     """
     Extract original audio from MP4 and save as lossless FLAC or copy AAC without re-encoding.
@@ -58,15 +74,17 @@ def extract_lossless_audio(mp4_path: str, output_path: str, format: str = 'flac'
         logger.info("Extracting lossless audio from %s", mp4_path)
         stream = ffmpeg.input(mp4_path)
         if format == 'flac':
-            stream = stream.output(output_path, ac=1, ar=sample_rate, format='flac')
+            stream = stream.output(output_path, ac=1, ar=sample_rate, format='flac', vn=None, loglevel='error')
         elif format == 'aac':
-            stream = stream.output(output_path, acodec='copy', format='m4a')
+            stream = stream.output(output_path, acodec='copy', format='ipod', vn=None, loglevel='error')
         else:
             raise ValueError(f"Unsupported format: {format}")
+        # Only errors are logged, so the captured stderr stays small however long the input
         (
             stream
+            .global_args('-nostdin', '-nostats')
             .overwrite_output()
-            .run(capture_stdout=True, capture_stderr=True)
+            .run(capture_stderr=True)
         )
         logger.info("Lossless audio extracted to %s", output_path)
     except Exception as e:
@@ -74,137 +92,334 @@ def extract_lossless_audio(mp4_path: str, output_path: str, format: str = 'flac'
         raise
 
 
-def read_wave(path: str) -> Tuple[bytes, int]:
+def read_wave(path: str) -> Tuple[np.ndarray, int]:
     """
-    Read a mono WAV file.
+    Memory-map the PCM data of a mono 16-bit WAV file.
+
+    The samples are not read into memory up front; the returned array is a
+    read-only view of the file's data chunk, paged in as it is accessed.
 
     Args:
         path (str): Path to WAV file.
 
     Returns:
-        Tuple[bytes, int]: PCM audio data and sample rate.
+        Tuple[np.ndarray, int]: int16 PCM samples and sample rate.
 
     Raises:
-        AssertionError: If audio is not mono.
+        AssertionError: If audio is not mono 16-bit.
+        ValueError: If the file has no data chunk.
     """
     with contextlib.closing(wave.open(path, "rb")) as wf:
         num_channels = wf.getnchannels()
         assert num_channels == 1, "Audio must be mono"
-        _ = wf.getsampwidth()
+        assert wf.getsampwidth() == 2, "Audio must be 16-bit PCM"
         sample_rate = wf.getframerate()
-        pcm_data = wf.readframes(wf.getnframes())
-        return pcm_data, sample_rate
+        n_frames = wf.getnframes()
+
+    # Walk the RIFF chunks to find where the data chunk starts
+    with open(path, "rb") as f:
+        f.seek(12)
+        while True:
+            header = f.read(8)
+            if len(header) < 8:
+                raise ValueError(f"No data chunk in WAV file: {path}")
+            chunk_id, chunk_size = struct.unpack("<4sI", header)
+            if chunk_id == b"data":
+                data_offset = f.tell()
+                break
+            # Chunks are padded to an even number of bytes
+            f.seek(chunk_size + (chunk_size & 1), os.SEEK_CUR)
+
+    if n_frames == 0:
+        return np.zeros(0, dtype=np.int16), sample_rate
+    return np.memmap(path, dtype=np.int16, mode="r", offset=data_offset, shape=(n_frames,)), sample_rate
+
+def detect_voice(
+    audio: Union[bytes, np.ndarray], sample_rate: int, frame_duration_ms=30,
+    probabilities: Optional["torch.Tensor"] = None
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Uses Silero VAD to determine voice activity for each frame.
+    Accepts PCM bytes or an int16 array (e.g. the memory map from read_wave).
+    Window probabilities already computed by speech_probabilities (as in
+    detect_voice_streaming) are replayed instead of running the model.
+    Returns a pair of arrays: frame start times in seconds and a boolean
+    voice flag per frame.
+    """
+    import torch
+    from .detectors.speech_detector import (
+        SpeechDetector, _ProbabilityReplay, cached_speech_timestamps, load_silero_vad, speech_probabilities,
+        vad_device
+    )
+
+    # Silero VAD model and utils, shared with SpeechDetector and loaded once per process
+    device = vad_device()
+    model, utils = load_silero_vad(Config.SPEECH_VAD_ONNX, device)
+    get_speech_timestamps = utils[0]
+
+    # Convert PCM bytes to float32 tensor normalized to [-1,1], straight from int16
+    # into a single float32 buffer
+    pcm = audio if isinstance(audio, np.ndarray) else np.frombuffer(audio, dtype=np.int16)
+    audio_np = np.divide(pcm, np.float32(32768.0), dtype=np.float32)
+    audio_tensor = torch.from_numpy(audio_np)
+
+    def run_vad():
+        vad = model
+        if probabilities is not None:
+            vad = _ProbabilityReplay(probabilities)
+        # Long audio is scored in a batched pass; get_speech_timestamps then replays
+        # the probabilities instead of running the model window by window
+        elif device is not None or len(audio_tensor) > SpeechDetector.batch_chunk_seconds * sample_rate:
+            vad = _ProbabilityReplay(speech_probabilities(
+                model, audio_tensor, sample_rate, SpeechDetector.batch_chunk_seconds, device
+            ))
+        return get_speech_timestamps(audio_tensor, vad, sampling_rate=sample_rate)
 
-def frame_generator(frame_duration_ms: int, audio: bytes, sample_rate: int):
+    # Get speech segments as list of dicts with 'start' and 'end' sample indices
+    speech_timestamps = cached_speech_timestamps(np.ascontiguousarray(pcm), {"sampling_rate": sample_rate}, run_vad)
+
+    # Every full frame of the audio, as sample ranges
+    frame_len_samples = int(sample_rate * (frame_duration_ms / 1000.0))
+    start_samples = np.arange(len(audio_np) // frame_len_samples, dtype=np.int64) * frame_len_samples
+    end_samples = start_samples + frame_len_samples
+    start_times = start_samples / sample_rate
+
+    # A frame is speech if it overlaps a segment; segments are sorted and disjoint,
+    # so only the last segment starting at or before the frame's end can overlap it
+    is_speech = np.zeros(len(start_samples), dtype=bool)
+    if speech_timestamps:
+        seg_starts = np.array([seg['start'] for seg in speech_timestamps], dtype=np.int64)
+        seg_ends = np.array([seg['end'] for seg in speech_timestamps], dtype=np.int64)
+        index = np.searchsorted(seg_starts, end_samples, side='right') - 1
+        is_speech = (index >= 0) & (seg_ends[np.maximum(index, 0)] >= start_samples)
+
+    return start_times, is_speech
+
+def stream_pcm(mp4_path: str, chunk_samples: int) -> Iterator[np.ndarray]:
     """
-    Generate audio frames from PCM audio data.
+    Decode the audio of an MP4 file to mono 16-bit PCM in chunks, as ffmpeg produces it.
 
     Args:
-        frame_duration_ms (int): Frame size in milliseconds.
-        audio (bytes): PCM audio data.
-        sample_rate (int): Sample rate.
+        mp4_path (str): Path to input MP4 video.
+        chunk_samples (int): Samples per chunk; only the last chunk may be shorter.
 
     Yields:
-        Tuple[bytes, float]: Frame bytes and start time in seconds.
+        np.ndarray: int16 PCM chunk, a new array each time.
+
+    Raises:
+        RuntimeError: If ffmpeg fails to decode the file.
+    """
+    sample_rate = int(os.getenv('SAMPLE_RATE', '16000'))
+    process = (
+        ffmpeg
+        .input(mp4_path)
+        .output('pipe:', format='s16le', acodec='pcm_s16le', ac=1, ar=sample_rate, vn=None,
+                loglevel='error')
+        .global_args('-nostdin', '-nostats')
+        .run_async(pipe_stdout=True, pipe_stderr=True)
+    )
+    try:
+        while True:
+            chunk = np.empty(chunk_samples, dtype=np.int16)
+            view = memoryview(chunk).cast('B')
+            filled = 0
+            while filled < len(view):
+                count = process.stdout.readinto(view[filled:])
+                if not count:
+                    break
+                filled += count
+            if filled >= 2:
+                yield chunk[:filled // 2]
+            if filled < len(view):
+                break
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        process.wait()
+
+    if process.returncode != 0:
+        message = stderr.decode(errors='replace').strip()
+        logger.error("Failed to stream audio: %s", message)
+        raise RuntimeError(f"Failed to stream audio: {message}")
+
+
+def _pcm_cache_file(mp4_path: str, sample_rate: int, cache_dir: Union[str, Path]) -> Path:
     """
-    n = int(sample_rate * (frame_duration_ms / 1000.0) * 2)  # 2 bytes per sample (16-bit)
-    offset = 0
-    while offset + n < len(audio):
-        yield audio[offset:offset + n], offset / (sample_rate * 2)
-        offset += n
+    Cache file for the decoded PCM of a video.
 
-def detect_voice(audio: bytes, sample_rate: int, frame_duration_ms=30):
+    The key combines the file's size and modification time with a BLAKE2b
+    hash of its first and last 64 KB, so an edited file misses the cache
+    without hashing the whole video.
     """
-    Uses Silero VAD to determine voice activity for each frame.
-    Returns a list of tuples with (frame_start_time, voice_boolean).
+    stat = os.stat(mp4_path)
+    digest = hashlib.blake2b(f"{stat.st_size}|{stat.st_mtime_ns}".encode("utf-8"), digest_size=16)
+    with open(mp4_path, "rb") as f:
+        digest.update(f.read(1 << 16))
+        f.seek(max(0, stat.st_size - (1 << 16)))
+        digest.update(f.read(1 << 16))
+    return Path(cache_dir) / f"{digest.hexdigest()}_{sample_rate}.npy"
+
+
+def detect_voice_streaming(
+    mp4_path: str, frame_duration_ms=30, cache_dir: Optional[Union[str, Path]] = None
+) -> Tuple[np.ndarray, np.ndarray]:
     """
-    # Lazy load Silero VAD model and utils
-    if not hasattr(detect_voice, "model"):
-        detect_voice.model, utils = torch.hub.load(
-            repo_or_dir='snakers4/silero-vad',
-            model='silero_vad',
-            force_reload=False,
-            trust_repo=True  # Suppress warning about untrusted repo
-        )
-        (detect_voice.get_speech_timestamps,
-         _, _, _, _) = utils
+    Decode an MP4 file and run Silero VAD on it, overlapping the two.
 
-    # Convert PCM bytes to float32 tensor normalized to [-1,1]
-    audio_np = np.frombuffer(audio, dtype=np.int16).astype(np.float32) / 32768.0
-    audio_tensor = torch.from_numpy(audio_np)
+    A producer thread streams PCM chunks from ffmpeg into a queue while the
+    VAD scores whatever chunks have arrived in one batched pass, so decoding
+    and inference run side by side. Chunks line up with the rows of the
+    batched pass in detect_voice, so the result is the same as decoding
+    first and calling detect_voice on the whole audio.
 
-    # Get speech segments as list of dicts with 'start' and 'end' sample indices
-    speech_timestamps = detect_voice.get_speech_timestamps(audio_tensor, detect_voice.model, sampling_rate=sample_rate)
-
-    results = []
-    for frame, start_time in frame_generator(frame_duration_ms, audio, sample_rate):
-        frame_len_samples = int(sample_rate * (frame_duration_ms / 1000.0))
-        start_sample = int(start_time * sample_rate)
-        end_sample = start_sample + frame_len_samples
-
-        # Check if frame overlaps any speech segment
-        is_speech = False
-        for seg in speech_timestamps:
-            if end_sample < seg['start']:
-                break  # segments are sorted
-            if start_sample > seg['end']:
-                continue
-            # Overlaps
-            is_speech = True
-            break
+    With a cache_dir, the decoded PCM is saved there; a later run on the
+    same file memory-maps it and skips ffmpeg entirely.
+
+    Args:
+        mp4_path (str): Path to input MP4 video.
+        frame_duration_ms (int): Frame duration in milliseconds.
+        cache_dir (Optional[Union[str, Path]]): Directory for cached PCM, or None.
 
-        results.append((start_time, is_speech))
+    Returns:
+        Tuple[np.ndarray, np.ndarray]: Frame start times in seconds and a
+            boolean voice flag per frame, as returned by detect_voice.
+    """
+    import torch
+    from .detectors.speech_detector import SpeechDetector, load_silero_vad, speech_probabilities, vad_device
+
+    sample_rate = int(os.getenv('SAMPLE_RATE', '16000'))
+    cache_file = _pcm_cache_file(mp4_path, sample_rate, cache_dir) if cache_dir else None
+    if cache_file is not None and cache_file.exists():
+        logger.info("Using cached audio %s", cache_file)
+        return detect_voice(np.load(cache_file, mmap_mode='r'), sample_rate, frame_duration_ms)
+
+    window = 512 if sample_rate == 16000 else 256
+    chunk_samples = int(SpeechDetector.batch_chunk_seconds * sample_rate) // window * window
+
+    # Unbounded: every chunk is kept for the final pass anyway, and a backlog
+    # just means a bigger batch for the VAD
+    chunks: queue.Queue = queue.Queue()
+
+    def produce():
+        try:
+            for chunk in stream_pcm(mp4_path, chunk_samples):
+                chunks.put(chunk)
+        except Exception as e:
+            chunks.put(e)
+        chunks.put(None)
+
+    producer = threading.Thread(target=produce, daemon=True)
+    producer.start()
+
+    device = vad_device()
+    model, _ = load_silero_vad(Config.SPEECH_VAD_ONNX, device)
+    received, scores = [], []
+    done = False
+    while not done:
+        # Wait for the next chunk, then take every chunk already queued behind it
+        batch = [chunks.get()]
+        while not chunks.empty():
+            batch.append(chunks.get())
+        if batch[-1] is None:
+            done = True
+            batch.pop()
+        for item in batch:
+            if isinstance(item, Exception):
+                raise item
+        if not batch:
+            continue
+        received.extend(batch)
+        if done and len(received) == 1:
+            # Short audio fits in one chunk; detect_voice scores it directly
+            break
+        audio_tensor = torch.from_numpy(np.divide(np.concatenate(batch), np.float32(32768.0), dtype=np.float32))
+        scores.append(speech_probabilities(
+            model, audio_tensor, sample_rate, SpeechDetector.batch_chunk_seconds, device
+        ))
+    producer.join()
+
+    if not received:
+        return np.empty(0), np.empty(0, dtype=bool)
+    pcm = np.concatenate(received)
+    if cache_file is not None:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        # Write via a per-thread temp file so concurrent runs never load a partial array
+        tmp_file = cache_file.with_name(f"{cache_file.stem}.{os.getpid()}.{threading.get_ident()}.tmp.npy")
+        np.save(tmp_file, pcm)
+        os.replace(tmp_file, cache_file)
+    probabilities = torch.cat(scores) if scores else None
+    return detect_voice(pcm, sample_rate, frame_duration_ms, probabilities=probabilities)
 
-    return results
 
 def group_silence_frames(
-    vad_results: list, frame_duration_ms: int = 30
-) -> list:
+    vad_results: Tuple[np.ndarray, np.ndarray], frame_duration_ms: int = 30
+) -> np.ndarray:
     """
     Group consecutive frames with no speech into silence segments.
 
     Args:
-        vad_results (list): List of tuples (start_time_seconds, is_speech).
+        vad_results (Tuple[np.ndarray, np.ndarray]): Frame start times in seconds
+            and per-frame speech flags, as returned by detect_voice.
         frame_duration_ms (int): Frame duration in milliseconds.
 
     Returns:
-        list: List of (start_time, end_time) silence segments.
+        np.ndarray: (n, 2) array of (start_time, end_time) silence segments.
     """
-    silence_segments = []
-    segment_start = None
+    return group_and_filter_silence(vad_results, 0.0, frame_duration_ms)
 
-    for start_time, is_speech in vad_results:
-        if not is_speech:
-            if segment_start is None:
-                segment_start = start_time
-        else:
-            if segment_start is not None:
-                end_time = start_time
-                silence_segments.append((segment_start, end_time))
-                segment_start = None
 
-    # If file ends on silence
-    if segment_start is not None:
-        last_time = vad_results[-1][0] + frame_duration_ms / 1000.0
-        silence_segments.append((segment_start, last_time))
+def group_and_filter_silence(
+    vad_results: Tuple[np.ndarray, np.ndarray], threshold: float, frame_duration_ms: int = 30
+) -> np.ndarray:
+    """
+    Group silent frames into segments and keep those at least threshold long.
+
+    Equivalent to filter_by_duration(group_silence_frames(...), threshold), but
+    short runs are dropped by index before any segment array is built.
+
+    Args:
+        vad_results (Tuple[np.ndarray, np.ndarray]): Frame start times in seconds
+            and per-frame speech flags, as returned by detect_voice.
+        threshold (float): Minimum duration in seconds.
+        frame_duration_ms (int): Frame duration in milliseconds.
+
+    Returns:
+        np.ndarray: (m, 2) array of (start_time, end_time) silence segments.
+    """
+    start_times = np.asarray(vad_results[0], dtype=np.float64)
+    silent = ~np.asarray(vad_results[1], dtype=bool)
+    if start_times.size == 0:
+        return np.empty((0, 2))
+
+    # Runs of silent frames; a run ends where the next speech frame starts, or
+    # one frame after the last frame if the file ends on silence
+    edges = np.diff(silent.astype(np.int8), prepend=0, append=0)
+    run_starts = np.flatnonzero(edges == 1)
+    run_ends = np.flatnonzero(edges == -1)
+    end_times = np.append(start_times, start_times[-1] + frame_duration_ms / 1000.0)
 
-    return silence_segments
+    starts = start_times[run_starts]
+    ends = end_times[run_ends]
+    keep = ends - starts >= threshold
+    return np.column_stack((starts[keep], ends[keep]))
 
 
 def filter_by_duration(
-    segments: list, threshold: float
-) -> list:
+    segments: np.ndarray, threshold: float
+) -> np.ndarray:
     """
     Filter segments shorter than a duration threshold.
 
     Args:
-        segments (list): List of (start_time, end_time) tuples.
+        segments (np.ndarray): (n, 2) array (or list) of (start_time, end_time) pairs.
         threshold (float): Minimum duration in seconds.
 
     Returns:
-        list: Filtered list of segments.
+        np.ndarray: (m, 2) array of the segments that are long enough.
     """
-    return [seg for seg in segments if (seg[1] - seg[0]) >= threshold]
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2)
+    return segments[segments[:, 1] - segments[:, 0] >= threshold]
 
 
 def seconds_to_mmss(seconds: float) -> str:
@@ -221,14 +436,28 @@ def seconds_to_mmss(seconds: float) -> str:
     return f"{m:02d}:{s:02d}"
 
 
+def seconds_to_mmss_array(seconds: np.ndarray) -> np.ndarray:
+    """
+    Convert an array of times to MM:SS strings, as seconds_to_mmss does for one.
+
+    Args:
+        seconds (np.ndarray): Times in seconds (non-negative).
+
+    Returns:
+        np.ndarray: String array of the same shape, formatted as MM:SS.
+    """
+    minutes, secs = np.divmod(np.asarray(seconds).astype(np.int64), 60)
+    return np.char.add(np.char.add(np.char.mod("%02d", minutes), ":"), np.char.mod("%02d", secs))
+
+
 def generate_markdown_report(
-    segments: list, output_md: str
+    segments: np.ndarray, output_md: str
 ) -> None:
     """
     Create a Markdown report listing non-voice segments.
 
     Args:
-        segments (list): List of (start_time, end_time) tuples.
+        segments (np.ndarray): (n, 2) array (or list) of (start_time, end_time) pairs.
         output_md (str): Path to output Markdown file.
 
     Raises:
@@ -236,13 +465,22 @@ def generate_markdown_report(
     """
     try:
         logger.info("Generating Markdown report: %s", output_md)
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 2)
+        # MM:SS fields for all timestamps at once
+        times = seconds_to_mmss_array(segments)
+        durations = segments[:, 1] - segments[:, 0]
+        rows = "".join(
+            "| %s | %s | %.2f |\n" % row
+            for row in zip(times[:, 0].tolist(), times[:, 1].tolist(), durations.tolist())
+        )
+        # The whole report is assembled in memory and written at once
         with open(output_md, "w") as md:
-            md.write("# Non-Voice Segments Report\n\n")
-            md.write("| From | To | Duration (s) |\n")
-            md.write("|-------|-------|--------------|\n")
-            for start, end in segments:
-                duration = end - start
-                md.write(f"| {seconds_to_mmss(start)} | {seconds_to_mmss(end)} | {duration:.2f} |\n")
+            md.write(
+                "# Non-Voice Segments Report\n\n"
+                "| From | To | Duration (s) |\n"
+                "|-------|-------|--------------|\n"
+                + rows
+            )
         logger.info("Report generated successfully.")
     except Exception as e:
         logger.error("Error generating report: %s", e)
@@ -250,7 +488,7 @@ def generate_markdown_report(
 
 
 def process_video(
-    mp4_path: str, output_dir: str = "audio", keep_temp_wav: bool = False
+    mp4_path: str, output_dir: str = "audio", cache_dir: Optional[Union[str, Path]] = None
 ) -> None:
     """
     Process a video file: extract audio, detect silence, and generate report.
@@ -258,56 +496,43 @@ def process_video(
     Args:
         mp4_path (str): Path to input MP4 video.
         output_dir (str): Directory to save outputs.
-        keep_temp_wav (bool): Whether to keep intermediate WAV file.
+        cache_dir (Optional[Union[str, Path]]): Directory for cached decoded audio,
+            e.g. PCM_CACHE_DIR; None (the default) always decodes the video and
+            writes nothing.
     """
     logger.debug("Received mp4_path argument: %s", mp4_path)
     import os
     import pathlib
 
+    # pathlib handles the platform's separators, drive letters and UNC shares. On
+    # POSIX, a backslash path that names no existing file is read as a Windows path
+    given_path = mp4_path
+    if os.sep != '\\' and '\\' in mp4_path and not os.path.exists(mp4_path):
+        mp4_path = pathlib.PureWindowsPath(mp4_path).as_posix()
+        logger.warning("%s does not exist; reading it as a Windows path: %s", given_path, mp4_path)
+    video_path = pathlib.Path(mp4_path).resolve()
+    mp4_path = str(video_path)
+    logger.debug("Normalized mp4_path: %s", mp4_path)
+
     # Define output directory and ensure it exists
     audio_dir = pathlib.Path(output_dir)
     audio_dir.mkdir(parents=True, exist_ok=True)
 
-    # Get base name of the video file (without extension)
-    video_stem = pathlib.Path(mp4_path).stem
-
-    # Define output file paths using the video stem
-    temp_wav = audio_dir / f"{video_stem}.wav"
-    output_md = audio_dir / f"{video_stem}_report.md"
-    # Handle Windows paths correctly
-    parts = []
-    path_remainder = mp4_path
-    
-    # Handle drive letter specially
-    if ':' in path_remainder:
-        drive, path_remainder = path_remainder.split(':', 1)
-        parts.append(drive + ':')
-    
-    # Split remaining path and filter empty parts
-    parts.extend(p for p in path_remainder.split('\\') if p)
-    
-    # Rejoin with proper separators
-    mp4_path = os.path.join(*parts)
-    mp4_path = os.path.normpath(mp4_path)
-    logger.debug("Normalized mp4_path: %s", mp4_path)
+    # Define output file path using the base name of the video file (without extension)
+    output_md = audio_dir / f"{video_path.stem}_report.md"
     try:
         if not os.path.isfile(mp4_path):
-            logger.error("Input video file does not exist: %s", mp4_path)
-            raise FileNotFoundError(f"Input video file not found: {mp4_path}")
+            # Name the path as given too, when it was rewritten above
+            shown = mp4_path if given_path == mp4_path else f"{mp4_path} (given as {given_path})"
+            logger.error("Input video file does not exist: %s", shown)
+            raise FileNotFoundError(f"Input video file not found: {shown}")
 
-        extract_audio(mp4_path, str(temp_wav))
-        audio, sample_rate = read_wave(str(temp_wav))
+        logger.info("Extracting audio from %s", mp4_path)
         logger.info("Starting voice detection...")
-        vad_results = detect_voice(audio, sample_rate)
-        silence_segments = group_silence_frames(vad_results)
-        filtered_segments = filter_by_duration(silence_segments, float(os.getenv('NON_VOICE_DURATION_THRESHOLD')))
+        vad_results = detect_voice_streaming(mp4_path, cache_dir=cache_dir)
+        filtered_segments = group_and_filter_silence(vad_results, float(os.getenv('NON_VOICE_DURATION_THRESHOLD')))
         generate_markdown_report(filtered_segments, str(output_md))
         logger.info("Process completed. Check %s for the report.", str(output_md))
     except Exception as err:
         logger.error("An error occurred: %s", err)
         raise
-    finally:
-        # Cleanup temporary WAV file if keep_temp_wav is False
-        if not keep_temp_wav and temp_wav.exists():
-            os.remove(temp_wav)
-            logger.info("Temporary file %s removed.", str(temp_wav))
\ No newline at end of file
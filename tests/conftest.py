@@ -1,6 +1,6 @@
 import pytest
+from functools import lru_cache
 import numpy as np
-import torch
 from src.detectors.base_detector import AudioSegment
 from src.config import Config
 
@@ -11,15 +11,54 @@ def sample_audio_data():
     samples = np.zeros(int(Config.SAMPLE_RATE * duration_seconds), dtype=np.int16)
     return samples.tobytes()
 
+def pytest_collection_modifyitems(items):
+    # Keep each module on one worker under pytest -n auto --dist=loadgroup, so its
+    # module-scoped fixtures are built once
+    for item in items:
+        item.add_marker(pytest.mark.xdist_group(name=item.module.__name__))
+
+@lru_cache(maxsize=None)
+def _silent_pcm(n_samples):
+    """Zero int16 PCM bytes; bytes are immutable, so tests can share one buffer per length"""
+    return bytes(2 * n_samples)
+
+@pytest.fixture
+def silent_pcm():
+    """Factory fixture returning cached silent PCM bytes of the given duration"""
+    def _create_audio(duration_seconds=1.0):
+        return _silent_pcm(int(Config.SAMPLE_RATE * duration_seconds))
+    return _create_audio
+
+@pytest.fixture(scope="module")
+def shared_detector(request):
+    """One detector per test module, built from the module's DETECTOR_CLASS"""
+    return request.module.DETECTOR_CLASS()
+
+@pytest.fixture
+def detector(shared_detector):
+    """The module's shared detector; attributes a test changes are undone afterwards"""
+    state = dict(vars(shared_detector))
+    yield shared_detector
+    vars(shared_detector).clear()
+    vars(shared_detector).update(state)
+
 @pytest.fixture
 def sample_audio_segment():
     """Create a sample AudioSegment for testing"""
     return AudioSegment(1.0, 2.0, "test", 0.8)
 
 @pytest.fixture
-def sample_tensor():
-    """Create a sample audio tensor for testing"""
-    return torch.zeros(1000, dtype=torch.float32)
+def sample_array():
+    """Create a sample float32 audio array for testing"""
+    return np.zeros(1000, dtype=np.float32)
+
+@pytest.fixture
+def as_tensor():
+    """Convert an array to a torch tensor, for the tests that really need torch"""
+    def _as_tensor(array):
+        import torch
+        return torch.from_numpy(np.asarray(array))
+    return _as_tensor
 
 @pytest.fixture
 def create_test_audio():
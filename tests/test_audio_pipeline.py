@@ -1,7 +1,12 @@
 import os
+import shutil
+import numpy as np
 import pytest
+import soundfile as sf
 from pathlib import Path
+from unittest.mock import patch
 from src.audio_pipeline import AudioPipeline
+from src.config import Config
 
 def test_extract_audio_to_file(tmp_path):
     # Create test pipeline
@@ -20,4 +25,37 @@ def test_extract_audio_to_file(tmp_path):
     
     # Verify output file exists and has content
     assert output_path.exists()
-    assert output_path.stat().st_size > 0
\ No newline at end of file
+    assert output_path.stat().st_size > 0
+
+def test_iter_chunks_reassembles_audio(tmp_path):
+    if shutil.which("ffmpeg") is None:
+        pytest.skip("ffmpeg not available")
+
+    samples = np.random.default_rng(0).integers(-20000, 20000, int(Config.SAMPLE_RATE * 2.3)).astype(np.int16)
+    wav_path = tmp_path / "input.wav"
+    sf.write(str(wav_path), samples, Config.SAMPLE_RATE, subtype="PCM_16")
+
+    pipeline = AudioPipeline()
+    chunks = [
+        (chunk.copy(), offset)  # chunks share one buffer and must be copied to be kept
+        for chunk, offset in pipeline.iter_chunks(str(wav_path), chunk_seconds=0.5, overlap_seconds=0.1)
+    ]
+
+    assert len(chunks) == 5
+    for chunk, offset in chunks:
+        start = int(round(offset * Config.SAMPLE_RATE))
+        np.testing.assert_array_equal(chunk, samples[start:start + len(chunk)])
+    assert chunks[1][1] == pytest.approx(0.4)
+    assert int(round(chunks[-1][1] * Config.SAMPLE_RATE)) + len(chunks[-1][0]) == len(samples)
+    assert all(len(chunk) == 0.6 * Config.SAMPLE_RATE for chunk, _ in chunks[1:-1])
+    assert len(chunks[0][0]) == 0.5 * Config.SAMPLE_RATE
+
+def test_torch_threads_capped_only_for_torch_detectors():
+    with patch('torch.set_num_threads') as set_num_threads:
+        pipeline = AudioPipeline(workers=4, executor="thread")
+        pipeline.silence_detector
+        set_num_threads.assert_not_called()
+
+        with patch('src.detectors.music_detector.MusicDetector'):
+            pipeline.music_detector
+        set_num_threads.assert_called_once_with(1)
@@ -32,11 +32,6 @@ class TestBackgroundDetector:
     def detector(self):
         return BackgroundDetector()
 
-    def create_audio_data(self, duration_seconds=1.0):
-        """Helper to create test audio data"""
-        samples = np.zeros(int(Config.SAMPLE_RATE * duration_seconds), dtype=np.int16)
-        return samples.tobytes()
-
     def test_calculate_background_features(self, detector, mock_librosa):
         audio_tensor = torch.zeros(1000, dtype=torch.float32)
         confidence = detector._calculate_background_features(audio_tensor)
@@ -59,31 +54,31 @@ class TestBackgroundDetector:
         # With all features at maximum and weights [0.3, 0.3, 0.4]
         assert confidence == pytest.approx(1.0)
 
-    def test_high_confidence_background_detection(self, detector, mock_librosa):
+    def test_high_confidence_background_detection(self, detector, mock_librosa, silent_pcm):
         # Mock characteristics of typical background noise
         mock_librosa['flatness'].return_value = np.array([0.8])  # High flatness
         mock_librosa['bandwidth'].return_value = np.array([Config.SAMPLE_RATE / 5])  # Wide bandwidth
         mock_librosa['rms'].return_value = np.array([[0.5, 0.51, 0.49]])  # Very stable
         
-        audio_data = self.create_audio_data(2.0)
+        audio_data = silent_pcm(2.0)
         segments = detector.detect(audio_data)
         
         assert len(segments) > 0
         assert all(segment.label == "background" for segment in segments)
         assert all(segment.confidence > detector.threshold for segment in segments)
 
-    def test_low_confidence_no_detection(self, detector, mock_librosa):
+    def test_low_confidence_no_detection(self, detector, mock_librosa, silent_pcm):
         # Mock characteristics unlike background noise
         mock_librosa['flatness'].return_value = np.array([0.1])  # Low flatness
         mock_librosa['bandwidth'].return_value = np.array([Config.SAMPLE_RATE / 20])  # Narrow bandwidth
         mock_librosa['rms'].return_value = np.array([[0.1, 0.9, 0.1]])  # Unstable
         
-        audio_data = self.create_audio_data()
+        audio_data = silent_pcm()
         segments = detector.detect(audio_data)
         
         assert len(segments) == 0  # Should not detect background
 
-    def test_minimum_duration_filter(self, detector, mock_librosa):
+    def test_minimum_duration_filter(self, detector, mock_librosa, silent_pcm):
         # Mock medium-high confidence values
         mock_librosa['flatness'].return_value = np.array([0.7])
         mock_librosa['bandwidth'].return_value = np.array([Config.SAMPLE_RATE / 6])
@@ -91,7 +86,7 @@ class TestBackgroundDetector:
         
         # Create audio shorter than minimum duration
         short_duration = Config.MIN_BACKGROUND_DURATION / 2
-        audio_data = self.create_audio_data(short_duration)
+        audio_data = silent_pcm(short_duration)
         segments = detector.detect(audio_data)
         
         assert len(segments) == 0  # Should be filtered out
@@ -115,14 +110,50 @@ class TestBackgroundDetector:
         
         assert stable_confidence > unstable_confidence
 
-    def test_merge_adjacent_segments(self, detector, mock_librosa):
+    def test_temporal_stability_from_rms_spread(self, detector, mock_librosa):
+        # Stability is 1 - 10 * std of the frame's 480-point RMS columns, in full-scale units
+        mock_librosa['flatness'].return_value = np.array([0.5])
+        mock_librosa['bandwidth'].return_value = np.array([Config.SAMPLE_RATE / 8])
+        mock_librosa['rms'].return_value = np.array([[0.50, 0.52]])  # std 0.01 -> stability 0.9
+        frame = np.zeros(detector._frame_samples)
+
+        expected = 0.3 * 0.5 + 0.3 * 0.5 + 0.4 * 0.9
+        assert detector._calculate_frame_confidences(frame, 1)[0] == pytest.approx(expected)
+
+        # Raw int16 values give the same score once their RMS is divided by full scale
+        mock_librosa['rms'].return_value = np.array([[0.50, 0.52]]) * 32767
+        assert detector._calculate_frame_confidences(frame, 1, 32767.0)[0] == pytest.approx(expected)
+
+    def test_int16_values_score_like_normalized_samples(self, detector):
+        n_frames = 20
+        rng = np.random.default_rng(0)
+        normalized = rng.normal(0, 0.1, n_frames * detector._frame_samples)
+        raw = np.round(normalized * 32767)
+
+        np.testing.assert_allclose(
+            detector._calculate_frame_confidences(raw, n_frames, 32767.0),
+            detector._calculate_frame_confidences(normalized, n_frames),
+            atol=1e-3
+        )
+
+    def test_steady_noise_detected_as_background(self, detector):
+        # Steady white noise at -20 dBFS: flat, wide and stable
+        rng = np.random.default_rng(0)
+        noise = np.round(rng.normal(0, 0.1, 3 * Config.SAMPLE_RATE) * 32767).astype(np.int16)
+
+        segments = detector.detect(noise)
+
+        assert [(seg.start_time, seg.end_time) for seg in segments] == [(0.0, pytest.approx(3.0))]
+        assert segments[0].confidence == pytest.approx(0.72, abs=0.02)
+
+    def test_merge_adjacent_segments(self, detector, mock_librosa, silent_pcm):
         # Mock consistent medium-high confidence
         mock_librosa['flatness'].return_value = np.array([0.7])
         mock_librosa['bandwidth'].return_value = np.array([Config.SAMPLE_RATE / 6])
         mock_librosa['rms'].return_value = np.array([[0.5, 0.52, 0.51]])
         
         # Create audio long enough for multiple segments
-        audio_data = self.create_audio_data(3.0)
+        audio_data = silent_pcm(3.0)
         segments = detector.detect(audio_data)
         
         if len(segments) >= 2:
@@ -131,7 +162,7 @@ class TestBackgroundDetector:
                 gap = segments[i + 1].start_time - segments[i].end_time
                 assert gap > Config.GAP_MERGE_THRESHOLD
 
-    def test_confidence_rolling_average(self, detector, mock_librosa):
+    def test_confidence_rolling_average(self, detector, mock_librosa, silent_pcm):
         # Mock changing confidence values
         confidences = [0.6, 0.7, 0.8]  # Increasing confidence
         mock_calls = 0
@@ -146,7 +177,7 @@ class TestBackgroundDetector:
             
         mock_librosa['flatness'].side_effect = varying_flatness
         
-        audio_data = self.create_audio_data(1.0)
+        audio_data = silent_pcm(1.0)
         segments = detector.detect(audio_data)
         
         if len(segments) > 0:
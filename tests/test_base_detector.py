@@ -1,7 +1,7 @@
 import pytest
 import numpy as np
 import torch
-from src.detectors.base_detector import AudioSegment, BaseDetector
+from src.detectors.base_detector import AudioSegment, BaseDetector, SegmentArray, _round3
 from src.config import Config
 
 class TestAudioSegment:
@@ -27,6 +27,23 @@ class TestAudioSegment:
         }
         assert segment.to_dict() == expected
 
+class TestRound3:
+    # Exact binary ties (0.0625 = 125/2000) and decimal near-ties that value * 1000 rounds the wrong way
+    @pytest.mark.parametrize("value", [
+        0.0625, 0.1875, 0.3125, 0.4375, -0.0625, -0.1875,
+        0.0005, 0.0015, 0.2345, 1.0005, 1.2345, 2.675, -2.675, 0.0, 1.0,
+    ])
+    def test_matches_builtin_round_on_ties(self, value):
+        assert _round3(value) == round(value, 3)
+        # The plain Python version too, when numba compiled the other one
+        assert getattr(_round3, "py_func", _round3)(value) == round(value, 3)
+
+    def test_matches_builtin_round_near_every_tie(self):
+        ties = (np.arange(-2000, 2000) + 0.5) / 1000
+        values = np.concatenate([ties, np.nextafter(ties, np.inf), np.nextafter(ties, -np.inf)])
+        for value in values.tolist():
+            assert _round3(value) == round(value, 3), value
+
 class MockDetector(BaseDetector):
     def __init__(self):
         super().__init__()
@@ -38,6 +55,7 @@ class MockDetector(BaseDetector):
 
     def _detect(self, audio):
         self._detect_called = True
+        self._last_audio = audio
         return self._mock_segments
 
 class TestBaseDetector:
@@ -75,6 +93,18 @@ class TestBaseDetector:
         # Verify first timestamp starts at 0
         assert timestamps[0] == 0.0
 
+    def test_frame_array_generator_matches_frame_generator(self, detector):
+        audio_data = np.arange(int(0.1 * Config.SAMPLE_RATE), dtype=np.int16).tobytes()
+        samples = detector._bytes_to_array(audio_data)
+
+        byte_frames = list(detector.frame_generator(audio_data))
+        array_frames = list(detector.frame_array_generator(samples))
+
+        assert [t for _, t in array_frames] == [t for _, t in byte_frames]
+        for (frame, _), (byte_frame, _) in zip(array_frames, byte_frames):
+            assert np.shares_memory(frame, samples)
+            assert np.array_equal(frame, detector._bytes_to_array(byte_frame))
+
     def test_frame_generator_empty_audio(self, detector):
         frames = list(detector.frame_generator(bytes()))
         assert len(frames) == 0
@@ -89,17 +119,18 @@ class TestBaseDetector:
     def test_merge_adjacent_segments(self, detector):
         segments = [
             AudioSegment(0.0, 1.0, "speech", 0.8),
-            AudioSegment(1.3, 2.0, "speech", 0.9),  # Should not merge (gap > 0.5)
+            AudioSegment(1.3, 2.0, "speech", 0.9),  # Should not merge (gap > 0.2)
             AudioSegment(2.0, 3.0, "speech", 0.7),  # Should merge with previous
         ]
         
-        merged = detector.merge_adjacent_segments(segments, gap_threshold=0.5)
+        merged = detector.merge_adjacent_segments(segments, gap_threshold=0.2)
         assert len(merged) == 2
         assert merged[0].start_time == 0.0
         assert merged[0].end_time == 1.0
         assert merged[1].start_time == 1.3
         assert merged[1].end_time == 3.0
-        assert merged[1].confidence == 0.8  # Average of 0.9 and 0.7
+        # Duration-weighted average of 0.9 (0.7s) and 0.7 (1.0s)
+        assert merged[1].confidence == pytest.approx(0.782)
 
     def test_merge_adjacent_segments_empty_list(self, detector):
         assert detector.merge_adjacent_segments([]) == []
@@ -142,4 +173,113 @@ class TestBaseDetector:
     def test_abstract_detect_method(self):
         # Verify that instantiating BaseDetector directly raises TypeError
         with pytest.raises(TypeError):
-            BaseDetector()
\ No newline at end of file
+            BaseDetector()
+
+    def test_detect_stream_offsets_and_stitches_chunks(self, detector):
+        detector.set_mock_segments([AudioSegment(0.5, 2.0, "test", 0.8)])
+        audio_data = np.zeros(1000, dtype=np.int16)
+
+        # Second chunk overlaps the first, so its segment continues the first one
+        merged = detector.detect_stream([(audio_data, 0.0), (audio_data, 1.0), (audio_data, 10.0)])
+
+        assert len(merged) == 2
+        assert merged[0].start_time == 0.5
+        assert merged[0].end_time == 3.0
+        assert merged[1].start_time == 10.5
+        assert merged[1].end_time == 12.0
+
+    def test_detect_stream_counts_overlap_once_and_filters_after_stitching(self, detector):
+        results = iter([
+            [AudioSegment(0.4, 1.0, "test", 0.6)],
+            [AudioSegment(0.0, 0.5, "test", 0.9)],  # starts inside the 0.1 s overlap
+        ])
+        detector._detect = lambda audio: next(results)
+        detector.min_duration = 0.9
+        second = np.zeros(Config.SAMPLE_RATE, dtype=np.int16)
+
+        # Neither chunk's piece reaches min_duration on its own
+        merged = detector.detect_stream([(second, 0.0), (second, 0.9)])
+
+        assert len(merged) == 1
+        assert merged[0].start_time == 0.4
+        assert merged[0].end_time == pytest.approx(1.4)
+        # The second piece is clipped to 1.0-1.4, so the overlap is weighted once
+        assert merged[0].confidence == pytest.approx((0.6 * 0.6 + 0.4 * 0.9) / 1.0)
+
+    def test_detect_stream_disabled(self, detector):
+        detector.set_mock_segments([AudioSegment(0.0, 1.0, "test", 0.8)])
+        detector.enabled = False
+        assert detector.detect_stream([(np.zeros(1000, dtype=np.int16), 0.0)]) == []
+
+    def test_detect_arrays_matches_to_dict(self, detector):
+        mock_segments = [AudioSegment(0.0, 1.5, "segment", 0.8), AudioSegment(3.0, 4.0, "segment", 0.6)]
+        detector.set_mock_segments(mock_segments)
+
+        segments = detector.detect_arrays(np.zeros(1000, dtype=np.int16))
+
+        assert isinstance(segments, SegmentArray)
+        assert len(segments) == 2
+        assert segments.start_times.tolist() == [0.0, 3.0]
+        assert segments.end_times.tolist() == [1.5, 4.0]
+        assert segments.confidences.tolist() == [0.8, 0.6]
+        assert segments.duration().tolist() == [1.5, 1.0]
+        assert segments.to_dict_list() == [seg.to_dict() for seg in mock_segments]
+        assert [seg.to_dict() for seg in segments] == [seg.to_dict() for seg in mock_segments]
+
+    def test_segments_from_confidences(self, detector):
+        frame = Config.FRAME_DURATION_MS / 1000
+        confidences = np.array([0.9, 0.7, 0.2, 0.8, 0.6, 0.6, 0.1])
+
+        segments = detector._segments_from_confidences(confidences, "test", threshold=0.5, min_duration=0.0)
+
+        assert [(seg.start_time, seg.end_time) for seg in segments] == [
+            (0.0, pytest.approx(2 * frame)),
+            (pytest.approx(3 * frame), pytest.approx(6 * frame)),
+        ]
+        # Rolling average frame by frame: (0.8 + 0.6) / 2 = 0.7, then (0.7 + 0.6) / 2
+        assert segments[0].confidence == pytest.approx(0.8)
+        assert segments[1].confidence == pytest.approx(0.65)
+        assert all(seg.label == "test" for seg in segments)
+
+        # Runs shorter than the minimum duration are dropped
+        long_only = detector._segments_from_confidences(confidences, "test", threshold=0.5, min_duration=2.5 * frame)
+        assert len(long_only) == 1
+
+    def test_detect_zero_fills_inactive_frames(self, detector):
+        n = detector._frame_samples
+        audio = np.full(3 * n + 5, 1000, dtype=np.int16)
+
+        detector.detect(audio, active_mask=np.array([True, False, True]))
+
+        received = np.frombuffer(detector._last_audio, dtype=np.int16)
+        assert len(received) == len(audio)
+        assert np.all(received[n:2 * n] == 0)
+        assert np.all(received[:n] == 1000)
+        assert np.all(received[2 * n:] == 1000)
+
+    def test_detect_passes_int16_arrays_without_copy(self, detector):
+        audio = np.arange(1000, dtype=np.int16)
+
+        detector.detect(audio)
+
+        received = np.frombuffer(detector._last_audio, dtype=np.int16)
+        assert np.shares_memory(received, audio)
+        assert np.array_equal(received, audio)
+
+    def test_detect_converts_float_arrays_to_pcm(self, detector):
+        audio = np.array([0.0, 0.5, -1.0, 1.5], dtype=np.float32)
+
+        detector.detect(audio)
+
+        received = np.frombuffer(detector._last_audio, dtype=np.int16)
+        assert received.tolist() == [0, 16384, -32767, 32767]
+
+    def test_segment_array_covers(self):
+        segments = SegmentArray.from_segments("silence", [
+            AudioSegment(1.0, 2.0, "silence"), AudioSegment(3.0, 4.5, "silence")
+        ])
+
+        covered = segments.covers(np.array([0.5, 1.0, 1.5, 2.0, 2.5, 3.2, 4.6]))
+
+        assert covered.tolist() == [False, True, True, False, False, True, False]
+        assert not SegmentArray("silence").covers(np.array([1.0])).any()
@@ -0,0 +1,58 @@
+import pytest
+from src.extract_segments import parse_markdown_segments
+
+class TestParseMarkdownSegments:
+    @pytest.fixture
+    def write_table(self, tmp_path):
+        def _write(text):
+            md_file = tmp_path / "segments.md"
+            md_file.write_text(text)
+            return str(md_file)
+        return _write
+
+    def test_parses_rows(self, write_table):
+        md_file = write_table(
+            "# Segments\n"
+            "| From | To | Duration |\n"
+            "|------|----|----------|\n"
+            "| 00:10 | 00:20 | 10s |\n"
+            "| 01:02:03 | 01:02:33 | 30s |\n"
+        )
+        assert parse_markdown_segments(md_file) == [(10, 20), (3723, 3753)]
+
+    def test_leading_pipe_is_optional(self, write_table):
+        md_file = write_table(
+            "| From | To | Duration |\n"
+            "00:10 | 00:20 | 10s |\n"
+            "  | 00:30 | 00:45 | 15s |\n"
+        )
+        assert parse_markdown_segments(md_file) == [(10, 20), (30, 45)]
+
+    def test_rows_before_the_header_are_ignored(self, write_table):
+        md_file = write_table(
+            "| 00:01 | 00:02 | 1s |\n"
+            "| From | To | Duration |\n"
+            "| 00:10 | 00:20 | 10s |\n"
+        )
+        assert parse_markdown_segments(md_file) == [(10, 20)]
+
+    def test_reads_past_blank_lines_and_notes(self, write_table):
+        md_file = write_table(
+            "| From | To | Duration |\n"
+            "|------|----|----------|\n"
+            "| 00:10 | 00:20 | 10s |\n"
+            "\n"
+            "Note: the second act follows.\n"
+            "| From | To | Duration |\n"
+            "|------|----|----------|\n"
+            "| 00:30 | 00:45 | 15s |\n"
+        )
+        assert parse_markdown_segments(md_file) == [(10, 20), (30, 45)]
+
+    def test_invalid_rows_are_skipped(self, write_table):
+        md_file = write_table(
+            "| From | To | Duration |\n"
+            "| soon | later | ? |\n"
+            "| 00:10 | 00:20 | 10s |\n"
+        )
+        assert parse_markdown_segments(md_file) == [(10, 20)]
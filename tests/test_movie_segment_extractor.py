@@ -8,47 +8,63 @@ from src.movie_segment_extractor import MovieSegmentExtractor
 from src.detectors.base_detector import AudioSegment
 from src.config import Config
 
+# Default pipeline results: 1 second of silence at 16 kHz, and its detected segments
+_ZERO_16K = np.zeros(16000, dtype=np.int16)
+_ZERO_16K.flags.writeable = False
+_PROCESS_AUDIO_RESULT = {
+    "speech": [
+        {"start_time": 0.1, "end_time": 0.5, "label": "speech", "confidence": 0.8}
+    ],
+    "music": [
+        {"start_time": 0.6, "end_time": 0.9, "label": "music", "confidence": 0.7}
+    ],
+    "silence": [
+        {"start_time": 0.0, "end_time": 0.1, "label": "silence", "confidence": 0.9},
+        {"start_time": 0.5, "end_time": 0.6, "label": "silence", "confidence": 0.9},
+        {"start_time": 0.9, "end_time": 1.0, "label": "silence", "confidence": 0.9}
+    ],
+    "background": []
+}
+
 class TestMovieSegmentExtractor:
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def mock_audio_pipeline(self):
         with patch('src.audio_pipeline.AudioPipeline') as mock_pipeline_class:
             # Create a mock instance
             mock_pipeline = mock_pipeline_class.return_value
 
-            # Mock the extract_audio method
-            mock_pipeline.extract_audio.return_value = (
-                np.zeros(16000, dtype=np.int16),  # 1 second of silence
-                16000  # Sample rate
-            )
-
-            # Mock the process_audio method
-            mock_pipeline.process_audio.return_value = {
-                "speech": [
-                    {"start_time": 0.1, "end_time": 0.5, "label": "speech", "confidence": 0.8}
-                ],
-                "music": [
-                    {"start_time": 0.6, "end_time": 0.9, "label": "music", "confidence": 0.7}
-                ],
-                "silence": [
-                    {"start_time": 0.0, "end_time": 0.1, "label": "silence", "confidence": 0.9},
-                    {"start_time": 0.5, "end_time": 0.6, "label": "silence", "confidence": 0.9},
-                    {"start_time": 0.9, "end_time": 1.0, "label": "silence", "confidence": 0.9}
-                ],
-                "background": []
-            }
-
             # Mock the silence_detector
             mock_pipeline.silence_detector = MagicMock()
             mock_pipeline.silence_detector.merge_adjacent_segments.side_effect = lambda segments, gap_threshold: segments
 
             yield mock_pipeline
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def extractor(self, mock_audio_pipeline):
         with patch('src.movie_segment_extractor.AudioPipeline', return_value=mock_audio_pipeline):
             extractor = MovieSegmentExtractor()
             yield extractor
 
+    @pytest.fixture(scope="module")
+    def module_tmp(self, tmp_path_factory):
+        return tmp_path_factory.mktemp("movie_segments")
+
+    @pytest.fixture
+    def test_dir(self, module_tmp, request):
+        # One temp directory for the module, with a subdirectory per test
+        path = module_tmp / request.node.name
+        path.mkdir()
+        return path
+
+    @pytest.fixture(autouse=True)
+    def reset_pipeline(self, mock_audio_pipeline):
+        # The pipeline mock is shared by the module; each test starts with fresh
+        # call history and the default results
+        mock_audio_pipeline.extract_audio.reset_mock(return_value=True, side_effect=True)
+        mock_audio_pipeline.process_audio.reset_mock(return_value=True, side_effect=True)
+        mock_audio_pipeline.extract_audio.return_value = (_ZERO_16K, 16000)
+        mock_audio_pipeline.process_audio.return_value = _PROCESS_AUDIO_RESULT
+
     def test_init(self):
         """Test that the extractor initializes correctly."""
         with patch('src.movie_segment_extractor.AudioPipeline') as mock_pipeline_class:
@@ -74,7 +90,7 @@ class TestMovieSegmentExtractor:
         assert segments[0]["type"] == "speech"
         assert segments[1]["type"] == "music"
 
-    def test_extract_segments(self, extractor, tmp_path):
+    def test_extract_segments(self, extractor, test_dir):
         """Test that extract_segments correctly extracts segments to files."""
         with patch('extract_segments.extract_audio_segment') as mock_extract:
             # Set up the mock to return success
@@ -87,7 +103,7 @@ class TestMovieSegmentExtractor:
             ]
 
             # Call the method
-            output_dir = tmp_path / "segments"
+            output_dir = test_dir / "segments"
             extracted_files = extractor.extract_segments("test_audio.mp3", segments, str(output_dir))
 
             # Verify extract_audio_segment was called for each segment
@@ -97,7 +113,7 @@ class TestMovieSegmentExtractor:
             assert len(extracted_files) == 2
             assert all(str(output_dir) in file for file in extracted_files)
 
-    def test_prepare_for_voiceover(self, extractor, tmp_path):
+    def test_prepare_for_voiceover(self, extractor, test_dir):
         """Test that prepare_for_voiceover creates a script file."""
         # Create test segments
         segments = [
@@ -106,7 +122,7 @@ class TestMovieSegmentExtractor:
         ]
 
         # Call the method
-        output_path = tmp_path / "script.md"
+        output_path = test_dir / "script.md"
         extractor.prepare_for_voiceover(segments, str(output_path))
 
         # Verify the file was created
@@ -5,17 +5,26 @@ from src.detectors.silence_detector import SilenceDetector
 from src.config import Config
 from src.detectors.base_detector import AudioSegment
 
-class TestSilenceDetector:
-    @pytest.fixture
-    def detector(self):
-        return SilenceDetector()
+def _pattern_int16(*parts):
+    """int16 PCM of constant-amplitude parts, given as (duration_seconds, amplitude) pairs"""
+    lengths = [int(Config.SAMPLE_RATE * duration) for duration, _ in parts]
+    out = np.empty(sum(lengths), dtype=np.int16)
+    offset = 0
+    for length, (_, amplitude) in zip(lengths, parts):
+        out[offset:offset + length] = amplitude
+        offset += length
+    # detect() takes int16 arrays as they are, so no bytes copy is needed
+    return out
+
+DETECTOR_CLASS = SilenceDetector
 
+class TestSilenceDetector:
     def create_audio_data(self, amplitudes, sample_rate=None):
         """Helper to create test audio data"""
         if sample_rate is None:
             sample_rate = Config.SAMPLE_RATE
-        samples = np.repeat(amplitudes, sample_rate // len(amplitudes))
-        return samples.astype(np.int16).tobytes()
+        samples = np.repeat(np.asarray(amplitudes, dtype=np.int16), sample_rate // len(amplitudes))
+        return samples.tobytes()
 
     def test_calculate_db(self, detector):
         # Test silence (-inf dB)
@@ -26,6 +35,10 @@ class TestSilenceDetector:
         full_scale = torch.ones(1000, dtype=torch.float32)
         assert detector._calculate_db(full_scale) == pytest.approx(0.0, abs=0.1)
 
+        # Negative full scale is as loud as positive full scale
+        negative_full_scale = torch.ones(1000, dtype=torch.float32) * -1
+        assert detector._calculate_db(negative_full_scale) == pytest.approx(0.0, abs=0.1)
+
         # Test half scale (-6 dB)
         half_scale = torch.ones(1000, dtype=torch.float32) * 0.5
         assert detector._calculate_db(half_scale) == pytest.approx(-6.0, abs=0.1)
@@ -34,43 +47,71 @@ class TestSilenceDetector:
         tiny = torch.ones(1000, dtype=torch.float32) * 1e-10
         assert detector._calculate_db(tiny) == -100.0  # Should clip to minimum
 
+    def test_calculate_frame_db_matches_calculate_db(self, detector):
+        n = detector._frame_samples
+        rng = np.random.default_rng(0)
+        samples = np.concatenate([
+            np.zeros(n), rng.normal(0, 0.001, n), rng.normal(0, 0.3, n), np.full(n, 0.5), np.zeros(n // 2)
+        ]).astype(np.float32)
+
+        db_levels = detector._calculate_frame_db(samples)
+
+        assert len(db_levels) == 4  # trailing partial frame is ignored
+        for index, db in enumerate(db_levels):
+            frame = torch.from_numpy(samples[index * n:(index + 1) * n])
+            assert db == pytest.approx(detector._calculate_db(frame), abs=1e-4)
+
+    def test_calculate_frame_db_int16_matches_normalized(self, detector):
+        n = detector._frame_samples
+        rng = np.random.default_rng(0)
+        pcm = np.concatenate([
+            np.zeros(n), rng.normal(0, 30, n), rng.normal(0, 8000, n), np.full(n, -32768), np.zeros(n // 2)
+        ]).astype(np.int16)
+
+        db_levels = detector._calculate_frame_db(pcm)
+        expected = detector._calculate_frame_db(detector._bytes_to_array(pcm.tobytes()))
+
+        assert len(db_levels) == 4
+        np.testing.assert_allclose(db_levels, expected, atol=1e-4)
+
     def test_calculate_db_invalid_input(self, detector):
         # Test empty tensor
         with pytest.raises(ValueError):
             detector._calculate_db(torch.tensor([]))
 
-        # Test negative values
-        negative = torch.ones(1000, dtype=torch.float32) * -1
+        # Test values outside the normalized [-1, 1] range
+        too_loud = torch.ones(1000, dtype=torch.float32) * 1.5
         with pytest.raises(ValueError):
-            detector._calculate_db(negative)
+            detector._calculate_db(too_loud)
 
     def test_detect_continuous_silence(self, detector):
-        # Create 1 second of silence
-        audio_data = np.zeros(Config.SAMPLE_RATE, dtype=np.int16).tobytes()
+        # Create silence 1 second longer than the configured minimum duration
+        duration = detector.min_duration + 1.0
+        audio_data = np.zeros(int(Config.SAMPLE_RATE * duration), dtype=np.int16).tobytes()
         
         segments = detector.detect(audio_data)
         assert len(segments) == 1
         assert segments[0].label == "silence"
         assert segments[0].start_time == pytest.approx(0.0)
-        assert segments[0].end_time == pytest.approx(1.0)
+        assert segments[0].end_time == pytest.approx(duration)
         assert segments[0].confidence > 0.9  # Should be very confident about silence
 
     def test_detect_no_silence(self, detector):
         # Create 1 second of loud audio
         loud_signal = np.ones(Config.SAMPLE_RATE, dtype=np.int16) * 16384  # Half full-scale
-        segments = detector.detect(loud_signal.tobytes())
+        segments = detector.detect(loud_signal)
         assert len(segments) == 0
 
     def test_detect_alternating_silence(self, detector):
         # Create alternating pattern of 0.2s silence and 0.2s sound
-        pattern = np.concatenate([
-            np.zeros(int(Config.SAMPLE_RATE * 0.2)),  # silence
-            np.ones(int(Config.SAMPLE_RATE * 0.2)) * 16384,  # sound
-            np.zeros(int(Config.SAMPLE_RATE * 0.2)),  # silence
-            np.ones(int(Config.SAMPLE_RATE * 0.2)) * 16384,  # sound
-        ])
+        pattern = _pattern_int16(
+            (0.2, 0),  # silence
+            (0.2, 16384),  # sound
+            (0.2, 0),  # silence
+            (0.2, 16384),  # sound
+        )
         
-        segments = detector.detect(pattern.astype(np.int16).tobytes())
+        segments = detector.detect(pattern)
         
         # Should detect two silence segments if they meet minimum duration
         if Config.MIN_SILENCE_DURATION <= 0.2:
@@ -82,41 +123,42 @@ class TestSilenceDetector:
     def test_minimum_duration_filter(self, detector):
         # Create pattern with short silence (below minimum duration)
         short_silence_duration = Config.MIN_SILENCE_DURATION / 2
-        pattern = np.concatenate([
-            np.ones(int(Config.SAMPLE_RATE * 0.2)) * 16384,  # sound
-            np.zeros(int(Config.SAMPLE_RATE * short_silence_duration)),  # short silence
-            np.ones(int(Config.SAMPLE_RATE * 0.2)) * 16384,  # sound
-        ])
+        pattern = _pattern_int16(
+            (0.2, 16384),  # sound
+            (short_silence_duration, 0),  # short silence
+            (0.2, 16384),  # sound
+        )
         
-        segments = detector.detect(pattern.astype(np.int16).tobytes())
+        segments = detector.detect(pattern)
         assert len(segments) == 0  # Short silence should be filtered out
 
     def test_segment_merging(self, detector):
-        # Create pattern with two silence segments separated by short noise
-        pattern = np.concatenate([
-            np.zeros(int(Config.SAMPLE_RATE * 0.3)),  # silence
-            np.ones(int(Config.SAMPLE_RATE * 0.1)) * 16384,  # short sound
-            np.zeros(int(Config.SAMPLE_RATE * 0.3)),  # silence
-        ])
-        
-        segments = detector.detect(pattern.astype(np.int16).tobytes())
+        # Create pattern with two silence segments separated by short noise; each
+        # is long enough to be kept on its own
+        silence = detector.min_duration + 0.5
+        pattern = _pattern_int16(
+            (silence, 0),  # silence
+            (0.1, 16384),  # short sound
+            (silence, 0),  # silence
+        )
+        segments = detector.detect(pattern)
         
         # If gap is less than GAP_MERGE_THRESHOLD, segments should be merged
         if Config.GAP_MERGE_THRESHOLD >= 0.1:
             assert len(segments) == 1
-            assert segments[0].duration() == pytest.approx(0.7, abs=0.1)
+            assert segments[0].duration() == pytest.approx(2 * silence + 0.1, abs=0.1)
         else:
             assert len(segments) == 2
 
     def test_confidence_calculation(self, detector):
         # Create test data with varying amplitude levels
-        pattern = np.concatenate([
-            np.zeros(int(Config.SAMPLE_RATE * 0.3)),  # perfect silence
-            np.ones(int(Config.SAMPLE_RATE * 0.3)) * 100,  # very quiet
-            np.ones(int(Config.SAMPLE_RATE * 0.3)) * 1000  # moderate sound
-        ])
+        pattern = _pattern_int16(
+            (0.3, 0),  # perfect silence
+            (0.3, 100),  # very quiet
+            (0.3, 1000)  # moderate sound
+        )
         
-        segments = detector.detect(pattern.astype(np.int16).tobytes())
+        segments = detector.detect(pattern)
         
         # Perfect silence should have highest confidence
         silence_segments = [s for s in segments if s.start_time < 0.3]
@@ -129,7 +171,8 @@ class TestSilenceDetector:
             assert quiet_segments[0].confidence > 0.7
 
     def test_detector_disabled(self, detector):
-        audio_data = np.zeros(Config.SAMPLE_RATE, dtype=np.int16).tobytes()
+        duration = detector.min_duration + 1.0
+        audio_data = np.zeros(int(Config.SAMPLE_RATE * duration), dtype=np.int16).tobytes()
         
         # Test enabled (default)
         segments = detector.detect(audio_data)
@@ -141,8 +184,13 @@ class TestSilenceDetector:
         assert len(segments) == 0
 
     def test_invalid_audio_data(self, detector):
-        with pytest.raises(ValueError):
-            detector.detect(b"invalid audio data")
+        # Incomplete 16-bit sample
+        with pytest.raises(ValueError, match="incomplete PCM data"):
+            detector.detect(b"\x00\x01\x02")
+
+        # Samples that are neither int16 PCM nor floats
+        with pytest.raises(ValueError, match="Unsupported audio dtype"):
+            detector.detect(np.zeros(1000, dtype=np.int32))
 
     def test_sample_rate_validation(self, detector):
         # Create audio data with incorrect sample rate
@@ -2,27 +2,41 @@ import pytest
 import torch
 import numpy as np
 from unittest.mock import patch, Mock
-from src.detectors.speech_detector import SpeechDetector
+from src.detectors.speech_detector import SpeechDetector, load_silero_vad
 from src.detectors.base_detector import AudioSegment
 from src.config import Config
 
 class TestSpeechDetector:
-    @pytest.fixture
-    def mock_silero_model(self):
+    @pytest.fixture(autouse=True)
+    def clear_model_cache(self):
+        # The loaded model is cached per process; each test patches torch.hub.load itself
+        load_silero_vad.cache_clear()
+        yield
+        load_silero_vad.cache_clear()
+
+    @pytest.fixture(scope="module")
+    def hub_load(self):
         with patch('torch.hub.load') as mock_load:
-            model = Mock()
-            utils = [Mock()]  # get_speech_timestamps function
-            mock_load.return_value = (model, utils)
-            yield model, utils[0]
+            yield mock_load
+
+    @pytest.fixture(scope="module")
+    def mock_silero_model(self, hub_load):
+        model = Mock()
+        utils = [Mock()]  # get_speech_timestamps function
+        hub_load.return_value = (model, utils)
+        return model, utils[0]
 
-    @pytest.fixture
-    def detector(self, mock_silero_model):
+    @pytest.fixture(scope="module")
+    def shared_detector(self, mock_silero_model):
         return SpeechDetector()
 
-    def create_audio_data(self, duration_seconds=1.0):
-        """Helper to create test audio data"""
-        samples = np.zeros(int(Config.SAMPLE_RATE * duration_seconds), dtype=np.int16)
-        return samples.tobytes()
+    @pytest.fixture(autouse=True)
+    def reset_model_mocks(self, hub_load, mock_silero_model):
+        # The model mocks are shared by the whole module; give each test fresh call history
+        model, get_timestamps = mock_silero_model
+        hub_load.reset_mock()
+        model.reset_mock(return_value=True, side_effect=True)
+        get_timestamps.reset_mock(return_value=True, side_effect=True)
 
     def test_model_initialization(self, mock_silero_model):
         model, _ = mock_silero_model
@@ -36,16 +50,22 @@ class TestSpeechDetector:
             with pytest.raises(Exception, match="Failed to load model"):
                 SpeechDetector()
 
-    def test_detect_no_speech(self, detector, mock_silero_model):
+    def test_model_loaded_once(self, mock_silero_model):
+        model, _ = mock_silero_model
+        first, second = SpeechDetector(), SpeechDetector()
+        assert first.model is model and second.model is model
+        assert torch.hub.load.call_count == 1
+
+    def test_detect_no_speech(self, detector, mock_silero_model, silent_pcm):
         _, get_timestamps = mock_silero_model
         get_timestamps.return_value = []  # No speech detected
         
-        audio_data = self.create_audio_data()
+        audio_data = silent_pcm()
         segments = detector.detect(audio_data)
         
         assert len(segments) == 0
 
-    def test_detect_single_speech_segment(self, detector, mock_silero_model):
+    def test_detect_single_speech_segment(self, detector, mock_silero_model, silent_pcm):
         _, get_timestamps = mock_silero_model
         # Mock a single speech segment from 0.5s to 1.5s
         get_timestamps.return_value = [{
@@ -53,7 +73,7 @@ class TestSpeechDetector:
             'end': int(1.5 * Config.SAMPLE_RATE)
         }]
         
-        audio_data = self.create_audio_data(2.0)
+        audio_data = silent_pcm(2.0)
         segments = detector.detect(audio_data)
         
         assert len(segments) == 1
@@ -62,7 +82,7 @@ class TestSpeechDetector:
         assert segments[0].end_time == pytest.approx(1.5)
         assert segments[0].confidence > 0
 
-    def test_minimum_duration_filter(self, detector, mock_silero_model):
+    def test_minimum_duration_filter(self, detector, mock_silero_model, silent_pcm):
         _, get_timestamps = mock_silero_model
         # Create segment shorter than minimum duration
         short_duration = Config.MIN_SPEECH_DURATION / 2
@@ -71,12 +91,12 @@ class TestSpeechDetector:
             'end': int(short_duration * Config.SAMPLE_RATE)
         }]
         
-        audio_data = self.create_audio_data()
+        audio_data = silent_pcm()
         segments = detector.detect(audio_data)
         
         assert len(segments) == 0  # Should be filtered out
 
-    def test_merge_adjacent_segments(self, detector, mock_silero_model):
+    def test_merge_adjacent_segments(self, detector, mock_silero_model, silent_pcm):
         _, get_timestamps = mock_silero_model
         # Two segments with small gap
         get_timestamps.return_value = [
@@ -90,7 +110,7 @@ class TestSpeechDetector:
             }
         ]
         
-        audio_data = self.create_audio_data(1.5)
+        audio_data = silent_pcm(1.5)
         segments = detector.detect(audio_data)
         
         # Should merge if gap is less than GAP_MERGE_THRESHOLD
@@ -101,7 +121,7 @@ class TestSpeechDetector:
         else:
             assert len(segments) == 2
 
-    def test_confidence_calculation_min_duration(self, detector, mock_silero_model):
+    def test_confidence_calculation_min_duration(self, detector, mock_silero_model, silent_pcm):
         _, get_timestamps = mock_silero_model
         # Create segment with duration exactly matching MIN_SPEECH_DURATION
         duration = Config.MIN_SPEECH_DURATION
@@ -110,13 +130,13 @@ class TestSpeechDetector:
             'end': int(duration * Config.SAMPLE_RATE)
         }]
         
-        audio_data = self.create_audio_data(duration + 0.5)
+        audio_data = silent_pcm(duration + 0.5)
         segments = detector.detect(audio_data)
         
         assert len(segments) == 1
         assert segments[0].confidence == pytest.approx(1.0)
 
-    def test_confidence_calculation_long_duration(self, detector, mock_silero_model):
+    def test_confidence_calculation_long_duration(self, detector, mock_silero_model, silent_pcm):
         _, get_timestamps = mock_silero_model
         # Create segment with duration 2x MIN_SPEECH_DURATION
         duration = Config.MIN_SPEECH_DURATION * 2
@@ -125,7 +145,7 @@ class TestSpeechDetector:
             'end': int(duration * Config.SAMPLE_RATE)
         }]
         
-        audio_data = self.create_audio_data(duration + 0.5)
+        audio_data = silent_pcm(duration + 0.5)
         segments = detector.detect(audio_data)
         
         assert len(segments) == 1
@@ -138,9 +158,9 @@ class TestSpeechDetector:
         assert SpeechDetector.is_speech_segment(speech_segment) is True
         assert SpeechDetector.is_speech_segment(music_segment) is False
 
-    def test_model_call_parameters(self, detector, mock_silero_model):
+    def test_model_call_parameters(self, detector, mock_silero_model, silent_pcm):
         _, get_timestamps = mock_silero_model
-        audio_data = self.create_audio_data()
+        audio_data = silent_pcm()
         
         detector.detect(audio_data)
         
@@ -151,7 +171,55 @@ class TestSpeechDetector:
         assert kwargs['sampling_rate'] == Config.SAMPLE_RATE
         assert kwargs['threshold'] == Config.SPEECH_THRESHOLD
 
-    def test_detector_disabled(self, detector, mock_silero_model):
+    def test_long_audio_scored_in_batches(self, detector, mock_silero_model):
+        _, get_timestamps = mock_silero_model
+        window = 512 if Config.SAMPLE_RATE == 16000 else 256
+        # A stateless stand-in for the VAD model: mean absolute amplitude per window
+        detector.model = Mock(side_effect=lambda chunk, sr: chunk.abs().mean(dim=-1, keepdim=True))
+
+        replayed = []
+        def walk_windows(audio, model, **kwargs):
+            # Visit windows the way get_speech_timestamps does
+            model.reset_states()
+            for start in range(0, len(audio), window):
+                chunk = torch.nn.functional.pad(audio[start:start + window], (0, window))[:window]
+                replayed.append(model(chunk, kwargs['sampling_rate']).item())
+            return []
+        get_timestamps.side_effect = walk_windows
+
+        rng = np.random.default_rng(0)
+        n_samples = int(Config.SAMPLE_RATE * detector.batch_chunk_seconds * 2.2)
+        samples = rng.integers(-20000, 20000, n_samples).astype(np.int16)
+        detector.detect(samples.tobytes())
+
+        audio = detector._bytes_to_tensor(samples.tobytes())
+        expected = [
+            float(torch.nn.functional.pad(audio[start:start + window], (0, window))[:window].abs().mean())
+            for start in range(0, n_samples, window)
+        ]
+        assert replayed == pytest.approx(expected, rel=1e-5)
+        # Three chunks scored together: one model call per window position within a chunk
+        assert detector.model.call_count == int(detector.batch_chunk_seconds * Config.SAMPLE_RATE) // window
+
+    def test_vad_results_cached_by_content(self, detector, mock_silero_model, tmp_path, monkeypatch, silent_pcm):
+        _, get_timestamps = mock_silero_model
+        monkeypatch.setattr(Config, "SPEECH_VAD_CACHE_DIR", str(tmp_path))
+        get_timestamps.return_value = [{'start': 0, 'end': int(2.5 * Config.SAMPLE_RATE)}]
+        audio_data = silent_pcm(duration_seconds=3.0)
+
+        first = detector.detect(audio_data)
+        second = detector.detect(audio_data)
+
+        assert get_timestamps.call_count == 1
+        assert [seg.to_dict() for seg in second] == [seg.to_dict() for seg in first]
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+        # A different threshold is a different cache entry
+        detector.threshold = 0.9
+        detector.detect(audio_data)
+        assert get_timestamps.call_count == 2
+
+    def test_detector_disabled(self, detector, mock_silero_model, silent_pcm):
         _, get_timestamps = mock_silero_model
         get_timestamps.return_value = [{
             'start': int(0.5 * Config.SAMPLE_RATE),
@@ -159,12 +227,17 @@ class TestSpeechDetector:
         }]
         
         detector.enabled = False
-        audio_data = self.create_audio_data(2.0)
+        audio_data = silent_pcm(2.0)
         segments = detector.detect(audio_data)
         
         assert len(segments) == 0
         get_timestamps.assert_not_called()
 
     def test_invalid_audio_data(self, detector):
-        with pytest.raises(ValueError):
-            detector.detect(b"invalid audio data")
\ No newline at end of file
+        # Incomplete 16-bit sample
+        with pytest.raises(ValueError, match="incomplete PCM data"):
+            detector.detect(b"\x00\x01\x02")
+
+        # Samples that are neither int16 PCM nor floats
+        with pytest.raises(ValueError, match="Unsupported audio dtype"):
+            detector.detect(np.zeros(1000, dtype=np.int32))
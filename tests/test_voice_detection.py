@@ -0,0 +1,130 @@
+import pytest
+import wave
+import numpy as np
+from src.voice_detection import (
+    filter_by_duration,
+    generate_markdown_report,
+    group_and_filter_silence,
+    group_silence_frames,
+    read_wave,
+    seconds_to_mmss,
+    seconds_to_mmss_array,
+)
+
+FRAME = 0.03
+
+def vad_results(flags):
+    """Frame start times and speech flags for 30 ms frames"""
+    return np.arange(len(flags)) * FRAME, np.asarray(flags, dtype=bool)
+
+class TestGroupSilence:
+    def test_groups_runs_of_silent_frames(self):
+        segments = group_silence_frames(vad_results([0, 0, 1, 1, 0, 1, 0, 0, 0]))
+
+        # A run ends where the next speech frame starts, or one frame after the last frame
+        np.testing.assert_allclose(segments, [[0.0, 2 * FRAME], [4 * FRAME, 5 * FRAME], [6 * FRAME, 9 * FRAME]])
+
+    def test_all_silent(self):
+        segments = group_silence_frames(vad_results([0] * 5))
+        np.testing.assert_allclose(segments, [[0.0, 5 * FRAME]])
+
+    def test_no_silence(self):
+        segments = group_silence_frames(vad_results([1] * 5))
+        assert segments.shape == (0, 2)
+
+    def test_empty_input(self):
+        assert group_silence_frames(vad_results([])).shape == (0, 2)
+        assert group_and_filter_silence(vad_results([]), 1.0).shape == (0, 2)
+
+    def test_filter_drops_short_runs(self):
+        flags = [0, 0, 1, 0, 0, 0, 0, 1, 0]
+        segments = group_and_filter_silence(vad_results(flags), 3 * FRAME)
+        np.testing.assert_allclose(segments, [[3 * FRAME, 7 * FRAME]])
+
+    def test_filter_matches_group_then_filter(self):
+        rng = np.random.default_rng(0)
+        results = vad_results(rng.random(500) < 0.3)
+        for threshold in (0.0, 0.05, 0.1, 0.5):
+            np.testing.assert_array_equal(
+                group_and_filter_silence(results, threshold),
+                filter_by_duration(group_silence_frames(results), threshold)
+            )
+
+    def test_all_silent_shorter_than_threshold(self):
+        assert group_and_filter_silence(vad_results([0] * 5), 1.0).shape == (0, 2)
+
+class TestFilterByDuration:
+    def test_keeps_segments_at_least_threshold_long(self):
+        segments = filter_by_duration([(0.0, 1.0), (2.0, 2.5), (3.0, 5.0)], 1.0)
+        np.testing.assert_allclose(segments, [[0.0, 1.0], [3.0, 5.0]])
+
+    def test_empty_input(self):
+        assert filter_by_duration([], 1.0).shape == (0, 2)
+
+class TestSecondsToMmss:
+    @pytest.mark.parametrize("seconds, expected", [
+        (0, "00:00"), (59.9, "00:59"), (60, "01:00"), (754.2, "12:34"), (6000, "100:00"),
+    ])
+    def test_seconds_to_mmss(self, seconds, expected):
+        assert seconds_to_mmss(seconds) == expected
+
+    def test_array_matches_scalar(self):
+        seconds = np.array([[0.0, 59.9], [60.0, 754.2], [3599.5, 6000.0]])
+        formatted = seconds_to_mmss_array(seconds)
+
+        assert formatted.shape == seconds.shape
+        assert formatted.tolist() == [[seconds_to_mmss(s) for s in row] for row in seconds.tolist()]
+
+    def test_array_empty(self):
+        assert seconds_to_mmss_array(np.empty((0, 2))).shape == (0, 2)
+
+class TestGenerateMarkdownReport:
+    def test_writes_rows(self, tmp_path):
+        output_md = tmp_path / "report.md"
+        generate_markdown_report(np.array([[0.0, 2.5], [61.0, 125.25]]), str(output_md))
+
+        lines = output_md.read_text().splitlines()
+        assert lines[2] == "| From | To | Duration (s) |"
+        assert lines[4:] == ["| 00:00 | 00:02 | 2.50 |", "| 01:01 | 02:05 | 64.25 |"]
+
+    def test_no_segments(self, tmp_path):
+        output_md = tmp_path / "report.md"
+        generate_markdown_report([], str(output_md))
+
+        # Only the title and the table header
+        assert len(output_md.read_text().splitlines()) == 4
+
+class TestReadWave:
+    def write_wave(self, path, samples, sample_rate=16000, channels=1):
+        with wave.open(str(path), "wb") as wf:
+            wf.setnchannels(channels)
+            wf.setsampwidth(2)
+            wf.setframerate(sample_rate)
+            wf.writeframes(np.asarray(samples, dtype=np.int16).tobytes())
+
+    def test_maps_samples(self, tmp_path):
+        path = tmp_path / "audio.wav"
+        samples = np.arange(-500, 500, dtype=np.int16)
+        self.write_wave(path, samples, sample_rate=8000)
+
+        pcm, sample_rate = read_wave(str(path))
+
+        assert sample_rate == 8000
+        assert pcm.dtype == np.int16
+        np.testing.assert_array_equal(pcm, samples)
+        assert not pcm.flags.writeable
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.wav"
+        self.write_wave(path, [])
+
+        pcm, sample_rate = read_wave(str(path))
+        assert len(pcm) == 0
+        assert sample_rate == 16000
+
+    def test_rejects_stereo(self, tmp_path):
+        path = tmp_path / "stereo.wav"
+        self.write_wave(path, np.zeros(20), channels=2)
+
+        with pytest.raises(AssertionError, match="mono"):
+            read_wave(str(path))